@@ -13,42 +13,52 @@ String Authority Database Search API
 Flask REST API for searching guitar models and individual instruments.
 """
 
-from flask import Flask, jsonify
-from flask_cors import CORS
 import os
-import sys
-from pathlib import Path
 
-# Add parent directory to path to import from main project
-sys.path.append(str(Path(__file__).parent.parent))
+from flask import Flask, jsonify
+from flask_cors import CORS
 
 from api.routes.search_routes import search_bp
-from api.config import get_database_config
+from api.config import get_pagination_config, get_pool_config
+from api.database import get_db_manager
+from api.json_provider import OrjsonProvider
 
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
     
+    # Serialize JSON responses with orjson
+    app.json = OrjsonProvider(app)
+    
     # Enable CORS for all routes
     CORS(app)
     
     # Configuration
-    app.config['MAX_PAGE_SIZE'] = int(os.environ.get('MAX_PAGE_SIZE', 10))
-    app.config['DEFAULT_PAGE_SIZE'] = int(os.environ.get('DEFAULT_PAGE_SIZE', 10))
+    pagination_config = get_pagination_config()
+    app.config['MAX_PAGE_SIZE'] = pagination_config['max_page_size']
+    app.config['DEFAULT_PAGE_SIZE'] = pagination_config['default_page_size']
     
     # Register blueprints
     app.register_blueprint(search_bp, url_prefix='/api')
     
+    # Open the connection pool up front so the first requests find it ready
+    get_db_manager()
+    
     # Health check endpoint
+    health_check_interval = get_pool_config()['health_check_interval']
+    
     @app.route('/api/health')
     def health_check():
         """Health check endpoint."""
         try:
-            # Test database connection
-            db_config = get_database_config()
+            # Probes arrive far more often than the database needs checking, so
+            # a real round trip happens at most once per interval
+            db_manager = get_db_manager()
+            db_connected = db_manager.check_connection_cached(health_check_interval)
             return jsonify({
                 'status': 'healthy',
-                'database': 'connected' if db_config else 'error'
+                'database': 'connected' if db_connected else 'error',
+                'pool_size': db_manager.pool_size()
             })
         except Exception as e:
             return jsonify({
@@ -82,4 +92,4 @@ def create_app():
 
 if __name__ == '__main__':
     app = create_app()
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -4,13 +4,18 @@ Configuration management for the String Authority API.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
+@lru_cache(maxsize=1)
 def get_database_config() -> Optional[Dict[str, str]]:
     """
     Load database configuration from db_config.json or environment variables.
     
+    The result is cached for the life of the process; neither source is
+    expected to change at runtime.
+    
     Returns:
         Dict with database connection parameters or None if config not found
     """
@@ -35,6 +40,7 @@ def get_database_config() -> Optional[Dict[str, str]]:
     
     return None
 
+@lru_cache(maxsize=1)
 def get_pagination_config() -> Dict[str, int]:
     """
     Get pagination configuration from environment variables.
@@ -45,4 +51,32 @@ def get_pagination_config() -> Dict[str, int]:
     return {
         'max_page_size': int(os.environ.get('MAX_PAGE_SIZE', 10)),
         'default_page_size': int(os.environ.get('DEFAULT_PAGE_SIZE', 10))
-    }
\ No newline at end of file
+    }
+
+def get_pool_config() -> Dict[str, Any]:
+    """
+    Get database connection pool configuration from environment variables.
+    
+    Returns:
+        Dict with pool sizing, pre-warm, prepared statement and health check settings
+    """
+    return {
+        'min_connections': int(os.environ.get('DB_POOL_MIN', 1)),
+        'max_connections': int(os.environ.get('DB_POOL_MAX', 10)),
+        'prewarm': os.environ.get('DB_PREWARM', 'true').lower() in ('true', '1', 'yes'),
+        # Server-side prepared statements do not survive a transaction-pooling pgbouncer
+        'prepared_statements': os.environ.get('DB_PREPARED_STATEMENTS', 'true').lower() in ('true', '1', 'yes'),
+        'health_check_interval': float(os.environ.get('DB_HEALTH_CHECK_INTERVAL', 5))
+    }
+
+def get_search_cache_config() -> Dict[str, int]:
+    """
+    Get search result cache configuration from environment variables.
+    
+    Returns:
+        Dict with cache size and time-to-live settings
+    """
+    return {
+        'max_entries': int(os.environ.get('SEARCH_CACHE_SIZE', 1024)),
+        'ttl_seconds': int(os.environ.get('SEARCH_CACHE_TTL', 60))
+    }
@@ -2,22 +2,59 @@
 Database connection and query utilities for the String Authority Database Search API.
 """
 
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg import Connection
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import RowFactory, dict_row, tuple_row
+from psycopg_pool import ConnectionPool
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Any, Generator
+from typing import Dict, List, Optional, Any, Generator, Tuple
 import logging
+import threading
+import time
+import uuid
 
-from .config import get_database_config
+from .config import get_database_config, get_pool_config
 
 logger = logging.getLogger(__name__)
 
+# Pages larger than this are read through a server-side cursor
+SERVER_SIDE_CURSOR_THRESHOLD = 100
+
+# Executions of the same query text after which psycopg prepares it server-side
+PREPARE_THRESHOLD = 5
+
+# Session settings for pooled connections. The trigram threshold is the lowest
+# one the search services match with the pg_trgm % operator.
+SESSION_OPTIONS = '-c pg_trgm.similarity_threshold=0.25'
+
+def _split_page(records: List[tuple], names: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build result dicts from page tuples, splitting off the trailing
+    ``__``-prefixed bookkeeping columns.
+    
+    Args:
+        records: Fetched rows as tuples
+        names: Column names of the rows
+        
+    Returns:
+        Tuple of (rows without bookkeeping columns, bookkeeping columns of the
+        last row, empty when there are no rows)
+    """
+    public_count = next((idx for idx, name in enumerate(names) if name.startswith('__')), len(names))
+    public_names = names[:public_count]
+    
+    rows = [dict(zip(public_names, record)) for record in records]
+    bookkeeping = dict(zip(names[public_count:], records[-1][public_count:])) if records else {}
+    return rows, bookkeeping
+
 class DatabaseManager:
     """Manages database connections and provides query utilities."""
     
     def __init__(self):
-        self._pool: Optional[SimpleConnectionPool] = None
+        self._pool: Optional[ConnectionPool] = None
+        self._health_lock = threading.Lock()
+        self._last_health_check = 0.0
+        self._last_health_status = False
         self._initialize_pool()
     
     def _initialize_pool(self):
@@ -26,56 +63,151 @@ class DatabaseManager:
         if not config:
             raise ValueError("Database configuration not found")
         
+        # db_config.json is shared with the psycopg2-based CLI, which names the
+        # database "database"; libpq calls it dbname
+        conninfo_params = dict(config)
+        if 'database' in conninfo_params:
+            conninfo_params['dbname'] = conninfo_params.pop('database')
+        conninfo_params['options'] = SESSION_OPTIONS
+        
+        pool_config = get_pool_config()
+        max_connections = pool_config['max_connections']
+        # A pre-warmed pool keeps every slot open so the first burst of requests
+        # does not pay connection setup cost
+        min_connections = max_connections if pool_config['prewarm'] else pool_config['min_connections']
+        
         try:
-            self._pool = SimpleConnectionPool(
-                minconn=1,
-                maxconn=10,
-                **config
+            self._pool = ConnectionPool(
+                make_conninfo(**conninfo_params),
+                min_size=min_connections,
+                max_size=max_connections,
+                kwargs={'prepare_threshold': PREPARE_THRESHOLD if pool_config['prepared_statements'] else None},
+                open=False
             )
+            # Only block startup on connecting when pre-warming
+            self._pool.open(wait=pool_config['prewarm'])
             logger.info("Database connection pool initialized")
         except Exception as e:
             logger.error(f"Failed to initialize database pool: {e}")
             raise
     
     @contextmanager
-    def get_connection(self) -> Generator[psycopg2.extensions.connection, None, None]:
+    def get_connection(self) -> Generator[Connection, None, None]:
         """
         Context manager for getting a database connection from the pool.
         
+        The transaction is committed when the block exits normally and rolled
+        back if it raises.
+        
         Yields:
             Database connection
         """
         if not self._pool:
             raise RuntimeError("Database pool not initialized")
         
-        conn = None
         try:
-            conn = self._pool.getconn()
-            yield conn
+            with self._pool.connection() as conn:
+                yield conn
         except Exception as e:
-            if conn:
-                conn.rollback()
             logger.error(f"Database error: {e}")
             raise
-        finally:
-            if conn:
-                self._pool.putconn(conn)
     
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+    def execute_query(self, query: str, params: Optional[tuple] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results as a list of dictionaries.
         
         Args:
             query: SQL query string
             params: Query parameters
+            limit: Maximum number of rows to fetch, e.g. the page size
             
         Returns:
             List of query results as dictionaries
         """
+        rows, _ = self._fetch(query, params, limit, dict_row)
+        return rows
+    
+    def execute_page(self, query: str, params: Optional[tuple] = None,
+                     limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Execute a paginated SELECT and split its result columns from the
+        trailing ``__``-prefixed bookkeeping columns (sort keys, window count).
+        
+        Rows are built straight from the fetched tuples, so the query should
+        select values already in their API form.
+        
+        Args:
+            query: SQL query string whose bookkeeping columns come last
+            params: Query parameters
+            limit: Maximum number of rows to fetch, e.g. the page size
+            
+        Returns:
+            Tuple of (rows without bookkeeping columns, bookkeeping columns of
+            the last row, empty when there are no rows)
+        """
+        records, names = self._fetch(query, params, limit, tuple_row)
+        return _split_page(records, names)
+    
+    def execute_pages(self, statements: List[Tuple[str, Optional[tuple]]]) -> List[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Execute several paginated SELECTs in one pipelined round trip.
+        
+        Each query must bound its own rows with LIMIT; rows are split from the
+        bookkeeping columns as in execute_page.
+        
+        Args:
+            statements: List of (query, parameters) pairs
+            
+        Returns:
+            List of (rows, last row bookkeeping columns) tuples, in statement order
+        """
+        with self.get_connection() as conn:
+            cursors = []
+            try:
+                # Queries are sent back to back and their results read on sync
+                with conn.pipeline():
+                    for query, params in statements:
+                        cursor = conn.cursor()
+                        cursor.execute(query, params)
+                        cursors.append(cursor)
+                
+                return [_split_page(cursor.fetchall(), [column.name for column in cursor.description])
+                        for cursor in cursors]
+            finally:
+                for cursor in cursors:
+                    cursor.close()
+    
+    def _fetch(self, query: str, params: Optional[tuple], limit: Optional[int],
+               row_factory: RowFactory) -> Tuple[List[Any], List[str]]:
+        """
+        Execute a SELECT query and fetch up to ``limit`` rows.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            limit: Maximum number of rows to fetch, or None for all of them
+            row_factory: psycopg row factory for the fetched rows
+            
+        Returns:
+            Tuple of (rows, column names)
+        """
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            if limit is not None and limit > SERVER_SIDE_CURSOR_THRESHOLD:
+                # Read large pages through a named server-side cursor so they are
+                # not buffered in full on the client; the cursor is closed before
+                # the connection goes back to the pool
+                with conn.cursor(name=f'search_{uuid.uuid4().hex}', row_factory=row_factory) as cursor:
+                    cursor.itersize = limit
+                    cursor.execute(query, params)
+                    return cursor.fetchmany(limit), [column.name for column in cursor.description]
+            
+            # psycopg prepares the query server-side once its text has been seen
+            # PREPARE_THRESHOLD times on this connection
+            with conn.cursor(row_factory=row_factory) as cursor:
                 cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+                rows = cursor.fetchmany(limit) if limit is not None else cursor.fetchall()
+                return rows, [column.name for column in cursor.description]
     
     def execute_count_query(self, query: str, params: Optional[tuple] = None) -> int:
         """
@@ -94,16 +226,69 @@ class DatabaseManager:
                 result = cursor.fetchone()
                 return result[0] if result else 0
     
+    def check_connection(self) -> bool:
+        """
+        Check that the pool can serve a working connection.
+        
+        Returns:
+            True if a pooled connection answered SELECT 1
+        """
+        if not self._pool:
+            return False
+        
+        try:
+            with self.get_connection() as conn:
+                conn.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+    
+    def check_connection_cached(self, max_age: float) -> bool:
+        """
+        Check the pool, reusing the last result if it is recent enough.
+        
+        Args:
+            max_age: Seconds a previous check result stays valid
+            
+        Returns:
+            True if the most recent pooled connection check succeeded
+        """
+        with self._health_lock:
+            if time.monotonic() - self._last_health_check < max_age:
+                return self._last_health_status
+            
+            self._last_health_status = self.check_connection()
+            self._last_health_check = time.monotonic()
+            return self._last_health_status
+    
+    def pool_size(self) -> int:
+        """
+        Get the number of open pooled connections, idle or checked out.
+        
+        Returns:
+            Open connection count, or 0 if the pool is not initialized
+        """
+        if not self._pool:
+            return 0
+        return self._pool.get_stats()['pool_size']
+    
     def close_pool(self):
         """Close the connection pool."""
         if self._pool:
-            self._pool.closeall()
+            self._pool.close()
             self._pool = None
             logger.info("Database connection pool closed")
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Process-wide database manager, created on first use so importing this
+# module does not open connections
+_db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
 
 def get_db_manager() -> DatabaseManager:
-    """Get the global database manager instance."""
-    return db_manager
\ No newline at end of file
+    """Get the process-wide database manager instance, creating it if needed."""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
\ No newline at end of file
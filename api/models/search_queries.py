@@ -0,0 +1,152 @@
+"""
+Query parameter models for the String Authority Database Search API.
+
+The models are built once at import time, so each request only pays for
+pydantic's compiled validation.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, ValidationError, ValidationInfo, field_validator, model_validator
+from pydantic_core import PydanticCustomError
+
+from ..search.utils import decode_cursor
+
+MIN_YEAR = 1900
+MAX_YEAR = 2030
+
+# Pydantic error types raised for unparseable numeric input
+NUMERIC_ERROR_TYPES = {'int_parsing', 'int_from_float', 'int_type'}
+
+def bad_request(message: str, context: Optional[Dict[str, Any]] = None) -> PydanticCustomError:
+    """Build a validation error whose message is returned to the client as-is."""
+    return PydanticCustomError('bad_request', message, context)
+
+def validation_error_message(error: ValidationError) -> str:
+    """
+    Turn the first validation error into the API's error message.
+
+    Args:
+        error: Validation error raised by a query model
+
+    Returns:
+        Message for the 400 response body
+    """
+    first_error = error.errors()[0]
+    field = first_error['loc'][0] if first_error['loc'] else None
+
+    if first_error['type'] == 'missing':
+        return f"{field} parameter is required"
+    if first_error['type'] in NUMERIC_ERROR_TYPES:
+        return 'Invalid numeric parameter format'
+    if first_error['type'] == 'bool_parsing':
+        return f"{field} must be true or false"
+    return first_error['msg']
+
+class PaginatedQuery(BaseModel):
+    """Validators shared by the paginated search queries."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, protected_namespaces=())
+
+    @field_validator('page', check_fields=False)
+    @classmethod
+    def check_page(cls, value: int) -> int:
+        if value < 1:
+            raise bad_request('Page number must be >= 1')
+        return value
+
+    @field_validator('page_size', check_fields=False)
+    @classmethod
+    def check_page_size(cls, value: int, info: ValidationInfo) -> int:
+        max_page_size = info.context['max_page_size']
+        if value < 1 or value > max_page_size:
+            raise bad_request('Page size must be between 1 and {max_page_size}',
+                              {'max_page_size': max_page_size})
+        return value
+
+    @field_validator('cursor', mode='before', check_fields=False)
+    @classmethod
+    def parse_cursor(cls, value: Any) -> Optional[List[Any]]:
+        if value is None or isinstance(value, list):
+            return value
+        try:
+            return decode_cursor(value)
+        except ValueError:
+            raise bad_request('Invalid cursor')
+
+    @classmethod
+    def from_args(cls, args: Dict[str, str], default_page_size: int, max_page_size: int):
+        """
+        Validate request query arguments.
+
+        Args:
+            args: Request query arguments, or one search of a batch request body
+            default_page_size: Page size used when none is requested
+            max_page_size: Maximum allowed page size
+
+        Returns:
+            Validated query model
+
+        Raises:
+            ValidationError: If any parameter is missing or invalid
+        """
+        # Empty query arguments behave as if they were not given
+        params = {key: value for key, value in args.items() if value is not None and value != ''}
+        params.setdefault('page_size', default_page_size)
+        return cls.model_validate(params, context={'max_page_size': max_page_size})
+
+class ModelSearchQuery(PaginatedQuery):
+    """Query parameters for /api/search/models."""
+
+    model_name: str
+    manufacturer_name: Optional[str] = None
+    year: Optional[int] = None
+    page: int = 1
+    page_size: int
+    cursor: Optional[List[Any]] = None
+    include_totals: bool = False
+
+    @field_validator('model_name')
+    @classmethod
+    def check_model_name(cls, value: str) -> str:
+        if not value:
+            raise bad_request('model_name parameter is required')
+        return value
+
+    @field_validator('year')
+    @classmethod
+    def check_year(cls, value: Optional[int]) -> Optional[int]:
+        if value and (value < MIN_YEAR or value > MAX_YEAR):
+            raise bad_request(f'Year must be between {MIN_YEAR} and {MAX_YEAR}')
+        return value
+
+class InstrumentSearchQuery(PaginatedQuery):
+    """Query parameters for /api/search/instruments."""
+
+    serial_number: Optional[str] = None
+    unknown_serial: Optional[bool] = None
+    model_name: Optional[str] = None
+    manufacturer_name: Optional[str] = None
+    year_estimate: Optional[int] = None
+    page: int = 1
+    page_size: int
+    cursor: Optional[List[Any]] = None
+    include_totals: bool = False
+
+    @field_validator('year_estimate')
+    @classmethod
+    def check_year_estimate(cls, value: Optional[int]) -> Optional[int]:
+        if value and (value < MIN_YEAR or value > MAX_YEAR):
+            raise bad_request(f'Year estimate must be between {MIN_YEAR} and {MAX_YEAR}')
+        return value
+
+    @model_validator(mode='after')
+    def check_search_type(self) -> 'InstrumentSearchQuery':
+        # Either serial_number or unknown_serial must be provided
+        if not self.serial_number and not self.unknown_serial:
+            raise bad_request('Either serial_number or unknown_serial must be provided')
+
+        # Unknown serial searches need something to match on
+        if self.unknown_serial and not (self.model_name or self.manufacturer_name):
+            raise bad_request('For unknown_serial search, model_name or manufacturer_name must be provided')
+        return self
@@ -3,9 +3,11 @@ Search API routes for the String Authority Database.
 """
 
 from flask import Blueprint, request, jsonify, current_app
+from pydantic import ValidationError
 from typing import Dict, Any, Optional
 import logging
 
+from ..models.search_queries import ModelSearchQuery, InstrumentSearchQuery, validation_error_message
 from ..search.model_search import ModelSearchService
 from ..search.instrument_search import InstrumentSearchService
 
@@ -18,6 +20,26 @@ search_bp = Blueprint('search', __name__)
 model_search_service = ModelSearchService()
 instrument_search_service = InstrumentSearchService()
 
+# Most searches accepted by one batch request
+MAX_BATCH_SEARCHES = 20
+
+def _format_search_response(results_key: str, search_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a paginated search result according to the API specification."""
+    pagination = search_result['pagination']
+    response = {results_key: search_result['data']}
+    
+    # Cursor pages only carry totals when include_totals was requested
+    if pagination['total_records'] is not None:
+        response['total_records'] = pagination['total_records']
+    if pagination['current_page'] is not None:
+        response['current_page'] = pagination['current_page']
+    response['page_size'] = pagination['page_size']
+    if pagination['total_pages'] is not None:
+        response['total_pages'] = pagination['total_pages']
+    response['next_cursor'] = pagination['next_cursor']
+    
+    return response
+
 @search_bp.route('/search/models', methods=['GET'])
 def search_models():
     """
@@ -29,79 +51,138 @@ def search_models():
         year (int, optional): Year filter
         page (int, optional): Page number (default: 1)
         page_size (int, optional): Results per page (default: 10, max: configurable)
+        cursor (str, optional): next_cursor from a previous page; replaces page
+        include_totals (bool, optional): Count totals for cursor pages (default: false)
     
     Returns:
         JSON response with search results and pagination metadata
     """
+    # Read page size limits once instead of going through the app proxy per use
+    config = current_app.config
+    default_page_size = config['DEFAULT_PAGE_SIZE']
+    max_page_size = config['MAX_PAGE_SIZE']
+    
     try:
-        # Get and validate required parameters
-        model_name = request.args.get('model_name')
-        if not model_name or not model_name.strip():
+        # Parse and validate query parameters
+        try:
+            query = ModelSearchQuery.from_args(
+                request.args,
+                default_page_size=default_page_size,
+                max_page_size=max_page_size
+            )
+        except ValidationError as e:
             return jsonify({
                 'error': 'Bad Request',
-                'message': 'model_name parameter is required'
+                'message': validation_error_message(e)
             }), 400
         
-        # Get optional parameters
-        manufacturer_name = request.args.get('manufacturer_name')
-        year_str = request.args.get('year')
-        page_str = request.args.get('page', '1')
-        page_size_str = request.args.get('page_size', str(current_app.config['DEFAULT_PAGE_SIZE']))
+        # Perform search
+        search_result = model_search_service.search_models(
+            model_name=query.model_name,
+            manufacturer_name=query.manufacturer_name,
+            year=query.year,
+            page=query.page,
+            page_size=query.page_size,
+            max_page_size=max_page_size,
+            cursor=query.cursor,
+            include_totals=query.include_totals
+        )
         
-        # Parse and validate numeric parameters
-        try:
-            page = int(page_str) if page_str else 1
-            page_size = int(page_size_str) if page_size_str else current_app.config['DEFAULT_PAGE_SIZE']
-            year = int(year_str) if year_str else None
-        except ValueError:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Invalid numeric parameter format'
-            }), 400
+        # Format response according to specification
+        response = _format_search_response('models', search_result)
         
-        # Validate year range
-        if year and (year < 1900 or year > 2030):
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Year must be between 1900 and 2030'
-            }), 400
+        return jsonify(response)
         
-        # Validate page parameters
-        if page < 1:
+    except ValueError as e:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Error in search_models: {e}")
+        return jsonify({
+            'error': 'Internal Server Error',
+            'message': 'An error occurred while searching models'
+        }), 500
+
+@search_bp.route('/search/models/batch', methods=['POST'])
+def search_models_batch():
+    """
+    Run several model searches, e.g. typeahead requests, in one call.
+    
+    JSON Body:
+        searches (list, required): Objects with the query parameters of
+            /search/models, at most MAX_BATCH_SEARCHES of them
+    
+    Returns:
+        JSON response with one search response per search, in request order
+    """
+    config = current_app.config
+    default_page_size = config['DEFAULT_PAGE_SIZE']
+    max_page_size = config['MAX_PAGE_SIZE']
+    
+    try:
+        body = request.get_json(silent=True)
+        searches = body.get('searches') if isinstance(body, dict) else None
+        if not isinstance(searches, list) or not searches:
             return jsonify({
                 'error': 'Bad Request',
-                'message': 'Page number must be >= 1'
+                'message': 'searches must be a non-empty list'
             }), 400
-        
-        if page_size < 1 or page_size > current_app.config['MAX_PAGE_SIZE']:
+        if len(searches) > MAX_BATCH_SEARCHES:
             return jsonify({
                 'error': 'Bad Request',
-                'message': f'Page size must be between 1 and {current_app.config["MAX_PAGE_SIZE"]}'
+                'message': f'At most {MAX_BATCH_SEARCHES} searches are allowed per batch'
             }), 400
         
-        # Perform search
-        search_result = model_search_service.search_models(
-            model_name=model_name.strip(),
-            manufacturer_name=manufacturer_name.strip() if manufacturer_name else None,
-            year=year,
-            page=page,
-            page_size=page_size,
-            max_page_size=current_app.config['MAX_PAGE_SIZE']
-        )
+        # Parse and validate each search
+        queries = []
+        for idx, params in enumerate(searches):
+            try:
+                if not isinstance(params, dict):
+                    raise ValueError('search must be an object')
+                queries.append(ModelSearchQuery.from_args(
+                    params,
+                    default_page_size=default_page_size,
+                    max_page_size=max_page_size
+                ))
+            except ValidationError as e:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': f"searches[{idx}]: {validation_error_message(e)}"
+                }), 400
+            except ValueError as e:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': f"searches[{idx}]: {e}"
+                }), 400
         
-        # Format response according to specification
-        response = {
-            'models': search_result['data'],
-            'total_records': search_result['pagination']['total_records'],
-            'current_page': search_result['pagination']['current_page'],
-            'page_size': search_result['pagination']['page_size'],
-            'total_pages': search_result['pagination']['total_pages']
-        }
+        # Perform searches
+        search_results = model_search_service.search_models_batch([
+            {
+                'model_name': query.model_name,
+                'manufacturer_name': query.manufacturer_name,
+                'year': query.year,
+                'page': query.page,
+                'page_size': query.page_size,
+                'cursor': query.cursor,
+                'include_totals': query.include_totals
+            }
+            for query in queries
+        ], max_page_size=max_page_size)
         
-        return jsonify(response)
+        # Format responses according to specification
+        return jsonify({
+            'results': [_format_search_response('models', search_result) for search_result in search_results]
+        })
         
+    except ValueError as e:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': str(e)
+        }), 400
     except Exception as e:
-        logger.error(f"Error in search_models: {e}")
+        logger.error(f"Error in search_models_batch: {e}")
         return jsonify({
             'error': 'Internal Server Error',
             'message': 'An error occurred while searching models'
@@ -120,104 +201,57 @@ def search_instruments():
         year_estimate (int, optional): Year estimate for unknown serial search
         page (int, optional): Page number (default: 1)
         page_size (int, optional): Results per page (default: 10, max: configurable)
+        cursor (str, optional): next_cursor from a previous page; replaces page
+        include_totals (bool, optional): Count totals for cursor pages (default: false)
     
     Note: Either serial_number or unknown_serial must be provided
     
     Returns:
         JSON response with search results and pagination metadata
     """
+    # Read page size limits once instead of going through the app proxy per use
+    config = current_app.config
+    default_page_size = config['DEFAULT_PAGE_SIZE']
+    max_page_size = config['MAX_PAGE_SIZE']
+    
     try:
-        # Get parameters
-        serial_number = request.args.get('serial_number')
-        unknown_serial_str = request.args.get('unknown_serial')
-        model_name = request.args.get('model_name')
-        manufacturer_name = request.args.get('manufacturer_name')
-        year_estimate_str = request.args.get('year_estimate')
-        page_str = request.args.get('page', '1')
-        page_size_str = request.args.get('page_size', str(current_app.config['DEFAULT_PAGE_SIZE']))
-        
-        # Parse boolean parameter
-        unknown_serial = None
-        if unknown_serial_str:
-            unknown_serial_lower = unknown_serial_str.lower()
-            if unknown_serial_lower in ('true', '1', 'yes'):
-                unknown_serial = True
-            elif unknown_serial_lower in ('false', '0', 'no'):
-                unknown_serial = False
-            else:
-                return jsonify({
-                    'error': 'Bad Request',
-                    'message': 'unknown_serial must be true or false'
-                }), 400
-        
-        # Validate that either serial_number or unknown_serial is provided
-        if not serial_number and not unknown_serial:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Either serial_number or unknown_serial must be provided'
-            }), 400
-        
-        # Validate unknown_serial search parameters
-        if unknown_serial and not (model_name or manufacturer_name):
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'For unknown_serial search, model_name or manufacturer_name must be provided'
-            }), 400
-        
-        # Parse numeric parameters
+        # Parse and validate query parameters
         try:
-            page = int(page_str) if page_str else 1
-            page_size = int(page_size_str) if page_size_str else current_app.config['DEFAULT_PAGE_SIZE']
-            year_estimate = int(year_estimate_str) if year_estimate_str else None
-        except ValueError:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Invalid numeric parameter format'
-            }), 400
-        
-        # Validate year range
-        if year_estimate and (year_estimate < 1900 or year_estimate > 2030):
+            query = InstrumentSearchQuery.from_args(
+                request.args,
+                default_page_size=default_page_size,
+                max_page_size=max_page_size
+            )
+        except ValidationError as e:
             return jsonify({
                 'error': 'Bad Request',
-                'message': 'Year estimate must be between 1900 and 2030'
-            }), 400
-        
-        # Validate page parameters
-        if page < 1:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Page number must be >= 1'
-            }), 400
-        
-        if page_size < 1 or page_size > current_app.config['MAX_PAGE_SIZE']:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': f'Page size must be between 1 and {current_app.config["MAX_PAGE_SIZE"]}'
+                'message': validation_error_message(e)
             }), 400
         
         # Perform search
         search_result = instrument_search_service.search_instruments(
-            serial_number=serial_number.strip() if serial_number else None,
-            unknown_serial=unknown_serial,
-            model_name=model_name.strip() if model_name else None,
-            manufacturer_name=manufacturer_name.strip() if manufacturer_name else None,
-            year_estimate=year_estimate,
-            page=page,
-            page_size=page_size,
-            max_page_size=current_app.config['MAX_PAGE_SIZE']
+            serial_number=query.serial_number,
+            unknown_serial=query.unknown_serial,
+            model_name=query.model_name,
+            manufacturer_name=query.manufacturer_name,
+            year_estimate=query.year_estimate,
+            page=query.page,
+            page_size=query.page_size,
+            max_page_size=max_page_size,
+            cursor=query.cursor,
+            include_totals=query.include_totals
         )
         
         # Format response according to specification
-        response = {
-            'individual_guitars': search_result['data'],
-            'total_records': search_result['pagination']['total_records'],
-            'current_page': search_result['pagination']['current_page'],
-            'page_size': search_result['pagination']['page_size'],
-            'total_pages': search_result['pagination']['total_pages']
-        }
+        response = _format_search_response('individual_guitars', search_result)
         
         return jsonify(response)
         
+    except ValueError as e:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error in search_instruments: {e}")
         return jsonify({
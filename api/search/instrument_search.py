@@ -2,27 +2,67 @@
 Individual guitar/instrument search functionality for the String Authority Database Search API.
 """
 
+from decimal import Decimal
+from itertools import product
 from typing import Dict, List, Optional, Any, Tuple
+from uuid import UUID
 import logging
 
-from ..database import get_db_manager
+from ..config import get_search_cache_config
+from ..database import DatabaseManager, get_db_manager
 from .utils import (
+    SearchResultCache,
     extract_years_from_text, 
     normalize_search_term, 
     normalize_serial_number,
     split_search_terms,
-    build_multifield_search_clause,
-    paginate_results,
-    validate_pagination_params
+    compile_paginated_query,
+    paginated_query_params,
+    next_page_cursor,
+    paginate_results
 )
 
 logger = logging.getLogger(__name__)
 
+# Recent results, keyed on case-normalized parameters since matching ignores case
+_result_cache = SearchResultCache(**get_search_cache_config())
+
 class InstrumentSearchService:
     """Service for searching individual guitars/instruments."""
     
-    def __init__(self):
-        self.db = get_db_manager()
+    # Ascending keyset sort keys: match quality, highest value first (nulls last),
+    # serial number, id
+    SERIAL_SORT_KEYS = (
+        """CASE WHEN LOWER(ig.serial_number) = %s THEN 1 
+                WHEN LOWER(REPLACE(ig.serial_number, '-', '')) = %s THEN 2
+                ELSE 3 END""",
+        "ig.current_estimated_value IS NULL",
+        "COALESCE(-ig.current_estimated_value, 0)",
+        "ig.serial_number",
+        "ig.id"
+    )
+    SERIAL_SORT_KEY_TYPES = (int, bool, Decimal, str, UUID)
+    
+    # Ascending keyset sort keys: year match, highest value first (nulls last),
+    # unknown significance then historic guitars first (as significance_level =
+    # 'historic' DESC orders them), serial number (nulls last), id. Searches
+    # without a year estimate leave out the year match key.
+    MODEL_SORT_KEYS = (
+        "CASE WHEN m.year = %s OR ig.year_estimate = %s THEN 1 ELSE 2 END",
+        "ig.current_estimated_value IS NULL",
+        "COALESCE(-ig.current_estimated_value, 0)",
+        "ig.significance_level IS NOT NULL",
+        "ig.significance_level IS DISTINCT FROM 'historic'",
+        "ig.serial_number IS NULL",
+        "COALESCE(ig.serial_number, '')",
+        "ig.id"
+    )
+    MODEL_SORT_KEY_TYPES = (int, bool, Decimal, bool, bool, bool, str, UUID)
+    
+    @property
+    def db(self) -> DatabaseManager:
+        """Shared connection pool wrapper for this process."""
+        return get_db_manager()
     
     def search_instruments(self, serial_number: Optional[str] = None, 
                           unknown_serial: Optional[bool] = None,
@@ -30,7 +70,9 @@ class InstrumentSearchService:
                           manufacturer_name: Optional[str] = None,
                           year_estimate: Optional[int] = None,
                           page: int = 1, page_size: int = 10,
-                          max_page_size: int = 10) -> Dict[str, Any]:
+                          max_page_size: int = 10,
+                          cursor: Optional[List[Any]] = None,
+                          include_totals: bool = False) -> Dict[str, Any]:
         """
         Search for individual guitars/instruments.
         
@@ -40,179 +82,119 @@ class InstrumentSearchService:
             model_name: Model name for unknown serial search
             manufacturer_name: Manufacturer name for unknown serial search
             year_estimate: Year estimate for unknown serial search
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when a cursor is given
             page_size: Number of results per page
             max_page_size: Maximum allowed page size
+            cursor: Decoded keyset cursor from a previous page
+            include_totals: Whether to count total records in cursor mode
             
         Returns:
             Dict with search results and pagination metadata
         """
         try:
-            # Validate pagination parameters
-            page, page_size = validate_pagination_params(page, page_size, max_page_size)
+            # Normalize pagination parameters
+            page = page if page and page > 0 else 1
+            page_size = min(page_size, max_page_size) if page_size and page_size > 0 else max_page_size
             
             # Validate search parameters
-            if not self._validate_search_params(serial_number, unknown_serial, 
-                                              model_name, manufacturer_name):
+            if not (serial_number or (unknown_serial and (model_name or manufacturer_name))):
                 raise ValueError("Either serial_number or unknown_serial must be provided")
             
+            # Offset pages always report totals; keyset pages only on request
+            include_total = cursor is None or include_totals
+            
+            # Reuse a recent result for equivalent parameters; serial searches
+            # ignore the model fields
+            if serial_number:
+                search_key = ('serial', serial_number.lower())
+            else:
+                search_key = ('model', model_name.lower() if model_name else None,
+                              manufacturer_name.lower() if manufacturer_name else None,
+                              year_estimate)
+            cache_key = search_key + (page, page_size, tuple(cursor) if cursor is not None else None,
+                                      include_total)
+            cached_result = _result_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+            
             # Build the search query based on search type
             if serial_number:
-                query, count_query, main_params, count_params = self._build_serial_search_query(
-                    serial_number, page, page_size
+                query, count_query, main_params, count_params, sort_key_count = self._build_serial_search_query(
+                    serial_number, page, page_size, cursor, include_total
                 )
             else:
-                query, count_query, main_params, count_params = self._build_model_based_search_query(
-                    model_name, manufacturer_name, year_estimate, page, page_size
+                query, count_query, main_params, count_params, sort_key_count = self._build_model_based_search_query(
+                    model_name, manufacturer_name, year_estimate, page, page_size, cursor, include_total
                 )
             
-            # Get total count
-            total_records = self.db.execute_count_query(count_query, count_params)
+            # The query selects API-ready columns, so rows need no formatting
+            results, last_row_keys = self.db.execute_page(query, main_params, limit=page_size)
             
-            # Get results
-            results = self.db.execute_query(query, main_params)
+            if include_total:
+                # The window count is taken before the keyset filter, so it
+                # covers every match; it rides on the page rows, so an empty
+                # page past the end needs the standalone count query
+                total_records = last_row_keys.get('__total', 0)
+                if not results and (page > 1 or cursor is not None):
+                    total_records = self.db.execute_count_query(count_query, count_params)
+            else:
+                total_records = None
             
-            # Format results
-            formatted_results = [self._format_instrument_result(row) for row in results]
+            next_cursor = next_page_cursor(len(results), last_row_keys, page_size, sort_key_count)
             
             # Return paginated response
-            return paginate_results(formatted_results, page, page_size, total_records)
+            search_result = paginate_results(results, page if cursor is None else None,
+                                             page_size, total_records, next_cursor)
+            _result_cache.put(cache_key, search_result)
+            return search_result
             
         except Exception as e:
             logger.error(f"Error searching instruments: {e}")
             raise
     
-    def _validate_search_params(self, serial_number: Optional[str], 
-                               unknown_serial: Optional[bool],
-                               model_name: Optional[str], 
-                               manufacturer_name: Optional[str]) -> bool:
-        """Validate that required search parameters are provided."""
-        if serial_number:
-            return True
-        if unknown_serial and (model_name or manufacturer_name):
-            return True
-        return False
-    
     def _build_serial_search_query(self, serial_number: str, page: int, 
-                                  page_size: int) -> Tuple[str, str, List[Any], List[Any]]:
+                                  page_size: int,
+                                  cursor: Optional[List[Any]] = None,
+                                  include_total: bool = True) -> Tuple[str, str, tuple, tuple, int]:
         """
         Build SQL query for serial number-based search.
         
         Returns:
-            Tuple of (main query, count query, main parameters, count parameters)
-        """
-        base_select = """
-        SELECT
-            ig.id,
-            ig.serial_number,
-            ig.year_estimate,
-            ig.description,
-            ig.significance_level,
-            ig.significance_notes,
-            ig.current_estimated_value,
-            ig.condition_rating,
-            COALESCE(m.name, ig.model_name_fallback) as model_name,
-            COALESCE(mfr.name, ig.manufacturer_name_fallback) as manufacturer_name,
-            pl.name as product_line_name
-        FROM individual_guitars ig
-        LEFT JOIN models m ON ig.model_id = m.id
-        LEFT JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-        LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+            Tuple of (main query, count query, main parameters, count parameters,
+            sort key count)
         """
+        # Parameters are lowercased here so only the column side needs LOWER(),
+        # matching the expression indexes on serial_number
+        serial_lower = serial_number.lower()
+        normalized_serial = normalize_serial_number(serial_number).lower()
         
-        count_select = """
-        SELECT COUNT(ig.id)
-        FROM individual_guitars ig
-        LEFT JOIN models m ON ig.model_id = m.id
-        LEFT JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-        LEFT JOIN product_lines pl ON m.product_line_id = pl.id
-        """
-        
-        # Build WHERE clause for serial number search
-        where_clauses = []
-        where_params = []
-        
-        normalized_serial = normalize_serial_number(serial_number)
+        main_query, count_query = SERIAL_SEARCH_SQL[cursor is not None, include_total]
         
         # Use exact matching with normalization (remove dashes and leading zeros)
-        where_clauses.append("""
-        (LOWER(ig.serial_number) = LOWER(%s) 
-         OR LOWER(REPLACE(ig.serial_number, '-', '')) = LOWER(%s)
-         OR LOWER(TRIM(LEADING '0' FROM REPLACE(ig.serial_number, '-', ''))) = LOWER(%s))
-        """)
-        where_params.extend([serial_number, normalized_serial, normalized_serial])
+        count_params = (serial_lower, normalized_serial)
         
-        where_clause = "WHERE " + " AND ".join(where_clauses)
-        
-        # Build count query (no ORDER BY, no LIMIT/OFFSET)
-        count_query = f"{count_select} {where_clause}"
-        count_params = where_params.copy()
-        
-        # Order by relevance
-        order_clause = """
-        ORDER BY 
-            CASE WHEN LOWER(ig.serial_number) = LOWER(%s) THEN 1 
-                 WHEN LOWER(REPLACE(ig.serial_number, '-', '')) = LOWER(%s) THEN 2
-                 ELSE 3 END,
-            ig.current_estimated_value DESC NULLS LAST,
-            ig.serial_number
-        """
-        
-        # Build main query parameters (WHERE + ORDER BY + LIMIT/OFFSET)
-        main_params = where_params.copy()
-        main_params.extend([serial_number, normalized_serial])  # ORDER BY parameters
-        
-        # Add pagination parameters
-        offset = (page - 1) * page_size
-        main_params.extend([page_size, offset])
+        # Build main query parameters (ORDER BY keys + WHERE + cursor/LIMIT/OFFSET)
+        main_params = (count_params + count_params
+                       + paginated_query_params(self.SERIAL_SORT_KEY_TYPES, page, page_size, cursor))
         
-        # Build final main query
-        main_query = f"{base_select} {where_clause} {order_clause} LIMIT %s OFFSET %s"
-        
-        return main_query, count_query, main_params, count_params
+        return main_query, count_query, main_params, count_params, len(self.SERIAL_SORT_KEYS)
     
     def _build_model_based_search_query(self, model_name: Optional[str],
                                        manufacturer_name: Optional[str],
                                        year_estimate: Optional[int],
-                                       page: int, page_size: int) -> Tuple[str, str, List[Any], List[Any]]:
+                                       page: int, page_size: int,
+                                       cursor: Optional[List[Any]] = None,
+                                       include_total: bool = True) -> Tuple[str, str, tuple, tuple, int]:
         """
         Build SQL query for model-based search (unknown serial).
         
         Returns:
-            Tuple of (main query, count query, main parameters, count parameters)
-        """
-        base_select = """
-        SELECT
-            ig.id,
-            ig.serial_number,
-            ig.year_estimate,
-            ig.description,
-            ig.significance_level,
-            ig.significance_notes,
-            ig.current_estimated_value,
-            ig.condition_rating,
-            COALESCE(m.name, ig.model_name_fallback) as model_name,
-            COALESCE(mfr.name, ig.manufacturer_name_fallback) as manufacturer_name,
-            pl.name as product_line_name,
-            m.year as model_year
-        FROM individual_guitars ig
-        LEFT JOIN models m ON ig.model_id = m.id
-        LEFT JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-        LEFT JOIN product_lines pl ON m.product_line_id = pl.id
-        """
-        
-        count_select = """
-        SELECT COUNT(ig.id)
-        FROM individual_guitars ig
-        LEFT JOIN models m ON ig.model_id = m.id
-        LEFT JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-        LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+            Tuple of (main query, count query, main parameters, count parameters,
+            sort key count)
         """
-        
-        where_clauses = []
-        where_params = []
-        
         # Handle model name search
+        model_terms = []
+        model_params = ()
         if model_name:
             model_terms = split_search_terms(model_name)
             
@@ -226,87 +208,181 @@ class InstrumentSearchService:
             
             if model_terms:
                 # Search in both model tables and fallback fields
-                model_clause = """
-                (similarity(LOWER(m.name), LOWER(%s)) > 0.3
-                 OR similarity(LOWER(ig.model_name_fallback), LOWER(%s)) > 0.3
-                 OR similarity(LOWER(pl.name), LOWER(%s)) > 0.3
-                 OR LOWER(m.name) ILIKE LOWER(%s)
-                 OR LOWER(ig.model_name_fallback) ILIKE LOWER(%s)
-                 OR LOWER(pl.name) ILIKE LOWER(%s))
-                """
-                search_pattern = f"%{' '.join(model_terms)}%"
-                where_params.extend([model_name, model_name, model_name, 
-                                   search_pattern, search_pattern, search_pattern])
-                where_clauses.append(model_clause)
+                search_pattern = "%" + " ".join(model_terms) + "%"
+                model_params = (model_name,) * 6 + (search_pattern,) * 3
         
         # Handle manufacturer name search
+        mfr_terms = []
+        mfr_params = ()
         if manufacturer_name:
             mfr_terms = split_search_terms(manufacturer_name)
             if mfr_terms:
-                mfr_clause = """
-                (similarity(LOWER(mfr.name), LOWER(%s)) > 0.25
-                 OR similarity(LOWER(ig.manufacturer_name_fallback), LOWER(%s)) > 0.25
-                 OR LOWER(mfr.name) ILIKE LOWER(%s)
-                 OR LOWER(ig.manufacturer_name_fallback) ILIKE LOWER(%s))
-                """
-                search_pattern = f"%{' '.join(mfr_terms)}%"
-                where_params.extend([manufacturer_name, manufacturer_name, 
-                                   search_pattern, search_pattern])
-                where_clauses.append(mfr_clause)
+                search_pattern = "%" + " ".join(mfr_terms) + "%"
+                mfr_params = (manufacturer_name, manufacturer_name, search_pattern, search_pattern)
         
         # Handle year estimate
+        year_params = ()
         if year_estimate:
-            year_clause = """
-            (m.year = %s 
-             OR ig.year_estimate = %s 
-             OR ig.year_estimate ILIKE %s)
-            """
-            where_params.extend([year_estimate, str(year_estimate), f"%{year_estimate}%"])
-            where_clauses.append(year_clause)
+            year_text = str(year_estimate)
+            year_params = (year_estimate, year_text, "%" + year_text + "%")
         
-        where_clause = ""
-        if where_clauses:
-            where_clause = "WHERE " + " AND ".join(where_clauses)
+        # The SQL text only depends on which filters are present, so it is built once per shape
+        main_query, count_query = MODEL_BASED_SEARCH_SQL[
+            bool(model_terms), bool(mfr_terms), bool(year_estimate), cursor is not None,
+            include_total
+        ]
+        count_params = model_params + mfr_params + year_params
         
-        # Build count query (no ORDER BY, no LIMIT/OFFSET)
-        count_query = f"{count_select} {where_clause}"
-        count_params = where_params.copy()
+        # Build main query parameters (ORDER BY keys + WHERE + cursor/LIMIT/OFFSET);
+        # only year searches rank by year match
+        if year_estimate:
+            key_types = self.MODEL_SORT_KEY_TYPES
+            main_params = year_params[:2] + count_params
+        else:
+            key_types = self.MODEL_SORT_KEY_TYPES[1:]
+            main_params = count_params
+        main_params += paginated_query_params(key_types, page, page_size, cursor)
         
-        # Order by relevance and value
-        order_clause = """
-        ORDER BY 
-            CASE WHEN m.year = %s OR ig.year_estimate = %s THEN 1 ELSE 2 END,
-            ig.current_estimated_value DESC NULLS LAST,
-            ig.significance_level = 'historic' DESC,
-            ig.serial_number
+        return main_query, count_query, main_params, count_params, len(key_types)
+
+# SQL fragments shared by the instrument search shapes
+COLUMNS = """
+        ig.id::text AS id,
+        ig.serial_number,
+        ig.year_estimate,
+        ig.description,
+        ig.significance_level,
+        ig.significance_notes,
+        NULLIF(ig.current_estimated_value, 0)::text AS current_estimated_value,
+        ig.condition_rating,
+        COALESCE(m.name, ig.model_name_fallback) as model_name,
+        COALESCE(mfr.name, ig.manufacturer_name_fallback) as manufacturer_name,
+        pl.name as product_line_name
+    """
+
+FROM_CLAUSE = """
+    FROM individual_guitars ig
+    LEFT JOIN models m ON ig.model_id = m.id
+    LEFT JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
+    LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+    """
+
+# Use exact matching with normalization; serial_norm is the stored, indexed
+# serial without dashes or leading zeros
+SERIAL_MATCH_CLAUSE = """
+    (LOWER(ig.serial_number) = %s 
+     OR ig.serial_norm = %s)
+    """
+
+# Trigram matching is case-insensitive, so the bare columns are compared with
+# the % operator and ILIKE, both of which the gin_trgm_ops indexes serve. The
+# session threshold is the manufacturer one (0.25); model matches recheck the
+# stricter 0.3 with similarity().
+
+# Search in both model tables and fallback fields
+MODEL_MATCH_CLAUSE = """
+        ((m.name %% %s AND similarity(m.name, %s) > 0.3)
+         OR (ig.model_name_fallback %% %s AND similarity(ig.model_name_fallback, %s) > 0.3)
+         OR (pl.name %% %s AND similarity(pl.name, %s) > 0.3)
+         OR m.name ILIKE %s
+         OR ig.model_name_fallback ILIKE %s
+         OR pl.name ILIKE %s)
         """
-        year_for_order = year_estimate if year_estimate else 0
-        
-        # Build main query parameters (WHERE + ORDER BY + LIMIT/OFFSET)
-        main_params = where_params.copy()
-        main_params.extend([year_for_order, str(year_for_order)])  # ORDER BY parameters
-        
-        # Add pagination parameters
-        offset = (page - 1) * page_size
-        main_params.extend([page_size, offset])
+
+MANUFACTURER_MATCH_CLAUSE = """
+        (mfr.name %% %s
+         OR ig.manufacturer_name_fallback %% %s
+         OR mfr.name ILIKE %s
+         OR ig.manufacturer_name_fallback ILIKE %s)
+        """
+
+YEAR_MATCH_CLAUSE = """
+        (m.year = %s 
+         OR ig.year_estimate = %s 
+         OR ig.year_estimate ILIKE %s)
+        """
+
+def _compile_serial_search_sql(keyset: bool, include_total: bool) -> Tuple[str, str]:
+    """
+    Build the SQL text for a serial number search.
+    
+    Args:
+        keyset: Whether the page starts after a keyset cursor
+        include_total: Whether to select the windowed total row count
         
-        # Build final main query
-        main_query = f"{base_select} {where_clause} {order_clause} LIMIT %s OFFSET %s"
+    Returns:
+        Tuple of (main query, count query)
+    """
+    where_clause = "WHERE " + SERIAL_MATCH_CLAUSE
+    
+    # Build count query (no ORDER BY, no LIMIT/OFFSET)
+    # The WHERE clause only references individual_guitars, so the count skips
+    # the display-name joins
+    count_query = f"SELECT COUNT(*) FROM individual_guitars ig {where_clause}"
+    
+    # Order by relevance
+    main_query = compile_paginated_query(
+        COLUMNS, FROM_CLAUSE, where_clause, InstrumentSearchService.SERIAL_SORT_KEYS,
+        keyset, include_total
+    )
+    
+    return main_query, count_query
+
+def _compile_model_based_search_sql(has_model: bool, has_manufacturer: bool,
+                                    has_year: bool, keyset: bool,
+                                    include_total: bool) -> Tuple[str, str]:
+    """
+    Build the SQL text for a model-based (unknown serial) search.
+    
+    Args:
+        has_model: Whether the search matches on model name
+        has_manufacturer: Whether the search matches on manufacturer name
+        has_year: Whether the search filters on year estimate
+        keyset: Whether the page starts after a keyset cursor
+        include_total: Whether to select the windowed total row count
         
-        return main_query, count_query, main_params, count_params
+    Returns:
+        Tuple of (main query, count query)
+    """
+    where_clauses = []
+    if has_model:
+        where_clauses.append(MODEL_MATCH_CLAUSE)
+    if has_manufacturer:
+        where_clauses.append(MANUFACTURER_MATCH_CLAUSE)
+    if has_year:
+        where_clauses.append(YEAR_MATCH_CLAUSE)
+    
+    where_clause = ""
+    if where_clauses:
+        where_clause = "WHERE " + " AND ".join(where_clauses)
     
-    def _format_instrument_result(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        """Format an instrument search result according to the API specification."""
-        return {
-            'id': str(row['id']),
-            'serial_number': row['serial_number'],
-            'year_estimate': row['year_estimate'],
-            'description': row['description'],
-            'significance_level': row['significance_level'],
-            'significance_notes': row['significance_notes'],
-            'current_estimated_value': str(row['current_estimated_value']) if row['current_estimated_value'] else None,
-            'condition_rating': row['condition_rating'],
-            'model_name': row['model_name'],
-            'manufacturer_name': row['manufacturer_name'],
-            'product_line_name': row['product_line_name']
-        }
\ No newline at end of file
+    # Build count query (no ORDER BY, no LIMIT/OFFSET)
+    # The count only needs the joins its WHERE clause references; they are all
+    # LEFT JOINs on primary keys, so leaving the others out keeps the count
+    count_from_clause = "FROM individual_guitars ig"
+    if has_model or has_manufacturer or has_year:
+        count_from_clause += " LEFT JOIN models m ON ig.model_id = m.id"
+    if has_manufacturer:
+        count_from_clause += " LEFT JOIN manufacturers mfr ON m.manufacturer_id = mfr.id"
+    if has_model:
+        count_from_clause += " LEFT JOIN product_lines pl ON m.product_line_id = pl.id"
+    count_query = f"SELECT COUNT(*) {count_from_clause} {where_clause}"
+    
+    # Order by relevance and value; without a year estimate the year match
+    # rank is the same for every row, so that key is left out
+    sort_keys = InstrumentSearchService.MODEL_SORT_KEYS
+    if not has_year:
+        sort_keys = sort_keys[1:]
+    main_query = compile_paginated_query(
+        COLUMNS, FROM_CLAUSE, where_clause, sort_keys, keyset, include_total
+    )
+    
+    return main_query, count_query
+
+# Every search shape is specialized into its SQL text once, at import
+SERIAL_SEARCH_SQL = {
+    shape: _compile_serial_search_sql(*shape) for shape in product((False, True), repeat=2)
+}
+MODEL_BASED_SEARCH_SQL = {
+    shape: _compile_model_based_search_sql(*shape) for shape in product((False, True), repeat=5)
+}
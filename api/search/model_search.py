@@ -2,30 +2,74 @@
 Model search functionality for the String Authority Database Search API.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
+from uuid import UUID
 import logging
 
-from ..database import get_db_manager
+from ..config import get_search_cache_config
+from ..database import DatabaseManager, get_db_manager
 from .utils import (
+    SearchResultCache,
     extract_years_from_text, 
     normalize_search_term, 
     split_search_terms,
-    build_multifield_search_clause,
-    paginate_results,
-    validate_pagination_params
+    search_term_shape,
+    compile_multifield_search_clause,
+    multifield_search_params,
+    compile_paginated_query,
+    paginated_query_params,
+    next_page_cursor,
+    paginate_results
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields searched for each kind of search term
+MODEL_FIELDS = ('m.name', 'pl.name')
+MANUFACTURER_FIELDS = ('mfr.name',)
+
+# Base query structure
+COLUMNS = """
+        m.id::text AS id,
+        m.name as model_name,
+        m.year,
+        mfr.name as manufacturer_name,
+        pl.name as product_line_name,
+        m.description
+    """
+
+FROM_CLAUSE = """
+    FROM models m
+    JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
+    LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+    """
+
+# Recent results, keyed on case-normalized parameters since matching ignores case
+_result_cache = SearchResultCache(**get_search_cache_config())
+
 class ModelSearchService:
     """Service for searching guitar models with fuzzy matching."""
     
-    def __init__(self):
-        self.db = get_db_manager()
+    # Ascending keyset sort keys: exact name match first, newest year, name, id
+    SORT_KEYS = (
+        "CASE WHEN LOWER(m.name) = %s THEN 1 ELSE 2 END",
+        "-m.year",
+        "m.name",
+        "m.id"
+    )
+    # Types of the SORT_KEYS values, which keyset cursors are checked against
+    SORT_KEY_TYPES = (int, int, str, UUID)
+    
+    @property
+    def db(self) -> DatabaseManager:
+        """Shared connection pool wrapper for this process."""
+        return get_db_manager()
     
     def search_models(self, model_name: str, manufacturer_name: Optional[str] = None,
                      year: Optional[int] = None, page: int = 1, page_size: int = 10,
-                     max_page_size: int = 10) -> Dict[str, Any]:
+                     max_page_size: int = 10, cursor: Optional[List[Any]] = None,
+                     include_totals: bool = False) -> Dict[str, Any]:
         """
         Search for guitar models with fuzzy matching.
         
@@ -33,71 +77,142 @@ class ModelSearchService:
             model_name: Model name to search for (required)
             manufacturer_name: Optional manufacturer name filter
             year: Optional year filter
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when a cursor is given
             page_size: Number of results per page
             max_page_size: Maximum allowed page size
+            cursor: Decoded keyset cursor from a previous page
+            include_totals: Whether to count total records in cursor mode
             
         Returns:
             Dict with search results and pagination metadata
         """
         try:
-            # Validate pagination parameters
-            page, page_size = validate_pagination_params(page, page_size, max_page_size)
+            search = self._prepare_search(model_name, manufacturer_name, year, page, page_size,
+                                          max_page_size, cursor, include_totals)
+            if 'result' in search:
+                return search['result']
             
-            # Build the search query
-            query, count_query, main_params, count_params = self._build_search_query(
-                model_name, manufacturer_name, year, page, page_size
-            )
+            # The query selects API-ready columns, so rows need no formatting
+            results, last_row_keys = self.db.execute_page(search['query'], search['params'],
+                                                          limit=search['page_size'])
+            return self._complete_search(search, results, last_row_keys)
             
-            # Get total count
-            total_records = self.db.execute_count_query(count_query, count_params)
+        except Exception as e:
+            logger.error(f"Error searching models: {e}")
+            raise
+    
+    def search_models_batch(self, searches: List[Dict[str, Any]],
+                            max_page_size: int = 10) -> List[Dict[str, Any]]:
+        """
+        Run several model searches, e.g. typeahead requests, in one database
+        round trip.
+        
+        Args:
+            searches: Keyword arguments of search_models for each search,
+                without max_page_size
+            max_page_size: Maximum allowed page size
             
-            # Get results
-            results = self.db.execute_query(query, main_params)
+        Returns:
+            List of search results with pagination metadata, in request order
+        """
+        try:
+            prepared = [self._prepare_search(max_page_size=max_page_size, **params) for params in searches]
             
-            # Format results
-            formatted_results = [self._format_model_result(row) for row in results]
+            # Cached searches are answered directly; the rest share one pipeline
+            pending = [search for search in prepared if 'result' not in search]
+            pages = iter(self.db.execute_pages([(search['query'], search['params']) for search in pending]))
             
-            # Return paginated response
-            return paginate_results(formatted_results, page, page_size, total_records)
+            return [search['result'] if 'result' in search else self._complete_search(search, *next(pages))
+                    for search in prepared]
             
         except Exception as e:
-            logger.error(f"Error searching models: {e}")
+            logger.error(f"Error running batch model search: {e}")
             raise
     
-    def _build_search_query(self, model_name: str, manufacturer_name: Optional[str] = None,
-                           year: Optional[int] = None, page: int = 1, 
-                           page_size: int = 10) -> Tuple[str, str, List[Any]]:
+    def _prepare_search(self, model_name: str, manufacturer_name: Optional[str] = None,
+                        year: Optional[int] = None, page: int = 1, page_size: int = 10,
+                        max_page_size: int = 10, cursor: Optional[List[Any]] = None,
+                        include_totals: bool = False) -> Dict[str, Any]:
         """
-        Build the SQL query for model search.
+        Normalize the parameters of a model search and build its queries.
         
         Returns:
-            Tuple of (main query, count query, parameters)
+            Dict with the cached ``result`` if there is one, otherwise with the
+            page query, count query and the settings needed to complete the search
         """
-        # Base query structure
-        base_select = """
-        SELECT
-            m.id,
-            m.name as model_name,
-            m.year,
-            m.description,
-            mfr.name as manufacturer_name,
-            pl.name as product_line_name
-        FROM models m
-        JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-        LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+        # Normalize pagination parameters
+        page = page if page and page > 0 else 1
+        page_size = min(page_size, max_page_size) if page_size and page_size > 0 else max_page_size
+        
+        # Offset pages always report totals; keyset pages only on request
+        include_total = cursor is None or include_totals
+        
+        # Reuse a recent result for equivalent parameters
+        cache_key = (model_name.lower(), manufacturer_name.lower() if manufacturer_name else None,
+                     year, page, page_size, tuple(cursor) if cursor is not None else None,
+                     include_total)
+        cached_result = _result_cache.get(cache_key)
+        if cached_result is not None:
+            return {'result': cached_result}
+        
+        # Build the search query
+        query, count_query, main_params, count_params = self._build_search_query(
+            model_name, manufacturer_name, year, page, page_size, cursor, include_total
+        )
+        return {
+            'cache_key': cache_key,
+            'query': query,
+            'params': main_params,
+            'count_query': count_query,
+            'count_params': count_params,
+            'page': page if cursor is None else None,
+            'page_size': page_size,
+            'include_total': include_total
+        }
+    
+    def _complete_search(self, search: Dict[str, Any], results: List[Dict[str, Any]],
+                         last_row_keys: Dict[str, Any]) -> Dict[str, Any]:
         """
+        Turn a fetched page into the paginated search result and cache it.
         
-        count_select = """
-        SELECT COUNT(m.id)
-        FROM models m
-        JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-        LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+        Args:
+            search: Prepared search from _prepare_search
+            results: Rows of the page
+            last_row_keys: Bookkeeping columns of the last row
+            
+        Returns:
+            Dict with search results and pagination metadata
         """
+        page_size = search['page_size']
         
-        where_clauses = []
-        where_params = []
+        if search['include_total']:
+            # The window count is taken before the keyset filter, so it
+            # covers every match; it rides on the page rows, so an empty
+            # page past the end needs the standalone count query
+            total_records = last_row_keys.get('__total', 0)
+            if not results and search['page'] != 1:
+                total_records = self.db.execute_count_query(search['count_query'], search['count_params'])
+        else:
+            total_records = None
+        
+        next_cursor = next_page_cursor(len(results), last_row_keys, page_size, len(self.SORT_KEYS))
+        
+        # Return paginated response
+        search_result = paginate_results(results, search['page'], page_size, total_records, next_cursor)
+        _result_cache.put(search['cache_key'], search_result)
+        return search_result
+    
+    def _build_search_query(self, model_name: str, manufacturer_name: Optional[str] = None,
+                           year: Optional[int] = None, page: int = 1, 
+                           page_size: int = 10,
+                           cursor: Optional[List[Any]] = None,
+                           include_total: bool = True) -> Tuple[str, str, tuple, tuple]:
+        """
+        Build the SQL query for model search.
         
+        Returns:
+            Tuple of (main query, count query, main parameters, count parameters)
+        """
         # Process model name search
         model_search_terms = split_search_terms(model_name)
         
@@ -110,69 +225,69 @@ class ModelSearchService:
             model_search_terms = [term for term in model_search_terms 
                                 if not term.isdigit() or int(term) not in extracted_years]
         
-        if model_search_terms:
-            # Search across model name and product line name
-            search_fields = ['m.name', 'pl.name']
-            clause, search_params = build_multifield_search_clause(
-                model_search_terms, search_fields, similarity_threshold=0.3
-            )
-            if clause:
-                where_clauses.append(clause)
-                where_params.extend(search_params)
-        
-        # Add manufacturer filter
-        if manufacturer_name:
-            mfr_terms = split_search_terms(manufacturer_name)
-            if mfr_terms:
-                clause, search_params = build_multifield_search_clause(
-                    mfr_terms, ['mfr.name'], similarity_threshold=0.25
-                )
-                if clause:
-                    where_clauses.append(clause)
-                    where_params.extend(search_params)
-        
-        # Add year filter
-        if year:
-            where_clauses.append("m.year = %s")
-            where_params.append(year)
-        
-        # Combine WHERE clauses
-        where_clause = ""
-        if where_clauses:
-            where_clause = "WHERE " + " AND ".join(where_clauses)
-        
-        # Build count query (no ORDER BY, no LIMIT/OFFSET)
-        count_query = f"{count_select} {where_clause}"
-        count_params = where_params.copy()
-        
-        # Add ordering - prioritize exact matches and more recent models
-        order_clause = """
-        ORDER BY 
-            CASE WHEN LOWER(m.name) = LOWER(%s) THEN 1 ELSE 2 END,
-            m.year DESC,
-            m.name
-        """
+        # Search across model name and product line name, then the manufacturer
+        mfr_terms = split_search_terms(manufacturer_name) if manufacturer_name else ()
+        # Add year filter; the WHERE parameters are final once frozen into a tuple
+        count_params = (
+            *multifield_search_params(model_search_terms, len(MODEL_FIELDS), similarity_threshold=0.3),
+            *multifield_search_params(mfr_terms, len(MANUFACTURER_FIELDS), similarity_threshold=0.25),
+            *((year,) if year else ())
+        )
         
-        # Build main query parameters (WHERE + ORDER BY + LIMIT/OFFSET)
-        main_params = where_params.copy()
-        main_params.append(model_name)  # ORDER BY parameter
+        # The SQL text only depends on the shape of the search, so it is built once per shape
+        query, count_query = _compile_search_sql(
+            search_term_shape(model_search_terms), search_term_shape(mfr_terms),
+            bool(year), cursor is not None, include_total
+        )
         
-        # Add pagination parameters
-        offset = (page - 1) * page_size
-        main_params.extend([page_size, offset])
+        # Build main query parameters (ORDER BY keys + WHERE + cursor/LIMIT/OFFSET)
+        # The exact-match sort key compares against a parameter lowercased here
+        main_params = ((model_name.lower(),) + count_params
+                       + paginated_query_params(self.SORT_KEY_TYPES, page, page_size, cursor))
         
-        # Build final main query
-        main_query = f"{base_select} {where_clause} {order_clause} LIMIT %s OFFSET %s"
+        return query, count_query, main_params, count_params
+
+@lru_cache(maxsize=256)
+def _compile_search_sql(model_term_shape: Tuple[bool, ...], mfr_term_shape: Tuple[bool, ...],
+                        has_year: bool, keyset: bool, include_total: bool) -> Tuple[str, str]:
+    """
+    Build the SQL text for a model search of the given shape.
+    
+    Args:
+        model_term_shape: search_term_shape of the model name terms
+        mfr_term_shape: search_term_shape of the manufacturer name terms
+        has_year: Whether the search filters on year
+        keyset: Whether the page starts after a keyset cursor
+        include_total: Whether to select the windowed total row count
         
-        return main_query, count_query, main_params, count_params
+    Returns:
+        Tuple of (main query, count query)
+    """
+    where_clauses = []
+    if model_term_shape:
+        where_clauses.append(compile_multifield_search_clause(model_term_shape, MODEL_FIELDS))
+    if mfr_term_shape:
+        where_clauses.append(compile_multifield_search_clause(mfr_term_shape, MANUFACTURER_FIELDS))
+    if has_year:
+        where_clauses.append("m.year = %s")
     
-    def _format_model_result(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        """Format a model search result according to the API specification."""
-        return {
-            'id': str(row['id']),
-            'model_name': row['model_name'],
-            'year': row['year'],
-            'manufacturer_name': row['manufacturer_name'],
-            'product_line_name': row['product_line_name'],
-            'description': row['description']
-        }
\ No newline at end of file
+    # Combine WHERE clauses
+    where_clause = ""
+    if where_clauses:
+        where_clause = "WHERE " + " AND ".join(where_clauses)
+    
+    # Build count query (no ORDER BY, no LIMIT/OFFSET)
+    # The count keeps the manufacturer join, which drops models without one,
+    # but only joins product lines when the model terms search them
+    count_from_clause = "FROM models m JOIN manufacturers mfr ON m.manufacturer_id = mfr.id"
+    if model_term_shape:
+        count_from_clause += " LEFT JOIN product_lines pl ON m.product_line_id = pl.id"
+    count_query = f"SELECT COUNT(*) {count_from_clause} {where_clause}"
+    
+    # Order by relevance - prioritize exact matches and more recent models
+    query = compile_paginated_query(
+        COLUMNS, FROM_CLAUSE, where_clause, ModelSearchService.SORT_KEYS,
+        keyset, include_total
+    )
+    
+    return query, count_query
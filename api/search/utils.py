@@ -3,11 +3,26 @@ Search utilities for fuzzy matching and text processing.
 """
 
 import re
-from typing import List, Tuple, Optional, Dict, Any
+import json
+import base64
+import binascii
+import threading
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, Any, Hashable, Sequence
 from difflib import SequenceMatcher
 import math
+from decimal import Decimal
 
-def extract_years_from_text(text: str) -> List[int]:
+from cachetools import TTLCache
+
+# 4-digit numbers that could be years
+YEAR_PATTERN = re.compile(r'\b(19[0-9]{2}|20[0-2][0-9]|2030)\b')
+
+# Search strings repeat across pages and popular queries, so the pure text
+# helpers below are memoized and return immutable results
+
+@lru_cache(maxsize=4096)
+def extract_years_from_text(text: str) -> Tuple[int, ...]:
     """
     Extract potential years from a text string.
     
@@ -15,16 +30,14 @@ def extract_years_from_text(text: str) -> List[int]:
         text: Input text to search for years
         
     Returns:
-        List of years found in the text (1900-2030 range)
+        Tuple of years found in the text (1900-2030 range)
     """
     if not text:
-        return []
+        return ()
     
-    # Look for 4-digit numbers that could be years
-    year_pattern = r'\b(19[0-9]{2}|20[0-2][0-9]|2030)\b'
-    matches = re.findall(year_pattern, text)
-    return [int(year) for year in matches]
+    return tuple(int(year) for year in YEAR_PATTERN.findall(text))
 
+@lru_cache(maxsize=4096)
 def normalize_serial_number(serial_number: str) -> str:
     """
     Normalize a serial number for exact matching by removing dashes and leading zeros.
@@ -71,7 +84,8 @@ def normalize_search_term(term: str) -> str:
     
     return normalized
 
-def split_search_terms(term: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def split_search_terms(term: str) -> Tuple[str, ...]:
     """
     Split a search term into individual words for matching.
     
@@ -79,10 +93,10 @@ def split_search_terms(term: str) -> List[str]:
         term: Input search term
         
     Returns:
-        List of individual words
+        Tuple of individual words
     """
     normalized = normalize_search_term(term)
-    return [word for word in normalized.split() if len(word) > 0]
+    return tuple(word for word in normalized.split() if len(word) > 0)
 
 def calculate_similarity_score(text1: str, text2: str) -> float:
     """
@@ -130,17 +144,78 @@ def build_fuzzy_where_clause(search_terms: List[str], column_name: str,
     for term in search_terms:
         if len(term) >= 3:  # Trigram matching works best with 3+ characters
             # Use PostgreSQL trigram similarity
-            clauses.append(f"similarity(LOWER({column_name}), LOWER(%s)) > %s")
+            clauses.append(f"similarity({column_name}, %s) > %s")
             params.extend([term, similarity_threshold])
         else:
             # For short terms, use ILIKE pattern matching
-            clauses.append(f"LOWER({column_name}) ILIKE LOWER(%s)")
+            clauses.append(f"{column_name} ILIKE %s")
             params.append(f"%{term}%")
     
     if clauses:
         return f"({' OR '.join(clauses)})", params
     return "", []
 
+def search_term_shape(search_terms: Sequence[str]) -> Tuple[bool, ...]:
+    """
+    Describe how each search term is matched, which is all that determines
+    the SQL text of a fuzzy search clause.
+    
+    Args:
+        search_terms: List of search terms
+        
+    Returns:
+        Tuple with True for terms matched by trigram similarity, False for ILIKE
+    """
+    return tuple(len(term) >= 3 for term in search_terms)
+
+@lru_cache(maxsize=256)
+def compile_multifield_search_clause(term_shape: Tuple[bool, ...], fields: Tuple[str, ...]) -> str:
+    """
+    Build the SQL text of a multi-field fuzzy search clause.
+    
+    Args:
+        term_shape: Result of search_term_shape for the search terms
+        fields: Field names to search
+        
+    Returns:
+        WHERE clause, or an empty string if there is nothing to match
+    """
+    if not term_shape or not fields:
+        return ""
+    
+    # Trigram similarity and ILIKE both ignore case, so neither side needs LOWER()
+    field_clauses = []
+    for field in fields:
+        clauses = [
+            f"similarity({field}, %s) > %s" if is_trigram
+            else f"{field} ILIKE %s"
+            for is_trigram in term_shape
+        ]
+        field_clauses.append(f"({' OR '.join(clauses)})")
+    
+    return f"({' OR '.join(field_clauses)})"
+
+def multifield_search_params(search_terms: Sequence[str], field_count: int,
+                             similarity_threshold: float = 0.3) -> List[Any]:
+    """
+    Build the parameters for a clause from compile_multifield_search_clause.
+    
+    Args:
+        search_terms: List of search terms
+        field_count: Number of fields searched
+        similarity_threshold: Minimum similarity threshold
+        
+    Returns:
+        List of query parameters
+    """
+    term_params = []
+    for term in search_terms:
+        if len(term) >= 3:
+            term_params.extend([term, similarity_threshold])
+        else:
+            term_params.append(f"%{term}%")
+    return term_params * field_count
+
 def build_multifield_search_clause(search_terms: List[str], fields: List[str], 
                                  similarity_threshold: float = 0.3) -> Tuple[str, List[str]]:
     """
@@ -157,34 +232,28 @@ def build_multifield_search_clause(search_terms: List[str], fields: List[str],
     if not search_terms or not fields:
         return "", []
     
-    field_clauses = []
-    all_params = []
-    
-    for field in fields:
-        clause, params = build_fuzzy_where_clause(search_terms, field, similarity_threshold)
-        if clause:
-            field_clauses.append(clause)
-            all_params.extend(params)
-    
-    if field_clauses:
-        return f"({' OR '.join(field_clauses)})", all_params
-    return "", []
+    clause = compile_multifield_search_clause(search_term_shape(search_terms), tuple(fields))
+    return clause, multifield_search_params(search_terms, len(fields), similarity_threshold)
 
-def paginate_results(results: List[Dict[str, Any]], page: int, page_size: int, 
-                    total_records: int) -> Dict[str, Any]:
+def paginate_results(results: List[Dict[str, Any]], page: Optional[int], page_size: int, 
+                    total_records: Optional[int], next_cursor: Optional[str] = None) -> Dict[str, Any]:
     """
     Apply pagination to results and create pagination metadata.
     
     Args:
         results: List of result records
-        page: Current page number (1-based)
+        page: Current page number (1-based), or None for cursor pagination
         page_size: Number of records per page
-        total_records: Total number of matching records
+        total_records: Total number of matching records, or None if not counted
+        next_cursor: Keyset cursor for the following page, if any
         
     Returns:
         Dict with paginated results and metadata
     """
-    total_pages = math.ceil(total_records / page_size) if total_records > 0 else 0
+    if total_records is None:
+        total_pages = None
+    else:
+        total_pages = math.ceil(total_records / page_size) if total_records > 0 else 0
     
     return {
         'data': results,
@@ -192,10 +261,189 @@ def paginate_results(results: List[Dict[str, Any]], page: int, page_size: int,
             'current_page': page,
             'page_size': page_size,
             'total_pages': total_pages,
-            'total_records': total_records
+            'total_records': total_records,
+            'next_cursor': next_cursor
         }
     }
 
+def encode_cursor(sort_values: List[Any]) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque keyset cursor.
+    
+    Args:
+        sort_values: Sort key values of the last returned row
+        
+    Returns:
+        URL-safe base64 cursor string
+    """
+    payload = json.dumps(sort_values, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a keyset cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous response
+        
+    Returns:
+        List of sort key values
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, binascii.Error) as e:
+        raise ValueError("Invalid cursor") from e
+    
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return values
+
+@lru_cache(maxsize=256)
+def compile_paginated_query(columns: str, from_clause: str, where_clause: str,
+                            sort_keys: Sequence[str], keyset: bool,
+                            include_total: bool = True) -> str:
+    """
+    Build the SQL text of a page query ordered by ascending sort keys,
+    paginated either by OFFSET or by a keyset cursor.
+    
+    Each sort key is exposed as a ``__k<n>`` column so the last row of a page
+    can be turned into a cursor. Sort keys must be non-null and ascending;
+    express DESC / NULLS LAST orderings by negating or adding ``IS NULL`` keys.
+    
+    Args:
+        columns: SELECT list of the inner query
+        from_clause: FROM/JOIN clause of the inner query
+        where_clause: WHERE clause of the inner query (may be empty)
+        sort_keys: Ascending, non-null sort key expressions, ending in a unique column
+        keyset: Whether the page starts after a keyset cursor instead of an OFFSET
+        include_total: Whether to select ``COUNT(*) OVER () AS __total``
+        
+    Returns:
+        Query whose trailing parameters come from paginated_query_params
+    """
+    key_columns = ", ".join(f"{key} AS __k{idx}" for idx, key in enumerate(sort_keys))
+    key_names = ", ".join(f"__k{idx}" for idx in range(len(sort_keys)))
+    total_column = ", COUNT(*) OVER () AS __total" if include_total else ""
+    
+    inner_query = f"SELECT {columns}, {key_columns}{total_column} {from_clause} {where_clause}"
+    
+    keyset_clause = ""
+    if keyset:
+        placeholders = ", ".join(["%s"] * len(sort_keys))
+        keyset_clause = f"WHERE ({key_names}) > ({placeholders})"
+    
+    query = f"SELECT * FROM ({inner_query}) AS page_rows {keyset_clause} ORDER BY {key_names} LIMIT %s"
+    if not keyset:
+        query += " OFFSET %s"
+    
+    return query
+
+def cursor_value(key_type: type, value: Any) -> Any:
+    """
+    Check a decoded cursor value against the type of its sort key.
+    
+    Args:
+        key_type: Type of the sort key: bool, int, str, Decimal or UUID
+        value: Value from the cursor; Decimal and UUID keys are encoded as strings
+        
+    Returns:
+        The value as a key_type instance
+        
+    Raises:
+        ValueError: If the value does not fit the sort key
+    """
+    if key_type in (bool, int, str):
+        # JSON booleans are not integers here
+        if type(value) is not key_type:
+            raise ValueError("Invalid cursor")
+        return value
+    
+    if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+    try:
+        parsed = key_type(value)
+    except (ValueError, ArithmeticError) as e:
+        raise ValueError("Invalid cursor") from e
+    if key_type is Decimal and not parsed.is_finite():
+        raise ValueError("Invalid cursor")
+    return parsed
+
+def paginated_query_params(key_types: Sequence[type], page: int, page_size: int,
+                           cursor: Optional[List[Any]] = None) -> Tuple[Any, ...]:
+    """
+    Build the trailing parameters of a query from compile_paginated_query.
+    
+    Args:
+        key_types: Type of each sort key of the query, see cursor_value
+        page: Page number (1-based), ignored when a cursor is given
+        page_size: Number of results per page
+        cursor: Sort key values of the last row of the previous page
+        
+    Returns:
+        Tuple of cursor and LIMIT/OFFSET parameters
+        
+    Raises:
+        ValueError: If the cursor does not match the sort keys
+    """
+    if cursor is None:
+        return (page_size, (page - 1) * page_size)
+    
+    # Cursors come from clients, so a tampered one must not reach the query
+    if len(cursor) != len(key_types):
+        raise ValueError("Invalid cursor")
+    return (*map(cursor_value, key_types, cursor), page_size)
+
+def build_paginated_query(columns: str, from_clause: str, where_clause: str,
+                          sort_keys: Sequence[str], key_types: Sequence[type],
+                          page: int, page_size: int,
+                          cursor: Optional[List[Any]] = None,
+                          include_total: bool = True) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Build a page query and its trailing parameters.
+    
+    See compile_paginated_query for the query layout.
+    
+    Args:
+        columns: SELECT list of the inner query
+        from_clause: FROM/JOIN clause of the inner query
+        where_clause: WHERE clause of the inner query (may be empty)
+        sort_keys: Ascending, non-null sort key expressions, ending in a unique column
+        key_types: Type of each sort key, see cursor_value
+        page: Page number (1-based), ignored when a cursor is given
+        page_size: Number of results per page
+        cursor: Sort key values of the last row of the previous page
+        include_total: Whether to select ``COUNT(*) OVER () AS __total``
+        
+    Returns:
+        Tuple of (query, trailing parameters for cursor and LIMIT/OFFSET)
+    """
+    params = paginated_query_params(key_types, page, page_size, cursor)
+    query = compile_paginated_query(columns, from_clause, where_clause, tuple(sort_keys),
+                                    cursor is not None, include_total)
+    return query, params
+
+def next_page_cursor(row_count: int, last_row_keys: Dict[str, Any], page_size: int,
+                     key_count: int) -> Optional[str]:
+    """
+    Build the cursor for the page after the current one.
+    
+    Args:
+        row_count: Number of rows on the current page
+        last_row_keys: Bookkeeping columns of the last row, including its
+            ``__k<n>`` sort key columns
+        page_size: Requested page size
+        key_count: Number of sort keys in the query
+        
+    Returns:
+        Cursor string, or None when this is the last page
+    """
+    if row_count < page_size:
+        return None
+    return encode_cursor([last_row_keys[f"__k{idx}"] for idx in range(key_count)])
+
 def validate_pagination_params(page: Optional[int], page_size: Optional[int], 
                              max_page_size: int = 10) -> Tuple[int, int]:
     """
@@ -218,4 +466,35 @@ def validate_pagination_params(page: Optional[int], page_size: Optional[int],
     else:
         validated_page_size = max_page_size
     
-    return validated_page, validated_page_size
\ No newline at end of file
+    return validated_page, validated_page_size
+
+class SearchResultCache:
+    """Thread-safe, short-lived cache of paginated search results."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self._cache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached search result.
+        
+        Args:
+            key: Normalized search parameters
+            
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        with self._lock:
+            return self._cache.get(key)
+    
+    def put(self, key: Hashable, result: Dict[str, Any]):
+        """
+        Cache a search result.
+        
+        Args:
+            key: Normalized search parameters
+            result: Search result with pagination metadata
+        """
+        with self._lock:
+            self._cache[key] = result
@@ -0,0 +1,15 @@
+"""
+WSGI entry point for serving the String Authority Database Search API in production.
+
+Run under a threaded WSGI server, for example:
+
+    gunicorn --workers 2 --worker-class gthread --threads 8 --bind 0.0.0.0:8000 api.wsgi:app
+
+Each worker process owns its own database connection pool, so DB_POOL_MAX
+should be at least the number of threads per worker. Do not use --preload:
+the pool must be opened after the worker is forked.
+"""
+
+from api.app import create_app
+
+app = create_app()
@@ -97,6 +97,8 @@ CREATE TABLE individual_guitars (
     -- Guitar-specific fields
     nickname VARCHAR(50),
     serial_number VARCHAR(50),
+    -- Lowercased serial without dashes or leading zeros, for exact-match lookups
+    serial_norm VARCHAR(50) GENERATED ALWAYS AS (LOWER(TRIM(LEADING '0' FROM REPLACE(serial_number, '-', '')))) STORED,
     production_date DATE,
     production_number INTEGER,
     significance_level VARCHAR(20) DEFAULT 'notable' CHECK (significance_level IN ('historic', 'notable', 'rare', 'custom')),
@@ -475,6 +477,8 @@ BEGIN
         CREATE INDEX idx_manufacturers_name_trgm ON manufacturers USING gin(name gin_trgm_ops);
         CREATE INDEX idx_models_name_trgm ON models USING gin(name gin_trgm_ops);
         CREATE INDEX idx_product_lines_name_trgm ON product_lines USING gin(name gin_trgm_ops);
+        CREATE INDEX idx_individual_guitars_model_fallback_trgm ON individual_guitars USING gin(model_name_fallback gin_trgm_ops);
+        CREATE INDEX idx_individual_guitars_manufacturer_fallback_trgm ON individual_guitars USING gin(manufacturer_name_fallback gin_trgm_ops);
     END IF;
 END $$;
 
@@ -483,6 +487,10 @@ CREATE INDEX idx_manufacturers_name_pattern ON manufacturers(name varchar_patter
 CREATE INDEX idx_models_name_pattern ON models(name varchar_pattern_ops);
 CREATE INDEX idx_product_lines_name_pattern ON product_lines(name varchar_pattern_ops);
 
+-- Case-insensitive name lookups of the uniqueness checks; a product line name is unique per manufacturer
+CREATE INDEX idx_manufacturers_name_lower ON manufacturers(LOWER(name));
+CREATE UNIQUE INDEX idx_product_lines_manufacturer_name_lower ON product_lines(manufacturer_id, LOWER(name));
+
 -- Composite lookup indexes
 CREATE INDEX idx_models_full_lookup ON models(manufacturer_id, LOWER(name), year, production_type);
 CREATE INDEX idx_individual_guitars_lookup ON individual_guitars(model_id, serial_number, production_date) WHERE serial_number IS NOT NULL;
@@ -495,6 +503,7 @@ CREATE INDEX idx_individual_guitars_fallback_lookup ON individual_guitars(
 ) WHERE manufacturer_name_fallback IS NOT NULL;
 
 CREATE INDEX idx_individual_guitars_serial_lower ON individual_guitars(LOWER(serial_number)) WHERE serial_number IS NOT NULL;
+CREATE INDEX idx_individual_guitars_serial_norm ON individual_guitars(serial_norm) WHERE serial_norm IS NOT NULL;
 
 -- Specification indexes
 CREATE INDEX idx_specifications_body_wood ON specifications(body_wood) WHERE body_wood IS NOT NULL;
@@ -0,0 +1,62 @@
+-- String Authority - Electric Guitar Provenance and Authentication System
+-- Copyright (C) 2025 Mariano Rozanski
+--
+-- This program is free software: you can redistribute it and/or modify
+-- it under the terms of the GNU Affero General Public License as published
+-- by the Free Software Foundation, either version 3 of the License, or
+-- (at your option) any later version.
+--
+-- See LICENSE file for full license text.
+
+-- Schema Upgrade - brings a database created from an earlier create.sql up to date
+--
+-- Safe to run more than once; everything runs in one transaction.
+
+BEGIN;
+
+-- Normalized serial numbers, matched by the instrument search
+ALTER TABLE individual_guitars
+    ADD COLUMN IF NOT EXISTS serial_norm VARCHAR(50)
+    GENERATED ALWAYS AS (LOWER(TRIM(LEADING '0' FROM REPLACE(serial_number, '-', '')))) STORED;
+CREATE INDEX IF NOT EXISTS idx_individual_guitars_serial_norm ON individual_guitars(serial_norm) WHERE serial_norm IS NOT NULL;
+
+-- Product lines differing only in case are merged into the oldest one,
+-- so their names can be made unique per manufacturer
+CREATE TEMP TABLE product_line_duplicates ON COMMIT DROP AS
+SELECT id, keep_id
+FROM (
+    SELECT id, FIRST_VALUE(id) OVER (PARTITION BY manufacturer_id, LOWER(name) ORDER BY created_at, id) AS keep_id
+    FROM product_lines
+    WHERE manufacturer_id IS NOT NULL
+) ranked
+WHERE id <> keep_id;
+
+UPDATE models m
+SET product_line_id = d.keep_id
+FROM product_line_duplicates d
+WHERE m.product_line_id = d.id;
+
+UPDATE images i
+SET entity_id = d.keep_id
+FROM product_line_duplicates d
+WHERE i.entity_type = 'product_line' AND i.entity_id = d.id;
+
+DELETE FROM product_lines p
+USING product_line_duplicates d
+WHERE p.id = d.id;
+
+-- Case-insensitive name lookups of the uniqueness checks; a product line name is unique per manufacturer
+CREATE INDEX IF NOT EXISTS idx_manufacturers_name_lower ON manufacturers(LOWER(name));
+DROP INDEX IF EXISTS idx_product_lines_manufacturer_name_lower;
+CREATE UNIQUE INDEX idx_product_lines_manufacturer_name_lower ON product_lines(manufacturer_id, LOWER(name));
+
+-- Text search indexes of the unknown-serial fallback names (if pg_trgm extension is available)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS idx_individual_guitars_model_fallback_trgm ON individual_guitars USING gin(model_name_fallback gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_individual_guitars_manufacturer_fallback_trgm ON individual_guitars USING gin(manufacturer_name_fallback gin_trgm_ops);
+    END IF;
+END $$;
+
+COMMIT;
@@ -28,18 +28,47 @@ Usage:
 """
 
 import argparse
-import json
+import ijson
+import orjson
 import sys
 import os
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from datetime import datetime
+import time
 import traceback
 
-# Import the processor classes (assuming they're in the same directory)
-from uniqueness_management_system import GuitarDataProcessor, GuitarDataValidator
-from image_processing_module import process_guitar_with_photos
+# The database driver and processor modules (jsonschema, pydantic, PIL,
+# cloudinary) are imported where they are first needed, so --help and
+# --create-samples do not pay for them
+
+# Batch files at least this large are streamed item by item instead of parsed whole
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+CLOUDINARY_CONFIG_PATH = 'cloudinary_config.json'
+
+# Display names of the batch summary action counters
+ACTION_NAMES = {
+    'manufacturers_inserted': 'Manufacturers Inserted',
+    'manufacturers_updated': 'Manufacturers Updated',
+    'models_inserted': 'Models Inserted',
+    'models_updated': 'Models Updated',
+    'guitars_inserted': 'Guitars Inserted',
+    'guitars_updated': 'Guitars Updated'
+}
+
+def _action_label(action: str) -> str:
+    """Display name of an action counter, title-casing (and remembering) unknown ones."""
+    label = ACTION_NAMES.get(action)
+    if label is None:
+        label = ACTION_NAMES[action] = action.replace('_', ' ').title()
+    return label
+
+@lru_cache(maxsize=1)
+def _read_cloudinary_config(mtime_ns: int) -> dict:
+    """Parse the Cloudinary config; keyed on its mtime so edits are picked up."""
+    with open(CLOUDINARY_CONFIG_PATH, 'rb') as f:
+        return orjson.loads(f.read())
 
 class DatabaseConfig:
     """Database connection configuration."""
@@ -58,8 +87,8 @@ class DatabaseConfig:
     @staticmethod
     def from_file(config_path: str):
         """Load database config from JSON file."""
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
 
 class GuitarProcessorCLI:
     """Command-line interface for the guitar data processor."""
@@ -72,6 +101,9 @@ class GuitarProcessorCLI:
     
     def connect_database(self):
         """Establish database connection."""
+        import psycopg2
+        from uniqueness_management_system import GuitarDataProcessor
+        
         try:
             self.db_connection = psycopg2.connect(**self.db_config)
             self.processor = GuitarDataProcessor(self.db_connection)
@@ -88,20 +120,35 @@ class GuitarProcessorCLI:
             if self.verbose:
                 print("✓ Database connection closed")
     
+    def load_cloudinary_config(self):
+        """Load cloudinary_config.json, or None to fall back to environment variables."""
+        try:
+            cloudinary_config = _read_cloudinary_config(os.stat(CLOUDINARY_CONFIG_PATH).st_mtime_ns)
+            if self.verbose:
+                print(f"✓ Loaded Cloudinary config")
+            return cloudinary_config
+        except Exception as e:
+            if self.verbose:
+                print(f"⚠ Could not load Cloudinary config: {e}")
+            return None
+    
     def load_json_file(self, file_path: str):
-        """Load and validate JSON file."""
+        """
+        Load and validate JSON file.
+        
+        Large batch files are returned as an iterator over their items (see
+        load_json_stream), so parse errors past the first item surface while
+        the batch is being processed.
+        """
         try:
-            path = Path(file_path)
-            if not path.exists():
-                print(f"✗ File not found: {file_path}")
-                return None
-            
-            if not path.suffix.lower() == '.json':
-                print(f"✗ File must have .json extension: {file_path}")
-                return None
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= STREAM_THRESHOLD_BYTES and self._is_json_array(f):
+                    if self.verbose:
+                        print(f"✓ Streaming JSON file: {file_path}")
+                        print(f"  → Batch submission, processed as items are parsed")
+                    return self.load_json_stream(file_path)
+                
+                data = orjson.loads(f.read())
             
             if self.verbose:
                 print(f"✓ Loaded JSON file: {file_path}")
@@ -112,13 +159,33 @@ class GuitarProcessorCLI:
             
             return data
             
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            print(f"✗ File not found: {file_path}")
+            return None
+        except orjson.JSONDecodeError as e:
             print(f"✗ Invalid JSON in file {file_path}: {e}")
             return None
         except Exception as e:
             print(f"✗ Error reading file {file_path}: {e}")
             return None
     
+    def load_json_stream(self, file_path: str):
+        """Yield the items of a top-level JSON array one at a time."""
+        with open(file_path, 'rb') as f:
+            # 'item' is ijson's prefix for the elements of a top-level array
+            yield from ijson.items(f, 'item', use_float=True)
+    
+    def _is_json_array(self, f) -> bool:
+        """Check whether the first non-whitespace byte of a file opens an array, then rewind it."""
+        try:
+            while chunk := f.read(4096):
+                stripped = chunk.lstrip()
+                if stripped:
+                    return stripped[:1] == b'['
+            return False
+        finally:
+            f.seek(0)
+    
     def print_result_summary(self, result: dict):
         """Print a formatted summary of processing results."""
         if isinstance(result, dict) and 'results' in result:
@@ -130,79 +197,83 @@ class GuitarProcessorCLI:
     
     def _print_single_summary(self, result: dict):
         """Print summary for single submission result."""
+        out = []
         success_icon = "✓" if result.get('success') else "✗"
-        print(f"\n{success_icon} Single Submission Result:")
+        out.append(f"\n{success_icon} Single Submission Result:")
         
         if result.get('success'):
-            print(f"  Actions: {', '.join(result.get('actions_taken', []))}")
+            out.append(f"  Actions: {', '.join(result.get('actions_taken', []))}")
             if result.get('ids_created'):
-                print(f"  IDs Created: {len(result['ids_created'])} entities")
+                out.append(f"  IDs Created: {len(result['ids_created'])} entities")
                 if self.verbose:
                     for entity_type, entity_id in result['ids_created'].items():
-                        print(f"    {entity_type}: {entity_id}")
+                        out.append(f"    {entity_type}: {entity_id}")
         else:
-            print(f"  ✗ Failed")
+            out.append(f"  ✗ Failed")
             if result.get('conflicts'):
                 for conflict in result['conflicts']:
-                    print(f"    • {conflict}")
+                    out.append(f"    • {conflict}")
         
         if result.get('manual_review_needed'):
-            print(f"  ⚠ Manual review required")
+            out.append(f"  ⚠ Manual review required")
+        
+        self._write_lines(out)
     
     def _print_batch_summary(self, result: dict):
         """Print summary for batch submission result."""
+        out = []
         summary = result.get('summary', {})
         success_icon = "✓" if result.get('success') else "✗"
         
-        print(f"\n{success_icon} Batch Processing Summary:")
-        print(f"  Processed: {result.get('processed_count', 0)}/{result.get('total_count', 0)}")
-        print(f"  Successful: {summary.get('successful', 0)}")
-        print(f"  Failed: {summary.get('failed', 0)}")
-        print(f"  Manual Review Needed: {summary.get('manual_review_needed', 0)}")
+        out.append(f"\n{success_icon} Batch Processing Summary:")
+        out.append(f"  Processed: {result.get('processed_count', 0)}/{result.get('total_count', 0)}")
+        out.append(f"  Successful: {summary.get('successful', 0)}")
+        out.append(f"  Failed: {summary.get('failed', 0)}")
+        out.append(f"  Manual Review Needed: {summary.get('manual_review_needed', 0)}")
         
         if result.get('rolled_back'):
-            print(f"  ⚠ Transaction rolled back: {result.get('rollback_reason', 'Unknown reason')}")
+            out.append(f"  ⚠ Transaction rolled back: {result.get('rollback_reason', 'Unknown reason')}")
         elif result.get('partial_success'):
-            print(f"  ⚠ Partial success: some items failed but others were committed")
+            out.append(f"  ⚠ Partial success: some items failed but others were committed")
         
         # Actions summary
         actions = summary.get('actions_taken', {})
         if any(actions.values()):
-            print(f"  Actions Performed:")
+            out.append(f"  Actions Performed:")
             for action, count in actions.items():
                 if count > 0:
-                    action_name = action.replace('_', ' ').title()
-                    print(f"    {action_name}: {count}")
+                    out.append(f"    {_action_label(action)}: {count}")
         
         # Individual results (if verbose)
         if self.verbose and result.get('results'):
-            print(f"\n  Individual Results:")
+            out.append(f"\n  Individual Results:")
             for idx, item_result in enumerate(result['results']):
                 success_icon = "✓" if item_result.get('success') else "✗"
                 actions = ', '.join(item_result.get('actions_taken', []))
-                print(f"    [{idx}] {success_icon} {actions}")
+                out.append(f"    [{idx}] {success_icon} {actions}")
                 
                 if not item_result.get('success') and item_result.get('conflicts'):
                     for conflict in item_result['conflicts']:
-                        print(f"         • {conflict}")
+                        out.append(f"         • {conflict}")
+        
+        self._write_lines(out)
+    
+    def _write_lines(self, lines: list):
+        """Write summary lines to stdout in a single call."""
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
     def process_file(self, file_path: str):
         """Process a JSON file containing guitar data with support for relative image paths."""
+        from image_processing_module import process_guitar_with_photos
+        
         # Load data
         data = self.load_json_file(file_path)
         if data is None:
             return False
         
         # Load Cloudinary config for image processing
-        cloudinary_config = None
-        try:
-            with open('cloudinary_config.json', 'r') as f:
-                cloudinary_config = json.load(f)
-            if self.verbose:
-                print(f"✓ Loaded Cloudinary config")
-        except Exception as e:
-            if self.verbose:
-                print(f"⚠ Could not load Cloudinary config: {e}")
+        cloudinary_config = self.load_cloudinary_config()
         
         # Establish working directory context from input file location
         # The working directory should be the JSON file's parent directory
@@ -211,16 +282,21 @@ class GuitarProcessorCLI:
         
         # Process data
         print(f"\n🎸 Processing guitar data...")
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Pass working directory for relative path resolution
-            if isinstance(data, list):
-                # Batch processing
-                results = []
+            if isinstance(data, (list, Iterator)):
+                # Batch processing, streamed batches are consumed as they are parsed
+                total_count = len(data) if isinstance(data, list) else None
+                # Per-item results are only kept for the verbose listing
+                results = [] if self.verbose else None
+                processed_count = 0
+                successful = 0
+                processed_images = 0
                 for idx, item in enumerate(data):
                     if self.verbose:
-                        print(f"  Processing item {idx + 1}/{len(data)}...")
+                        print(f"  Processing item {idx + 1}/{total_count or '?'}...")
                     
                     result = process_guitar_with_photos(
                         item, 
@@ -229,29 +305,33 @@ class GuitarProcessorCLI:
                         processor=self.processor,
                         cloudinary_config=cloudinary_config
                     )
-                    results.append(result)
+                    if results is not None:
+                        results.append(result)
+                    # Tally the batch summary as results come in
+                    processed_count += 1
+                    if result.get('success'):
+                        successful += 1
+                    processed_images += result.get('image_count', 0)
                 
                 # Create batch summary
-                successful = sum(1 for r in results if r.get('success'))
-                failed = len(results) - successful
-                processed_images = sum(r.get('image_count', 0) for r in results)
+                failed = processed_count - successful
                 
                 batch_result = {
                     'success': failed == 0,
-                    'processed_count': len(results),
-                    'total_count': len(data),
+                    'processed_count': processed_count,
+                    'total_count': processed_count if total_count is None else total_count,
                     'summary': {
                         'successful': successful,
                         'failed': failed,
                         'images_processed': processed_images
-                    },
-                    'results': results
+                    }
                 }
                 
                 if self.verbose:
-                    print(f"✓ Processed {processed_images} images across {len(results)} items")
+                    batch_result['results'] = results
+                    print(f"✓ Processed {processed_images} images across {processed_count} items")
                 
-                self.print_result_summary(batch_result)
+                self._print_batch_summary(batch_result)
                 return batch_result['success']
                 
             else:
@@ -276,13 +356,16 @@ class GuitarProcessorCLI:
                 traceback.print_exc()
             return False
         finally:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             if self.verbose:
                 print(f"⏱ Processing completed in {duration:.2f} seconds")
     
     def interactive_mode(self):
         """Run in interactive mode for testing."""
+        from image_processing_module import process_guitar_with_photos
+        
+        cloudinary_config = self.load_cloudinary_config()
+        
         print("\n🎸 Guitar Data Processor - Interactive Mode")
         print("Enter JSON data (or 'quit' to exit):")
         print("You can paste single submissions or arrays of submissions.")
@@ -300,8 +383,8 @@ class GuitarProcessorCLI:
                 
                 # Try to parse as JSON
                 try:
-                    data = json.loads(user_input)
-                except json.JSONDecodeError:
+                    data = orjson.loads(user_input)
+                except orjson.JSONDecodeError:
                     print("✗ Invalid JSON. Please check your syntax.")
                     continue
                 
@@ -311,7 +394,8 @@ class GuitarProcessorCLI:
                     data,
                     working_dir=Path.cwd(),
                     db_connection=self.db_connection,
-                    processor=self.processor
+                    processor=self.processor,
+                    cloudinary_config=cloudinary_config
                 )
                 self.print_result_summary(result)
                 
@@ -410,18 +494,18 @@ def create_sample_files():
     ]
     
     # Write sample files
-    with open('sample_single.json', 'w') as f:
-        json.dump(single_sample, f, indent=2)
+    with open('sample_single.json', 'wb') as f:
+        f.write(orjson.dumps(single_sample, option=orjson.OPT_INDENT_2))
     
-    with open('sample_batch.json', 'w') as f:
-        json.dump(batch_sample, f, indent=2)
+    with open('sample_batch.json', 'wb') as f:
+        f.write(orjson.dumps(batch_sample, option=orjson.OPT_INDENT_2))
     
     print("✓ Created sample files:")
     print("  • sample_single.json - Single guitar submission")
     print("  • sample_batch.json - Batch of 3 guitars")
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Guitar Data Processor CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -463,6 +547,11 @@ Examples:
         help='Create sample JSON files for testing'
     )
     
+    return parser
+
+def main():
+    """Main CLI entry point."""
+    parser = build_parser()
     args = parser.parse_args()
     
     # Handle sample creation
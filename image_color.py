@@ -0,0 +1,37 @@
+"""
+Dominant color extraction shared by the image processors.
+"""
+
+import numpy as np
+from PIL import Image
+
+# Side of the pixel grid sampled from large images for the dominant color
+COLOR_SAMPLE_SIZE = 512
+
+def get_dominant_color(img: Image.Image) -> str:
+    """Extract dominant color as hex"""
+    # Large images that draft() could not shrink are first sampled on a
+    # regular grid, so the resize below reads a bounded number of pixels
+    if max(img.size) > COLOR_SAMPLE_SIZE:
+        img = img.resize((COLOR_SAMPLE_SIZE, COLOR_SAMPLE_SIZE), Image.NEAREST)
+
+    # Resize for faster processing; bilinear is plenty for a color count
+    # (a pillow-simd build speeds this resize up further as a drop-in)
+    img_small = img.resize((64, 64), Image.BILINEAR)
+
+    # Convert to RGB if necessary
+    if img_small.mode != 'RGB':
+        img_small = img_small.convert('RGB')
+
+    # Quantize to 4 bits per channel, so near-identical shades (gradients,
+    # sensor noise) count as one color, and pack each pixel into 12 bits
+    pixels = np.asarray(img_small, dtype=np.uint16).reshape(-1, 3)
+    levels = pixels >> 4
+    packed = (levels[:, 0] << 8) | (levels[:, 1] << 4) | levels[:, 2]
+
+    # Find most common color bucket and average the pixels that fall in it
+    bucket = np.bincount(packed, minlength=4096).argmax()
+    r, g, b = pixels[packed == bucket].mean(axis=0).round().astype(int)
+
+    # Convert to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
@@ -6,29 +6,59 @@ Handles image ingestion, validation, and storage management
 import os
 import hashlib
 import mimetypes
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import requests
+from psycopg2.extras import execute_values
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
+from image_color import get_dominant_color
 import io
+import threading
+from contextlib import contextmanager
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # You would install these with: uv add cloudinary pillow colormath
 import cloudinary
 import cloudinary.uploader
+from cachetools import LRUCache
 from colormath.color_objects import sRGBColor, HSVColor
 from colormath.color_conversions import convert_color
 
+# Photos of a submission loaded and uploaded concurrently
+IMAGE_WORKERS = 8
+
+# Read size of streamed image downloads
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Images remembered per processor, so repeated references skip download and upload
+PROCESSED_CACHE_SIZE = 1024
+
+# Per-thread HTTP session, so image downloads and checks reuse keep-alive connections
+_http = threading.local()
+
+def _http_session() -> requests.Session:
+    """Return this thread's requests session, retrying transient failures."""
+    session = getattr(_http, 'session', None)
+    if session is None:
+        session = _http.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.2))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    return session
+
 @dataclass
 class ImageMetadata:
     """Metadata extracted from processed images"""
     width: int
     height: int
     aspect_ratio: float
-    dominant_color: str
+    dominant_color: Optional[str]
     file_size: int
     mime_type: str
     
@@ -41,6 +71,13 @@ class ProcessedImage:
     metadata: ImageMetadata
     hash: str
 
+@dataclass
+class PhotoSource:
+    """Image source that has already been categorized and, for files, resolved"""
+    source_type: str  # url, absolute_path or relative_path
+    location: Union[str, Path]  # URL, or resolved file path
+    original: str
+
 class GuitarImageProcessor:
     """Handles image processing for String Authority database"""
     
@@ -53,6 +90,15 @@ class GuitarImageProcessor:
         'xlarge': 2400
     }
     
+    # Cloudinary transformations of the variants, as eager upload options and as URL segments
+    EAGER_TRANSFORMATIONS = [
+        {'width': size, 'crop': 'limit', 'quality': 'auto', 'fetch_format': 'auto'}
+        for size in VARIANTS.values()
+    ]
+    VARIANT_TRANSFORMATIONS = {
+        name: f"w_{width},c_limit,q_auto,f_auto" for name, width in VARIANTS.items()
+    }
+    
     # Valid image types for different contexts
     IMAGE_TYPES = {
         'manufacturer': ['logo', 'primary', 'gallery'],
@@ -67,6 +113,9 @@ class GuitarImageProcessor:
     def __init__(self, config: Dict):
         """Initialize with storage configuration"""
         self.config = config
+        # Computing the dominant color is the only step that decodes pixels;
+        # without it only the image header is read
+        self.extract_dominant_color = config.get('extract_dominant_color', True)
         
         # Configure Cloudinary
         cloudinary.config(
@@ -74,9 +123,16 @@ class GuitarImageProcessor:
             api_key=config['cloudinary_api_key'],
             api_secret=config['cloudinary_api_secret']
         )
+        self.variant_base_url = f"https://res.cloudinary.com/{config['cloudinary_cloud_name']}/image/upload"
+        
+        # Uploaded images by content hash, and content hashes by source URL;
+        # duplicates share one storage_key, as the images table intends
+        self._processed = LRUCache(maxsize=PROCESSED_CACHE_SIZE)
+        self._url_hashes = LRUCache(maxsize=PROCESSED_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
         
     def process_image(self, 
-                     image_source: str, 
+                     image_source: Union[str, PhotoSource], 
                      entity_type: str,
                      entity_id: str,
                      image_type: str,
@@ -86,7 +142,7 @@ class GuitarImageProcessor:
         Process an image from URL or file path
         
         Args:
-            image_source: URL or file path to image
+            image_source: URL or file path to image, or an already resolved PhotoSource
             entity_type: Type of entity (manufacturer, model, etc)
             entity_id: UUID of the entity
             image_type: Type of image (primary, gallery, etc)
@@ -99,37 +155,68 @@ class GuitarImageProcessor:
         if image_type not in self.IMAGE_TYPES.get(entity_type, []):
             raise ValueError(f"Invalid image type '{image_type}' for entity type '{entity_type}'")
         
-        # Load image
-        image_data, original_filename = self._load_image(image_source, working_dir)
+        # A URL that was already processed is not downloaded again
+        url = self._source_url(image_source)
+        with self._cache_lock:
+            image_hash = self._url_hashes.get(url) if url else None
+            processed = self._processed.get(image_hash) if image_hash else None
+        if processed:
+            return processed
         
-        # Extract metadata
-        metadata = self._extract_metadata(image_data)
+        # Load image, hashing it for deduplication as it is read
+        image_data, original_filename, image_hash = self._load_image(image_source, working_dir)
         
-        # Generate hash for deduplication
-        image_hash = self._generate_hash(image_data)
+        # The same content may already be uploaded under another source
+        with self._cache_lock:
+            processed = self._processed.get(image_hash)
         
-        # Create storage path
-        storage_path = f"guitars/{entity_type}/{entity_id}/{image_type}/{image_hash}"
-        
-        # Upload to Cloudinary with transformations
-        upload_result = self._upload_with_variants(image_data, storage_path)
+        if not processed:
+            # Extract metadata
+            metadata = self._extract_metadata(image_data)
+            
+            # Create storage path
+            storage_path = f"guitars/{entity_type}/{entity_id}/{image_type}/{image_hash}"
+            
+            # Upload to Cloudinary with transformations
+            upload_result = self._upload_with_variants(image_data, storage_path)
+            
+            processed = ProcessedImage(
+                storage_key=upload_result['public_id'],
+                original_url=upload_result['secure_url'],
+                variants=self._extract_variant_urls(upload_result['public_id']),
+                metadata=metadata,
+                hash=image_hash
+            )
         
-        return ProcessedImage(
-            storage_key=upload_result['public_id'],
-            original_url=upload_result['secure_url'],
-            variants=self._extract_variant_urls(upload_result['public_id']),
-            metadata=metadata,
-            hash=image_hash
-        )
+        with self._cache_lock:
+            self._processed[image_hash] = processed
+            if url:
+                self._url_hashes[url] = image_hash
+        return processed
     
-    def _load_image(self, source: str, working_dir: Optional[Path] = None) -> Tuple[bytes, str]:
-        """Load image from URL or file path (absolute/relative)"""
+    @staticmethod
+    def _source_url(source: Union[str, PhotoSource]) -> Optional[str]:
+        """Return the URL of a URL image source, or None for files"""
+        if isinstance(source, PhotoSource):
+            return source.location if source.source_type == 'url' else None
+        return source if source.startswith(('http://', 'https://')) else None
+    
+    def _load_image(self, source: Union[str, PhotoSource], working_dir: Optional[Path] = None) -> Tuple[Union[bytes, Path], str, str]:
+        """
+        Load image from URL or file path (absolute/relative), with its dedup hash
+        
+        URLs are downloaded into memory; local files are returned as their
+        Path, so each later step reads the file itself instead of sharing an
+        in-memory copy of it.
+        """
+        if isinstance(source, PhotoSource):
+            # Already categorized and resolved by the caller
+            if source.source_type == 'url':
+                return self._download_image(source.location)
+            return source.location, source.location.name, self._generate_hash(source.location)
+        
         if source.startswith(('http://', 'https://')):
-            # Existing URL handling
-            response = requests.get(source, timeout=30)
-            response.raise_for_status()
-            filename = source.split('/')[-1]
-            return response.content, filename
+            return self._download_image(source)
         else:
             # File path handling (absolute or relative)
             file_path = Path(source)
@@ -142,26 +229,41 @@ class GuitarImageProcessor:
                     source_path = source_path[2:]
                 file_path = base_dir / source_path
             
-            if not file_path.exists():
+            if not file_path.is_file():
                 raise FileNotFoundError(f"Image file not found: {file_path}")
             
-            with open(file_path, 'rb') as f:
-                return f.read(), file_path.name
+            return file_path, file_path.name, self._generate_hash(file_path)
     
-    def _extract_metadata(self, image_data: bytes) -> ImageMetadata:
+    def _download_image(self, url: str) -> Tuple[bytes, str, str]:
+        """Download image from URL, hashing it chunk by chunk while it streams in"""
+        with _http_session().get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            hasher = hashlib.sha256()
+            chunks = []
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                chunks.append(chunk)
+        filename = url.split('/')[-1]
+        return b''.join(chunks), filename, hasher.hexdigest()[:16]
+    
+    def _extract_metadata(self, image_data: Union[bytes, Path]) -> ImageMetadata:
         """Extract metadata from image"""
-        img = Image.open(io.BytesIO(image_data))
-        
-        # Basic dimensions
-        width, height = img.size
-        aspect_ratio = round(width / height, 3)
-        
-        # Dominant color (simplified - you'd want more sophisticated analysis)
-        dominant_color = self._get_dominant_color(img)
-        
-        # File info
-        file_size = len(image_data)
-        mime_type = Image.MIME.get(img.format, 'image/jpeg')
+        is_file = isinstance(image_data, Path)
+        with Image.open(image_data if is_file else io.BytesIO(image_data)) as img:
+            # Basic dimensions
+            width, height = img.size
+            aspect_ratio = round(width / height, 3)
+            
+            # Dominant color (simplified - you'd want more sophisticated analysis)
+            dominant_color = None
+            if self.extract_dominant_color:
+                # Let the JPEG decoder scale down while decoding; the color only needs a thumbnail
+                img.draft('RGB', (256, 256))
+                dominant_color = get_dominant_color(img)
+            
+            # File info
+            file_size = image_data.stat().st_size if is_file else len(image_data)
+            mime_type = Image.MIME.get(img.format, 'image/jpeg')
         
         return ImageMetadata(
             width=width,
@@ -172,48 +274,26 @@ class GuitarImageProcessor:
             mime_type=mime_type
         )
     
-    def _get_dominant_color(self, img: Image.Image) -> str:
-        """Extract dominant color as hex"""
-        # Resize for faster processing
-        img_small = img.resize((150, 150))
-        
-        # Convert to RGB if necessary
-        if img_small.mode != 'RGB':
-            img_small = img_small.convert('RGB')
-        
-        # Get colors
-        colors = img_small.getcolors(150 * 150)
-        if not colors:
-            return '#000000'
-        
-        # Find most common color
-        most_common = max(colors, key=lambda x: x[0])
-        rgb = most_common[1]
-        
-        # Convert to hex
-        return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-    
-    def _generate_hash(self, image_data: bytes) -> str:
+    def _generate_hash(self, image_data: Union[bytes, Path]) -> str:
         """Generate SHA-256 hash of image for deduplication"""
+        if isinstance(image_data, Path):
+            # Hash the file in buffered blocks rather than reading it whole
+            with open(image_data, 'rb') as f:
+                return hashlib.file_digest(f, 'sha256').hexdigest()[:16]
         return hashlib.sha256(image_data).hexdigest()[:16]
     
-    def _upload_with_variants(self, image_data: bytes, storage_path: str) -> Dict:
-        """Upload image to Cloudinary with eager transformations"""
-        eager_transformations = [
-            {'width': size, 'crop': 'limit', 'quality': 'auto', 'fetch_format': 'auto'}
-            for size in self.VARIANTS.values()
-        ]
-        
+    def _upload_with_variants(self, image_data: Union[bytes, Path], storage_path: str) -> Dict:
+        """Upload image to Cloudinary with eager transformations (a Path is read by the SDK)"""
         result = cloudinary.uploader.upload(
             image_data,
             public_id=storage_path,
-            eager=eager_transformations,
+            eager=self.EAGER_TRANSFORMATIONS,
             eager_async=True,
             overwrite=False,
             resource_type='image',
             tags=['string_authority'],
             context={
-                'uploaded_at': datetime.utcnow().isoformat(),
+                'uploaded_at': datetime.now(timezone.utc).isoformat(),
                 'processor_version': '1.0'
             }
         )
@@ -222,14 +302,10 @@ class GuitarImageProcessor:
     
     def _extract_variant_urls(self, public_id: str) -> Dict[str, str]:
         """Generate URLs for all variants"""
-        base_url = f"https://res.cloudinary.com/{self.config['cloudinary_cloud_name']}/image/upload"
-        
-        variants = {}
-        for name, width in self.VARIANTS.items():
-            transformation = f"w_{width},c_limit,q_auto,f_auto"
-            variants[name] = f"{base_url}/{transformation}/{public_id}"
-        
-        return variants
+        return {
+            name: f"{self.variant_base_url}/{transformation}/{public_id}"
+            for name, transformation in self.VARIANT_TRANSFORMATIONS.items()
+        }
 
 class ImageAssociationManager:
     """Manages associations between images and entities"""
@@ -245,7 +321,7 @@ class ImageAssociationManager:
                        is_primary: bool = False,
                        caption: Optional[str] = None,
                        user_id: Optional[str] = None) -> str:
-        """Create association between image and entity"""
+        """Create association between image and entity; committed by the caller (see batch)"""
         
         # If setting as primary, unset any existing primary
         if is_primary:
@@ -269,10 +345,29 @@ class ImageAssociationManager:
             display_order, is_primary, caption, user_id
         ))
         
-        association_id = cursor.fetchone()[0]
-        self.db.commit()
-        
-        return association_id
+        return cursor.fetchone()[0]
+    
+    @contextmanager
+    def batch(self):
+        """Run a block of saves and associations as one transaction, committed when it completes."""
+        try:
+            yield self
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    @contextmanager
+    def savepoint(self):
+        """Undo only the block's writes if it fails, keeping the rest of the batch."""
+        cursor = self.db.cursor()
+        cursor.execute("SAVEPOINT image_save")
+        try:
+            yield
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT image_save")
+            raise
+        cursor.execute("RELEASE SAVEPOINT image_save")
     
     def _unset_primary(self, entity_type: str, entity_id: str):
         """Remove primary flag from existing images"""
@@ -315,7 +410,7 @@ class ImageSourceValidator:
         
         if source_type == 'url':
             try:
-                response = requests.head(source, timeout=10)
+                response = _http_session().head(source, timeout=10)
                 return response.status_code == 200
             except:
                 return False
@@ -332,79 +427,100 @@ def process_guitar_images(guitar_data: Dict, processor: GuitarImageProcessor, db
     
     association_manager = ImageAssociationManager(db_connection)
     
-    # Process manufacturer logo if provided
-    if 'manufacturer' in guitar_data and 'logo_url' in guitar_data['manufacturer']:
-        try:
-            processed = processor.process_image(
-                guitar_data['manufacturer']['logo_url'],
-                'manufacturer',
-                guitar_data['manufacturer']['id'],
-                'logo',
-                source_info={'source_type': 'web_scrape'}
-            )
-            
-            # Save to database
-            image_id = save_processed_image(processed, db_connection, 'manufacturer', guitar_data['manufacturer']['id'], 'logo')
-            
-            # Create association
-            association_manager.associate_image(
-                'manufacturer',
-                guitar_data['manufacturer']['id'],
-                image_id,
-                'logo',
-                is_primary=True
-            )
-            
-        except Exception as e:
-            print(f"Error processing manufacturer logo: {e}")
-    
-    # Process model images
-    if 'model' in guitar_data and 'images' in guitar_data['model']:
-        for idx, image_info in enumerate(guitar_data['model']['images']):
+    # All images and associations are committed together at the end
+    with association_manager.batch():
+        # Process manufacturer logo if provided
+        if 'manufacturer' in guitar_data and 'logo_url' in guitar_data['manufacturer']:
             try:
                 processed = processor.process_image(
-                    image_info['url'],
-                    'model',
-                    guitar_data['model']['id'],
-                    image_info.get('type', 'gallery'),
-                    source_info=image_info.get('source')
+                    guitar_data['manufacturer']['logo_url'],
+                    'manufacturer',
+                    guitar_data['manufacturer']['id'],
+                    'logo',
+                    source_info={'source_type': 'web_scrape'}
                 )
                 
-                image_id = save_processed_image(processed, db_connection, 'model', guitar_data['model']['id'], image_info.get('type', 'gallery'))
+                with association_manager.savepoint():
+                    # Save to database
+                    image_id = save_processed_image(processed, db_connection, 'manufacturer', guitar_data['manufacturer']['id'], 'logo')
+                    
+                    # Create association
+                    association_manager.associate_image(
+                        'manufacturer',
+                        guitar_data['manufacturer']['id'],
+                        image_id,
+                        'logo',
+                        is_primary=True
+                    )
                 
-                association_manager.associate_image(
+            except Exception as e:
+                print(f"Error processing manufacturer logo: {e}")
+        
+        # Process model images, loading and uploading them concurrently
+        if 'model' in guitar_data and 'images' in guitar_data['model']:
+            images = guitar_data['model']['images']
+            
+            def process_model_image(image_info):
+                return processor.process_image(
+                    image_info['url'],
                     'model',
                     guitar_data['model']['id'],
-                    image_id,
                     image_info.get('type', 'gallery'),
-                    is_primary=(idx == 0),  # First image is primary
-                    caption=image_info.get('caption')
+                    source_info=image_info.get('source')
                 )
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(IMAGE_WORKERS, len(images)))) as executor:
+                futures = [executor.submit(process_model_image, image_info) for image_info in images]
                 
-            except Exception as e:
-                print(f"Error processing model image: {e}")
+                for idx, (image_info, future) in enumerate(zip(images, futures)):
+                    try:
+                        processed = future.result()
+                        
+                        with association_manager.savepoint():
+                            image_id = save_processed_image(processed, db_connection, 'model', guitar_data['model']['id'], image_info.get('type', 'gallery'))
+                            
+                            association_manager.associate_image(
+                                'model',
+                                guitar_data['model']['id'],
+                                image_id,
+                                image_info.get('type', 'gallery'),
+                                is_primary=(idx == 0),  # First image is primary
+                                caption=image_info.get('caption')
+                            )
+                        
+                    except Exception as e:
+                        print(f"Error processing model image: {e}")
 
 def save_processed_image(processed: ProcessedImage, db_connection, entity_type: str, entity_id: str, image_type: str) -> str:
     """Save processed image to database"""
+    return save_processed_images([(processed, entity_type, entity_id, image_type, False, None)], db_connection)[0]
+
+def save_processed_images(images: List[Tuple], db_connection) -> List[str]:
+    """
+    Save processed images to database in a single statement; the caller commits.
+    
+    Args:
+        images: (processed, entity_type, entity_id, image_type, is_primary, caption) tuples
+        db_connection: Database connection
+        
+    Returns:
+        IDs of the inserted images, in the order given
+    """
     query = """
         INSERT INTO images (
-            entity_type, entity_id, image_type, storage_provider, storage_key, original_url,
+            entity_type, entity_id, image_type, is_primary, caption, storage_provider, storage_key, original_url,
             thumbnail_url, small_url, medium_url, large_url, xlarge_url,
             width, height, aspect_ratio, dominant_color,
             file_size_bytes, mime_type
-        ) VALUES (
-            %s, %s, %s, 'cloudinary', %s, %s,
-            %s, %s, %s, %s, %s,
-            %s, %s, %s, %s,
-            %s, %s
-        ) RETURNING id
+        ) VALUES %s RETURNING id
     """
-    
-    cursor = db_connection.cursor()
-    cursor.execute(query, (
+    rows = [(
         entity_type,
         entity_id,
         image_type,
+        is_primary,
+        caption,
+        'cloudinary',
         processed.storage_key,
         processed.original_url,
         processed.variants.get('thumbnail'),
@@ -418,12 +534,10 @@ def save_processed_image(processed: ProcessedImage, db_connection, entity_type:
         processed.metadata.dominant_color,
         processed.metadata.file_size,
         processed.metadata.mime_type
-    ))
-    
-    image_id = cursor.fetchone()[0]
-    db_connection.commit()
+    ) for processed, entity_type, entity_id, image_type, is_primary, caption in images]
     
-    return image_id
+    cursor = db_connection.cursor()
+    return [row[0] for row in execute_values(cursor, query, rows, page_size=len(rows), fetch=True)]
 
 def process_guitar_with_photos(guitar_data, working_dir=None, db_connection=None, processor=None, cloudinary_config=None):
     """Process guitar data with support for URL and local file images"""
@@ -477,63 +591,103 @@ def process_guitar_with_photos(guitar_data, working_dir=None, db_connection=None
                     if result:
                         all_entity_ids['individual_guitar'] = result[0]
     
+    # Collect the accessible photos of every entity before processing any of them
+    # The working_dir is the JSON file's parent directory
+    # The source paths are relative to the JSON file location
+    base_dir = Path(working_dir) if working_dir else Path.cwd()
+    
+    # Files of each photo directory, listed with one scandir instead of a stat per photo
+    directory_files = {}
+    
+    def is_listed_file(path: Path) -> bool:
+        if path.parent not in directory_files:
+            try:
+                with os.scandir(path.parent) as entries:
+                    directory_files[path.parent] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                directory_files[path.parent] = set()
+        return path.name in directory_files[path.parent]
+    
+    photo_jobs = []
     for entity_type in ['manufacturer', 'product_line', 'model', 'individual_guitar']:
         if entity_type in all_entity_ids and all_entity_ids[entity_type]:
             photos = extract_photos_for_entity(guitar_data, entity_type)
             
             for photo_spec in photos:
-                try:
-                    # Validate source accessibility
-                    # The working_dir is the JSON file's parent directory
-                    # The source paths are relative to the JSON file location
-                    base_dir = Path(working_dir) if working_dir else Path.cwd()
+                source = PhotoSource(
+                    ImageSourceValidator.categorize_source(photo_spec['source']),
+                    photo_spec['source'],
+                    photo_spec['source']
+                )
+                
+                # Validate source accessibility; URLs are checked when they are fetched
+                if source.source_type != 'url':
                     # Remove the leading ./ if present
-                    source_path = photo_spec['source']
-                    if source_path.startswith('./'):
-                        source_path = source_path[2:]
-                    resolved_path = base_dir / source_path
-                    
-                    if not resolved_path.exists():
-                        print(f"⚠ Skipping inaccessible image: {photo_spec['source']}")
+                    source.location = base_dir / source.original.removeprefix('./')
+                    if not is_listed_file(source.location):
+                        print(f"⚠ Skipping inaccessible image: {source.original}")
                         continue
-                    
-                    # Process image (handles URLs and files uniformly)
-                    processed_image = image_processor.process_image(
-                        photo_spec['source'],
-                        entity_type,
-                        all_entity_ids[entity_type],
-                        photo_spec.get('type', 'gallery'),
-                        source_info={
-                            'source_type': ImageSourceValidator.categorize_source(photo_spec['source']),
-                            'original_path': photo_spec['source']
-                        },
-                        working_dir=Path(working_dir) if working_dir else None
-                    )
-                    
-                    # Save to database with enhanced metadata
-                    image_id = save_processed_image(processed_image, db_connection, entity_type, all_entity_ids[entity_type], photo_spec.get('type', 'gallery'))
-                    
-                    # Update image with additional metadata (is_primary, caption, etc.)
-                    if photo_spec.get('is_primary', False):
-                        cursor = db_connection.cursor()
-                        cursor.execute("""
-                            UPDATE images 
-                            SET is_primary = TRUE, caption = %s
-                            WHERE id = %s
-                        """, (photo_spec.get('caption'), image_id))
-                        db_connection.commit()
-                    
-                    processed_images.append({
-                        'entity_type': entity_type,
-                        'entity_id': all_entity_ids[entity_type],
-                        'image_id': image_id,
-                        'source': photo_spec['source'],
-                        'type': photo_spec.get('type', 'gallery')
-                    })
-                    
-                except Exception as e:
-                    print(f"✗ Error processing image {photo_spec['source']}: {e}")
-                    # Continue with other images rather than failing entire batch
+                
+                photo_jobs.append((entity_type, photo_spec, source))
+    
+    def process_photo(job):
+        entity_type, photo_spec, source = job
+        # Process image (handles URLs and files uniformly)
+        return image_processor.process_image(
+            source,
+            entity_type,
+            all_entity_ids[entity_type],
+            photo_spec.get('type', 'gallery'),
+            source_info={
+                'source_type': source.source_type,
+                'original_path': source.original
+            }
+        )
+    
+    # Loading, analysis and the Cloudinary upload are network and disk bound, so
+    # photos are processed concurrently; database writes stay on this thread
+    with ThreadPoolExecutor(max_workers=max(1, min(IMAGE_WORKERS, len(photo_jobs)))) as executor:
+        futures = [executor.submit(process_photo, job) for job in photo_jobs]
+        
+        processed = []
+        for (entity_type, photo_spec, _), future in zip(photo_jobs, futures):
+            try:
+                processed.append((entity_type, photo_spec, future.result()))
+            except Exception as e:
+                print(f"✗ Error processing image {photo_spec['source']}: {e}")
+                # Continue with other images rather than failing entire batch
+    
+    # Save all images with their metadata (is_primary, caption) in one round trip
+    rows = []
+    for entity_type, photo_spec, processed_image in processed:
+        is_primary = photo_spec.get('is_primary', False)
+        rows.append((processed_image, entity_type, all_entity_ids[entity_type], photo_spec.get('type', 'gallery'),
+                     is_primary, photo_spec.get('caption') if is_primary else None))
+    try:
+        image_ids = save_processed_images(rows, db_connection) if rows else []
+        db_connection.commit()
+    except Exception:
+        db_connection.rollback()
+        # Save one by one so a bad image only loses its own row
+        image_ids = []
+        for row, (_, photo_spec, _) in zip(rows, processed):
+            try:
+                image_ids.append(save_processed_images([row], db_connection)[0])
+                db_connection.commit()
+            except Exception as e:
+                db_connection.rollback()
+                print(f"✗ Error processing image {photo_spec['source']}: {e}")
+                image_ids.append(None)
+    
+    for (entity_type, photo_spec, _), image_id in zip(processed, image_ids):
+        if image_id is not None:
+            processed_images.append({
+                'entity_type': entity_type,
+                'entity_id': all_entity_ids[entity_type],
+                'image_id': image_id,
+                'source': photo_spec['source'],
+                'type': photo_spec.get('type', 'gallery')
+            })
     
     # Add image processing results to the entity creation results
     entity_ids['processed_images'] = processed_images
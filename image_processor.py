@@ -7,22 +7,66 @@ Uploads images to Cloudinary and saves metadata to database
 import os
 import sys
 import argparse
-import json
-import psycopg2
-from typing import Dict, Optional
+import logging
+import orjson
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Image processing
 from PIL import Image
 import io
+from image_color import get_dominant_color
 
 # Cloudinary
 import cloudinary
 import cloudinary.uploader
 
+logger = logging.getLogger(__name__)
+
+# Cloudinary uploads in flight at once; they are network-bound, so threads suffice
+UPLOAD_WORKERS = 8
+
+# Originals larger than this on either side are downscaled before upload; the
+# largest variant is 2400px, so nothing shown is lost
+UPLOAD_MAX_DIMENSION = 3000
+UPLOAD_QUALITY = 90
+
+# Executions of the same statement after which psycopg prepares it server-side.
+# DB_PREPARED_STATEMENTS=false turns preparing off, e.g. behind a pgbouncer in
+# transaction pooling mode.
+PREPARE_THRESHOLD = 5
+PREPARED_STATEMENTS = os.environ.get('DB_PREPARED_STATEMENTS', 'true').lower() in ('true', '1', 'yes')
+
+# Image record insert, shared by single and batch saves. The display order
+# follows the entity's current last image, including rows inserted earlier in
+# the same transaction.
+INSERT_IMAGE_SQL = """
+    INSERT INTO images (
+        entity_type, entity_id, image_type, is_primary, display_order, caption,
+        storage_provider, storage_key, original_url,
+        thumbnail_url, small_url, medium_url, large_url, xlarge_url,
+        original_filename, mime_type, file_size_bytes, width, height,
+        aspect_ratio, dominant_color, uploaded_by, validation_status,
+        tags, description
+    ) VALUES (
+        %s, %s, %s, %s,
+        (SELECT COALESCE(MAX(display_order), 0) + 1 FROM images WHERE entity_type = %s AND entity_id = %s),
+        %s,
+        'cloudinary', %s, %s,
+        %s, %s, %s, %s, %s,
+        %s, %s, %s, %s, %s,
+        %s, %s, %s, 'approved',
+        %s, %s
+    ) RETURNING id
+"""
+
 @dataclass
 class ImageConfig:
     """Configuration for image processing"""
@@ -49,7 +93,7 @@ class ImageUploadResult:
     width: int
     height: int
     aspect_ratio: float
-    dominant_color: str
+    dominant_color: Optional[str]
     file_size: int
     mime_type: str
 
@@ -65,8 +109,27 @@ class SimpleImageProcessor:
         'xlarge': 2400
     }
     
-    def __init__(self, config: ImageConfig):
+    # Cloudinary eager transformations of the variants
+    EAGER_TRANSFORMATIONS = [
+        {'width': size, 'crop': 'limit', 'quality': 'auto', 'fetch_format': 'auto'}
+        for size in VARIANTS.values()
+    ]
+    VARIANT_TRANSFORMATIONS = [
+        f"w_{size},c_limit,q_auto,f_auto" for size in VARIANTS.values()
+    ]
+    
+    # Image types whose dominant color is worth decoding pixels for; logos,
+    # serial numbers and documents get none
+    COMPUTE_DOMINANT_COLOR_TYPES = {'primary', 'gallery'}
+    
+    def __init__(self, config: ImageConfig, extract_dominant_color: bool = True,
+                 eager_async: bool = True):
         self.config = config
+        self.extract_dominant_color = extract_dominant_color
+        # Asynchronous uploads return once the original is stored; Cloudinary
+        # renders the variants in the background
+        self.eager_async = eager_async
+        self.variant_base_url = f"https://res.cloudinary.com/{config.cloudinary_cloud_name}/image/upload"
         
         # Configure Cloudinary
         cloudinary.config(
@@ -75,14 +138,25 @@ class SimpleImageProcessor:
             api_secret=config.cloudinary_api_secret
         )
         
-        # Database connection
-        self.db_conn = psycopg2.connect(
-            host=config.db_host,
-            port=config.db_port,
-            database=config.db_name,
-            user=config.db_user,
-            password=config.db_password
+        # Database connection pool; each with-block commits on success and rolls back on error
+        self.db_pool = ConnectionPool(
+            make_conninfo(
+                host=config.db_host,
+                port=config.db_port,
+                dbname=config.db_name,
+                user=config.db_user,
+                password=config.db_password
+            ),
+            min_size=2,
+            max_size=10,
+            kwargs={'prepare_threshold': PREPARE_THRESHOLD if PREPARED_STATEMENTS else None},
+            open=False
         )
+        # Connect up front, so a bad database config fails before anything is uploaded
+        self.db_pool.open(wait=True)
+        
+        # Runs Cloudinary uploads alongside local metadata extraction
+        self.upload_pool = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
     
     def upload_image(self, 
                     image_path: str,
@@ -107,27 +181,14 @@ class SimpleImageProcessor:
         Returns:
             ImageUploadResult with all URLs and metadata
         """
-        print(f"Processing image: {image_path}")
+        logger.info("Processing image: %s", image_path)
         
-        # Validate file exists
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Image file not found: {image_path}")
+        path, storage_path = self._prepare_upload(image_path, entity_type, entity_id, image_type)
         
-        # Load and process image
-        with open(image_path, 'rb') as f:
-            image_data = f.read()
-        
-        # Extract metadata
-        metadata = self._extract_metadata(image_data, image_path)
-        
-        # Generate storage path
-        image_hash = hashlib.sha256(image_data).hexdigest()[:16]
-        storage_path = f"guitars/{entity_type}/{entity_id}/{image_type}/{image_hash}"
-        
-        print(f"Uploading to Cloudinary: {storage_path}")
-        
-        # Upload to Cloudinary with variants
-        upload_result = self._upload_to_cloudinary(image_data, storage_path)
+        # Upload to Cloudinary with variants while the metadata is extracted here
+        upload_future = self.upload_pool.submit(self._upload_to_cloudinary, path, storage_path)
+        metadata = self._extract_metadata(path, image_type)
+        upload_result = upload_future.result()
         
         # Save to database
         image_id = self._save_to_database(
@@ -135,86 +196,104 @@ class SimpleImageProcessor:
             metadata, upload_result, uploaded_by
         )
         
-        # Ensure eager transformations exist
-        eager_urls = upload_result.get('eager', [])
-        if len(eager_urls) < 5:
-            raise ValueError("Cloudinary upload failed to generate all required variants")
+        return self._build_result(image_id, metadata, upload_result)
+    
+    def upload_images_batch(self, items: List[Dict]) -> List[ImageUploadResult]:
+        """
+        Upload several images concurrently, then save them to the database
+        
+        Args:
+            items: upload_image keyword arguments for each image
+            
+        Returns:
+            ImageUploadResult for each item, in the same order
+        """
+        def process(item: Dict) -> Tuple[Dict, Dict]:
+            logger.info("Processing image: %s", item['image_path'])
+            path, storage_path = self._prepare_upload(
+                item['image_path'], item['entity_type'], item['entity_id'],
+                item.get('image_type', 'primary')
+            )
+            metadata = self._extract_metadata(path, item.get('image_type', 'primary'))
+            return metadata, self._upload_to_cloudinary(path, storage_path)
+        
+        # Each worker extracts its metadata while the other workers' uploads are in flight
+        processed = list(self.upload_pool.map(process, items))
+        
+        image_ids = self._save_batch_to_database(items, processed)
+        return [self._build_result(image_id, metadata, upload_result)
+                for image_id, (metadata, upload_result) in zip(image_ids, processed)]
+    
+    def _prepare_upload(self, image_path: str, entity_type: str, entity_id: str,
+                        image_type: str) -> Tuple[Path, str]:
+        """Validate the image file and derive its storage path from its content hash"""
+        # Validate file exists
+        path = Path(image_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+        
+        # Generate storage path, hashing the file in buffered blocks
+        with open(path, 'rb') as f:
+            image_hash = hashlib.file_digest(f, 'sha256').hexdigest()[:16]
+        storage_path = f"guitars/{entity_type}/{entity_id}/{image_type}/{image_hash}"
+        
+        logger.info("Uploading to Cloudinary: %s", storage_path)
+        return path, storage_path
+    
+    def _build_result(self, image_id: str, metadata: Dict, upload_result: Dict) -> ImageUploadResult:
+        """Combine the saved image's id, metadata and Cloudinary URLs"""
+        variant_urls = self._variant_urls(upload_result)
         
         return ImageUploadResult(
             image_id=image_id,
             storage_key=upload_result['public_id'],
             original_url=upload_result['secure_url'],
-            thumbnail_url=eager_urls[0]['secure_url'],
-            small_url=eager_urls[1]['secure_url'],
-            medium_url=eager_urls[2]['secure_url'],
-            large_url=eager_urls[3]['secure_url'],
-            xlarge_url=eager_urls[4]['secure_url'],
-            width=metadata['width'],
-            height=metadata['height'],
+            thumbnail_url=variant_urls[0],
+            small_url=variant_urls[1],
+            medium_url=variant_urls[2],
+            large_url=variant_urls[3],
+            xlarge_url=variant_urls[4],
+            width=upload_result['width'],
+            height=upload_result['height'],
             aspect_ratio=metadata['aspect_ratio'],
             dominant_color=metadata['dominant_color'],
-            file_size=metadata['file_size'],
+            file_size=upload_result['bytes'],
             mime_type=metadata['mime_type']
         )
     
-    def _extract_metadata(self, image_data: bytes, image_path: str) -> Dict:
-        """Extract metadata from image"""
-        img = Image.open(io.BytesIO(image_data))
-        
-        # Basic dimensions
-        width, height = img.size
-        aspect_ratio = round(width / height, 3)
-        
-        # Dominant color
-        dominant_color = self._get_dominant_color(img)
-        
-        # File info
-        file_size = len(image_data)
-        mime_type = Image.MIME.get(img.format, 'image/jpeg')
+    def _extract_metadata(self, image_path: Path, image_type: str) -> Dict:
+        """Extract metadata from image; pixels are only decoded for the dominant color"""
+        with Image.open(image_path) as img:
+            # Basic dimensions
+            width, height = img.size
+            aspect_ratio = round(width / height, 3)
+            
+            # Dominant color
+            dominant_color = None
+            if self.extract_dominant_color and image_type in self.COMPUTE_DOMINANT_COLOR_TYPES:
+                # Let the JPEG decoder scale down while decoding; the color only needs a thumbnail
+                img.draft('RGB', (256, 256))
+                dominant_color = get_dominant_color(img)
+            
+            # File info
+            mime_type = Image.MIME.get(img.format, 'image/jpeg')
         
         return {
             'width': width,
             'height': height,
             'aspect_ratio': aspect_ratio,
             'dominant_color': dominant_color,
-            'file_size': file_size,
             'mime_type': mime_type,
-            'original_filename': os.path.basename(image_path)
+            'original_filename': image_path.name
         }
     
-    def _get_dominant_color(self, img: Image.Image) -> str:
-        """Extract dominant color as hex"""
-        # Resize for faster processing
-        img_small = img.resize((150, 150))
-        
-        # Convert to RGB if necessary
-        if img_small.mode != 'RGB':
-            img_small = img_small.convert('RGB')
-        
-        # Get colors
-        colors = img_small.getcolors(150 * 150)
-        if not colors:
-            return '#000000'
-        
-        # Find most common color
-        most_common = max(colors, key=lambda x: x[0])
-        rgb = most_common[1]
-        
-        # Convert to hex
-        return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-    
-    def _upload_to_cloudinary(self, image_data: bytes, storage_path: str) -> Dict:
-        """Upload image to Cloudinary with eager transformations"""
-        eager_transformations = [
-            {'width': size, 'crop': 'limit', 'quality': 'auto', 'fetch_format': 'auto'}
-            for size in self.VARIANTS.values()
-        ]
-        
+    def _upload_to_cloudinary(self, image_path: Path, storage_path: str) -> Dict:
+        """Upload image to Cloudinary with eager transformations (the SDK reads the file)"""
         result = cloudinary.uploader.upload(
-            image_data,
+            self._downscale_for_upload(image_path),
             public_id=storage_path,
-            eager=eager_transformations,
-            eager_async=False,  # Wait for transformations to complete
+            eager=self.EAGER_TRANSFORMATIONS,
+            eager_async=self.eager_async,
             overwrite=False,
             resource_type='image',
             tags=['string_authority'],
@@ -226,71 +305,124 @@ class SimpleImageProcessor:
         
         return result
     
+    def _variant_urls(self, upload_result: Dict) -> List[str]:
+        """Return the variant URLs of an upload, smallest first"""
+        if not self.eager_async:
+            # Synchronous uploads return the rendered variants; ensure they all exist
+            eager_urls = upload_result.get('eager', [])
+            if len(eager_urls) < len(self.VARIANTS):
+                raise ValueError("Cloudinary upload failed to generate all required variants")
+            return [eager['secure_url'] for eager in eager_urls]
+        
+        # Variants still rendering are addressed by their transformation
+        return [f"{self.variant_base_url}/{transformation}/{upload_result['public_id']}"
+                for transformation in self.VARIANT_TRANSFORMATIONS]
+    
+    def _downscale_for_upload(self, image_path: Path) -> Union[Path, bytes]:
+        """Return the image to upload, re-encoded smaller if it exceeds UPLOAD_MAX_DIMENSION"""
+        with Image.open(image_path) as img:
+            if max(img.size) <= UPLOAD_MAX_DIMENSION:
+                return image_path
+            
+            # thumbnail() lets the JPEG decoder scale down while decoding
+            image_format = img.format
+            img.thumbnail((UPLOAD_MAX_DIMENSION, UPLOAD_MAX_DIMENSION), Image.LANCZOS)
+            
+            # Keep the orientation and color profile of the original
+            buffer = io.BytesIO()
+            img.save(buffer, format=image_format, quality=UPLOAD_QUALITY,
+                     exif=img.info.get('exif', b''), icc_profile=img.info.get('icc_profile'))
+        
+        return buffer.getvalue()
+    
     def _save_to_database(self, entity_type: str, entity_id: str, image_type: str,
                          is_primary: bool, caption: Optional[str], metadata: Dict,
                          upload_result: Dict, uploaded_by: Optional[str]) -> str:
         """Save image metadata to database"""
-        
-        # If setting as primary, unset any existing primary
-        if is_primary:
-            with self.db_conn.cursor() as cursor:
+        # Statements are pipelined, so they are sent without waiting on each other
+        with self.db_pool.connection() as conn, conn.pipeline(), conn.cursor() as cursor:
+            # If setting as primary, unset any existing primary
+            if is_primary:
                 cursor.execute("""
                     UPDATE images 
                     SET is_primary = FALSE 
                     WHERE entity_type = %s AND entity_id = %s AND is_primary = TRUE
                 """, (entity_type, entity_id))
+            
+            # Insert image record, numbered after the entity's other images
+            cursor.execute(INSERT_IMAGE_SQL, self._image_values(
+                entity_type, entity_id, image_type, is_primary, caption,
+                metadata, upload_result, uploaded_by
+            ), prepare=True)
+            
+            # psycopg returns uuid.UUID; callers use the id as a string
+            return str(cursor.fetchone()[0])
+    
+    def _save_batch_to_database(self, items: List[Dict], processed: List[Tuple[Dict, Dict]]) -> List[str]:
+        """
+        Save the images of a batch in one transaction
         
-        # Get next display order
-        with self.db_conn.cursor() as cursor:
-            cursor.execute("""
-                SELECT COALESCE(MAX(display_order), 0) + 1 
-                FROM images 
-                WHERE entity_type = %s AND entity_id = %s
-            """, (entity_type, entity_id))
-            display_order = cursor.fetchone()[0]
-        
-        # Get eager URLs from upload result
-        eager_urls = upload_result.get('eager', [])
-        if len(eager_urls) < 5:
-            raise ValueError("Cloudinary upload failed to generate all required variants")
-        
-        # Insert image record
-        with self.db_conn.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO images (
-                    entity_type, entity_id, image_type, is_primary, display_order, caption,
-                    storage_provider, storage_key, original_url,
-                    thumbnail_url, small_url, medium_url, large_url, xlarge_url,
-                    original_filename, mime_type, file_size_bytes, width, height,
-                    aspect_ratio, dominant_color, uploaded_by, validation_status,
-                    tags, description
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s,
-                    'cloudinary', %s, %s,
-                    %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s,
-                    %s, %s, %s, 'approved',
-                    %s, %s
-                ) RETURNING id
-            """, (
-                entity_type, entity_id, image_type, is_primary, display_order, caption,
-                upload_result['public_id'], upload_result['secure_url'],
-                eager_urls[0]['secure_url'],
-                eager_urls[1]['secure_url'],
-                eager_urls[2]['secure_url'],
-                eager_urls[3]['secure_url'],
-                eager_urls[4]['secure_url'],
-                metadata['original_filename'], metadata['mime_type'], metadata['file_size'],
-                metadata['width'], metadata['height'],
-                metadata['aspect_ratio'], metadata['dominant_color'], uploaded_by,
-                ['string_authority', entity_type, image_type],
-                f"Uploaded via SimpleImageProcessor at {datetime.now(timezone.utc).isoformat()}"
-            ))
+        An entity's existing primary image is unset once for the whole batch,
+        and the images are numbered after each entity's current last image.
+        
+        Args:
+            items: upload_image keyword arguments for each image
+            processed: (metadata, Cloudinary upload result) for each item
             
-            image_id = cursor.fetchone()[0]
-            self.db_conn.commit()
+        Returns:
+            Image id for each item, in the same order
+        """
+        entity_keys = [(item['entity_type'], str(item['entity_id'])) for item in items]
+        
+        # Like successive single saves, the last primary image of an entity wins
+        last_primary = {key: index for index, (key, item) in enumerate(zip(entity_keys, items))
+                        if item.get('is_primary', False)}
+        
+        with self.db_pool.connection() as conn, conn.cursor() as cursor:
+            if last_primary:
+                primary_types, primary_ids = zip(*last_primary)
+                cursor.execute("""
+                    UPDATE images 
+                    SET is_primary = FALSE 
+                    WHERE (entity_type, entity_id) IN (
+                        SELECT * FROM unnest(%s::varchar[], %s::uuid[])
+                    ) AND is_primary = TRUE
+                """, (list(primary_types), list(primary_ids)))
             
-            return image_id
+            rows = [
+                self._image_values(
+                    item['entity_type'], item['entity_id'], item.get('image_type', 'primary'),
+                    last_primary.get(key) == index, item.get('caption'),
+                    metadata, upload_result, item.get('uploaded_by')
+                )
+                for index, (key, item, (metadata, upload_result)) in enumerate(zip(entity_keys, items, processed))
+            ]
+            
+            # executemany pipelines the inserts, sending them in one round trip
+            cursor.executemany(INSERT_IMAGE_SQL, rows, returning=True)
+            image_ids = []
+            while True:
+                image_ids.append(str(cursor.fetchone()[0]))
+                if not cursor.nextset():
+                    break
+            return image_ids
+    
+    def _image_values(self, entity_type: str, entity_id: str, image_type: str,
+                      is_primary: bool, caption: Optional[str],
+                      metadata: Dict, upload_result: Dict, uploaded_by: Optional[str]) -> Tuple:
+        """Build the INSERT_IMAGE_SQL parameters of an image"""
+        return (
+            entity_type, entity_id, image_type, is_primary,
+            entity_type, entity_id, caption,
+            upload_result['public_id'], upload_result['secure_url'],
+            *self._variant_urls(upload_result),
+            # Size and dimensions of the stored asset, which may have been downscaled for upload
+            metadata['original_filename'], metadata['mime_type'], upload_result['bytes'],
+            upload_result['width'], upload_result['height'],
+            metadata['aspect_ratio'], metadata['dominant_color'], uploaded_by,
+            ['string_authority', entity_type, image_type],
+            f"Uploaded via SimpleImageProcessor at {datetime.now(timezone.utc).isoformat()}"
+        )
     
     def create_duplicate(self, original_image_id: str, target_entity_type: str,
                         target_entity_id: str, image_type: str = 'gallery',
@@ -298,38 +430,96 @@ class SimpleImageProcessor:
                         duplicate_reason: Optional[str] = None) -> str:
         """Create a duplicate image for another entity"""
         
-        with self.db_conn.cursor() as cursor:
-            cursor.execute("""
+        with self.db_pool.connection() as conn:
+            cursor = conn.execute("""
                 SELECT create_image_duplicate(%s, %s, %s, %s, %s, %s, %s)
             """, (original_image_id, target_entity_type, target_entity_id, 
                   image_type, is_primary, caption, duplicate_reason))
             
-            duplicate_id = cursor.fetchone()[0]
-            self.db_conn.commit()
+            return str(cursor.fetchone()[0])
+    
+    def create_duplicates(self, specs: List[Tuple]) -> List[str]:
+        """
+        Create several duplicate images in one transaction
+        
+        Args:
+            specs: create_duplicate arguments for each duplicate, in order
+                (original_image_id, target_entity_type, target_entity_id,
+                image_type, is_primary, caption, duplicate_reason)
+            
+        Returns:
+            Duplicate image id for each spec, in the same order
+        """
+        if not specs:
+            return []
+        
+        # executemany pipelines the calls, sending them in one round trip
+        with self.db_pool.connection() as conn, conn.cursor() as cursor:
+            cursor.executemany("""
+                SELECT create_image_duplicate(%s, %s, %s, %s, %s, %s, %s)
+            """, specs, returning=True)
             
-            return duplicate_id
+            duplicate_ids = []
+            while True:
+                duplicate_ids.append(str(cursor.fetchone()[0]))
+                if not cursor.nextset():
+                    break
+            return duplicate_ids
     
     def list_entity_images(self, entity_type: str, entity_id: str) -> list:
         """List all images for an entity"""
-        with self.db_conn.cursor() as cursor:
-            cursor.execute("""
+        with self.db_pool.connection() as conn:
+            cursor = conn.execute("""
                 SELECT * FROM get_entity_images(%s, %s)
             """, (entity_type, entity_id))
             
             return cursor.fetchall()
     
+    def list_entity_images_many(self, entities: List[Tuple[str, str]]) -> Dict[Tuple[str, str], list]:
+        """
+        List the images of several entities with one query
+        
+        Args:
+            entities: (entity_type, entity_id) pairs
+            
+        Returns:
+            Rows as list_entity_images returns them, for each pair
+        """
+        images = {(entity_type, str(entity_id)): [] for entity_type, entity_id in entities}
+        if not images:
+            return images
+        
+        entity_types, entity_ids = zip(*images)
+        with self.db_pool.connection() as conn:
+            cursor = conn.execute("""
+                SELECT e.entity_type, e.entity_id::text,
+                       g.image_id, g.image_type, g.display_order, g.urls, g.metadata, g.source
+                FROM unnest(%s::varchar[], %s::uuid[]) AS e(entity_type, entity_id)
+                CROSS JOIN LATERAL get_entity_images(e.entity_type, e.entity_id)
+                    WITH ORDINALITY AS g(image_id, image_type, display_order, urls, metadata, source, position)
+                ORDER BY e.entity_type, e.entity_id, g.position
+            """, (list(entity_types), list(entity_ids)))
+            
+            for entity_type, entity_id, *row in cursor:
+                images[(entity_type, entity_id)].append(tuple(row))
+        return images
+    
     def close(self):
-        """Close database connection"""
-        if self.db_conn:
-            self.db_conn.close()
+        """Close database connections"""
+        self.upload_pool.shutdown()
+        self.db_pool.close()
+
+@lru_cache(maxsize=4)
+def _read_json(path: str, mtime_ns: int) -> Dict:
+    """Parse a JSON config file; keyed on its mtime so edits are picked up"""
+    return orjson.loads(Path(path).read_bytes())
 
 def load_config(cloudinary_config_path: str = "cloudinary_config.json", db_config_path: str = "db_config.json") -> ImageConfig:
     """Load configuration from files"""
     
     # Load Cloudinary config
     if os.path.exists(cloudinary_config_path):
-        with open(cloudinary_config_path, 'r') as f:
-            cloudinary_config = json.load(f)
+        cloudinary_config = _read_json(cloudinary_config_path, os.stat(cloudinary_config_path).st_mtime_ns)
     else:
         # Create template Cloudinary config file
         template_config = {
@@ -338,8 +528,8 @@ def load_config(cloudinary_config_path: str = "cloudinary_config.json", db_confi
             "cloudinary_api_secret": "your_api_secret"
         }
         
-        with open(cloudinary_config_path, 'w') as f:
-            json.dump(template_config, f, indent=2)
+        with open(cloudinary_config_path, 'wb') as f:
+            f.write(orjson.dumps(template_config, option=orjson.OPT_INDENT_2))
         
         print(f"Created template Cloudinary config file: {cloudinary_config_path}")
         print("Please edit it with your Cloudinary credentials and run again.")
@@ -347,8 +537,7 @@ def load_config(cloudinary_config_path: str = "cloudinary_config.json", db_confi
     
     # Load database config
     if os.path.exists(db_config_path):
-        with open(db_config_path, 'r') as f:
-            db_config = json.load(f)
+        db_config = _read_json(db_config_path, os.stat(db_config_path).st_mtime_ns)
     else:
         print(f"Database config file not found: {db_config_path}")
         sys.exit(1)
@@ -367,6 +556,16 @@ def load_config(cloudinary_config_path: str = "cloudinary_config.json", db_confi
     
     return ImageConfig(**config_data)
 
+@lru_cache(maxsize=4)
+def get_processor(cloudinary_config_path: str = "cloudinary_config.json", db_config_path: str = "db_config.json") -> SimpleImageProcessor:
+    """
+    Get a processor shared by every caller using the same config files
+    
+    Long-running workers that upload repeatedly reuse its connection pool
+    instead of reconnecting per upload, so callers must not close it.
+    """
+    return SimpleImageProcessor(load_config(cloudinary_config_path, db_config_path))
+
 def main():
     parser = argparse.ArgumentParser(description="Upload images to String Authority database")
     parser.add_argument("image_path", help="Path to image file")
@@ -379,14 +578,21 @@ def main():
     parser.add_argument("--db-config", default="db_config.json", help="Database config file path")
     parser.add_argument("--create-duplicate", help="Create duplicate for another entity (format: entity_type:entity_id)")
     parser.add_argument("--duplicate-reason", help="Reason for duplicate")
+    parser.add_argument("--sync", action="store_true", help="Wait for Cloudinary to render the image variants")
+    parser.add_argument("--skip-color", action="store_true", help="Do not compute the dominant color")
+    parser.add_argument("--verbose", action="store_true", help="Show upload progress")
     
     args = parser.parse_args()
     
+    # Progress messages are only formatted and written when asked for
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(message)s')
+    
     # Load configuration
     config = load_config(args.cloudinary_config, args.db_config)
     
     # Initialize processor
-    processor = SimpleImageProcessor(config)
+    processor = SimpleImageProcessor(config, extract_dominant_color=not args.skip_color,
+                                     eager_async=not args.sync)
     
     try:
         # Upload image
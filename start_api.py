@@ -4,15 +4,20 @@
 Startup script for the String Authority database search API.
 """
 
+import argparse
 import sys
 import os
-from pathlib import Path
-
-# Add current directory to path
-sys.path.append(str(Path(__file__).parent))
 
 def main():
     """Start the API server."""
+    parser = argparse.ArgumentParser(description="Start the String Authority database search API")
+    parser.add_argument("--dev", action="store_true",
+                        help="Run with the debugger and auto-reloader (also enabled by FLASK_DEBUG=1)")
+    args = parser.parse_args()
+    # The debugger and reloader are for local development only; production
+    # serves api.wsgi:app from gunicorn (see api/README.md)
+    dev = args.dev or os.environ.get('FLASK_DEBUG') == '1'
+    
     try:
         from api.app import create_app
         
@@ -33,10 +38,10 @@ def main():
         
         # Start the server
         app.run(
-            debug=True,
+            debug=dev,
             host='0.0.0.0',
             port=port,
-            use_reloader=True
+            use_reloader=dev
         )
         
     except KeyboardInterrupt:
@@ -6,10 +6,6 @@ Simple test script for the String Authority Database Search API endpoints.
 
 import sys
 import os
-from pathlib import Path
-
-# Add API directory to path
-sys.path.append(str(Path(__file__).parent))
 
 def test_basic_import():
     """Test that all modules can be imported without errors."""
@@ -0,0 +1,53 @@
+"""
+Unit tests for database-free helpers of the guitar data processor and its CLI.
+"""
+
+import json
+from difflib import SequenceMatcher
+
+import pytest
+
+ums = pytest.importorskip('uniqueness_management_system')
+cli = pytest.importorskip('guitar_processor_cli')
+
+NAMES = ['gibson', 'gibson guitar corporation', 'fender', 'gretsch', 'epiphone', 'g', '']
+
+def test_similarity_bounds_are_upper_bounds_of_ratio():
+    """Candidates are only skipped when their bound rules them out, so a bound must never undershoot."""
+    validator = ums.GuitarDataValidator.__new__(ums.GuitarDataValidator)
+    candidates = validator._match_candidates([(index, name) for index, name in enumerate(NAMES)])
+
+    for name in NAMES:
+        bounds = validator.similarity_bounds(validator.normalize_string(name), candidates)
+        assert len(bounds) == len(NAMES)
+        for bound, candidate in zip(bounds, candidates.names):
+            ratio = SequenceMatcher(None, validator.normalize_string(name), candidate).ratio()
+            assert bound >= ratio - 1e-9
+
+def test_similarity_bounds_of_identical_name():
+    validator = ums.GuitarDataValidator.__new__(ums.GuitarDataValidator)
+    candidates = validator._match_candidates([(1, 'Gibson'), (2, 'Fender')])
+    bounds = validator.similarity_bounds(validator.normalize_string('GIBSON'), candidates)
+    assert bounds[0] == pytest.approx(1.0)
+    assert bounds[1] < 0.7
+
+def test_load_json_stream_yields_array_items(tmp_path):
+    items = [{'manufacturer': {'name': 'Gibson', 'founded_year': 1902}},
+             {'model': {'name': 'SG', 'msrp_original': 1299.99}}]
+    path = tmp_path / 'batch.json'
+    path.write_text(json.dumps(items))
+
+    loaded = list(cli.GuitarProcessorCLI({}).load_json_stream(str(path)))
+    assert loaded == items
+    # Numbers come back as plain floats, not ijson's Decimal
+    assert type(loaded[1]['model']['msrp_original']) is float
+
+def test_load_json_stream_is_lazy(tmp_path):
+    path = tmp_path / 'batch.json'
+    path.write_text('[{"n": 1}, {"n": 2}, not json')
+
+    stream = cli.GuitarProcessorCLI({}).load_json_stream(str(path))
+    assert next(stream) == {'n': 1}
+    assert next(stream) == {'n': 2}
+    with pytest.raises(Exception):
+        next(stream)
@@ -0,0 +1,64 @@
+"""
+Unit tests for the query parameter models of the String Authority Database Search API.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from api.models.search_queries import InstrumentSearchQuery, ModelSearchQuery, validation_error_message
+from api.search.utils import encode_cursor
+
+def error_message(query_model, args, default_page_size=10, max_page_size=50):
+    """Message of the 400 response the arguments would get."""
+    with pytest.raises(ValidationError) as error:
+        query_model.from_args(args, default_page_size, max_page_size)
+    return validation_error_message(error.value)
+
+def test_model_search_defaults():
+    query = ModelSearchQuery.from_args({'model_name': ' Les Paul '}, 10, 50)
+    assert query.model_name == 'Les Paul'
+    assert (query.page, query.page_size, query.cursor, query.include_totals) == (1, 10, None, False)
+
+def test_model_search_parses_arguments():
+    args = {'model_name': 'SG', 'manufacturer_name': 'Gibson', 'year': '1961', 'page': '2',
+            'page_size': '25', 'include_totals': 'true', 'cursor': encode_cursor([1, -1961, 'SG', 'x'])}
+    query = ModelSearchQuery.from_args(args, 10, 50)
+    assert (query.year, query.page, query.page_size, query.include_totals) == (1961, 2, 25, True)
+    assert query.cursor == [1, -1961, 'SG', 'x']
+
+def test_empty_arguments_are_ignored():
+    query = ModelSearchQuery.from_args({'model_name': 'SG', 'year': '', 'cursor': None}, 10, 50)
+    assert query.year is None and query.cursor is None
+
+@pytest.mark.parametrize('args, message', [
+    ({}, 'model_name parameter is required'),
+    ({'model_name': '   '}, 'model_name parameter is required'),
+    ({'model_name': 'SG', 'page': '0'}, 'Page number must be >= 1'),
+    ({'model_name': 'SG', 'page': 'two'}, 'Invalid numeric parameter format'),
+    ({'model_name': 'SG', 'page_size': '51'}, 'Page size must be between 1 and 50'),
+    ({'model_name': 'SG', 'page_size': '2.5'}, 'Invalid numeric parameter format'),
+    ({'model_name': 'SG', 'year': '1850'}, 'Year must be between 1900 and 2030'),
+    ({'model_name': 'SG', 'include_totals': 'maybe'}, 'include_totals must be true or false'),
+    ({'model_name': 'SG', 'cursor': 'garbage!'}, 'Invalid cursor'),
+])
+def test_model_search_rejects(args, message):
+    assert error_message(ModelSearchQuery, args) == message
+
+def test_instrument_search_serial():
+    query = InstrumentSearchQuery.from_args({'serial_number': '9-0824'}, 10, 50)
+    assert query.serial_number == '9-0824' and not query.unknown_serial
+
+def test_instrument_search_unknown_serial():
+    args = {'unknown_serial': 'true', 'model_name': 'Les Paul', 'year_estimate': '1959'}
+    query = InstrumentSearchQuery.from_args(args, 10, 50)
+    assert query.unknown_serial is True and query.year_estimate == 1959
+
+@pytest.mark.parametrize('args, message', [
+    ({}, 'Either serial_number or unknown_serial must be provided'),
+    ({'unknown_serial': 'false', 'model_name': 'SG'}, 'Either serial_number or unknown_serial must be provided'),
+    ({'unknown_serial': 'true'}, 'For unknown_serial search, model_name or manufacturer_name must be provided'),
+    ({'serial_number': '1', 'year_estimate': '2040'}, 'Year estimate must be between 1900 and 2030'),
+    ({'serial_number': '1', 'unknown_serial': 'perhaps'}, 'unknown_serial must be true or false'),
+])
+def test_instrument_search_rejects(args, message):
+    assert error_message(InstrumentSearchQuery, args) == message
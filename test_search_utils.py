@@ -0,0 +1,88 @@
+"""
+Unit tests for the keyset pagination helpers of the String Authority Database Search API.
+
+These only exercise pure functions, so they run without a database.
+"""
+
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from api.search.utils import (
+    compile_paginated_query,
+    cursor_value,
+    decode_cursor,
+    encode_cursor,
+    next_page_cursor,
+    paginated_query_params,
+)
+
+ROW_ID = UUID('0190a5b2-7c1e-7d3a-9f00-1234567890ab')
+KEY_TYPES = (int, bool, Decimal, str, UUID)
+
+def test_cursor_round_trip():
+    """Sort key values survive encoding; Decimal and UUID come back as strings."""
+    cursor = encode_cursor([1, False, Decimal('-1500.00'), 'Les Paul', ROW_ID])
+    assert decode_cursor(cursor) == [1, False, '-1500.00', 'Les Paul', str(ROW_ID)]
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(['??>>??', 'ÿÿÿ'])
+    assert all(c.isalnum() or c in '-_=' for c in cursor)
+
+@pytest.mark.parametrize('cursor', ['not base64!', encode_cursor([]), encode_cursor({'k': 1}), encode_cursor(3)])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+def test_paginated_query_params_offset_mode():
+    assert paginated_query_params(KEY_TYPES, page=3, page_size=20) == (20, 40)
+
+def test_paginated_query_params_parses_cursor_values():
+    cursor = decode_cursor(encode_cursor([2, True, Decimal('0'), 'A-1', ROW_ID]))
+    assert paginated_query_params(KEY_TYPES, 1, 10, cursor) == (2, True, Decimal('0'), 'A-1', ROW_ID, 10)
+
+@pytest.mark.parametrize('cursor', [
+    [2, True, '0', 'A-1'],                       # too short
+    [2, True, '0', 'A-1', str(ROW_ID), 1],       # too long
+    ['2', True, '0', 'A-1', str(ROW_ID)],        # string in an int slot
+    [True, True, '0', 'A-1', str(ROW_ID)],       # bool in an int slot
+    [2, 1, '0', 'A-1', str(ROW_ID)],             # int in a bool slot
+    [2, True, 'abc', 'A-1', str(ROW_ID)],        # not a number
+    [2, True, 'NaN', 'A-1', str(ROW_ID)],        # not finite
+    [2, True, 0, 'A-1', str(ROW_ID)],            # Decimal keys are encoded as strings
+    [2, True, '0', 5, str(ROW_ID)],              # number in a text slot
+    [2, True, '0', 'A-1', 'not-a-uuid'],
+])
+def test_paginated_query_params_rejects_tampered_cursor(cursor):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        paginated_query_params(KEY_TYPES, 1, 10, cursor)
+
+def test_cursor_value_accepts_matching_types():
+    assert cursor_value(int, 7) == 7
+    assert cursor_value(str, '') == ''
+    assert cursor_value(Decimal, '12.50') == Decimal('12.50')
+    assert cursor_value(UUID, str(ROW_ID)) == ROW_ID
+
+def test_compile_paginated_query_offset_and_keyset():
+    sort_keys = ('m.year', 'm.id')
+    offset_query = compile_paginated_query('m.id', 'FROM models m', '', sort_keys, False)
+    keyset_query = compile_paginated_query('m.id', 'FROM models m', '', sort_keys, True, include_total=False)
+
+    assert 'm.year AS __k0, m.id AS __k1' in offset_query
+    assert 'COUNT(*) OVER () AS __total' in offset_query
+    assert offset_query.endswith('ORDER BY __k0, __k1 LIMIT %s OFFSET %s')
+
+    assert '__total' not in keyset_query
+    assert 'WHERE (__k0, __k1) > (%s, %s)' in keyset_query
+    assert keyset_query.endswith('ORDER BY __k0, __k1 LIMIT %s')
+    # One placeholder per cursor value plus the LIMIT
+    assert keyset_query.count('%s') == len(paginated_query_params((int, UUID), 1, 10, [1, str(ROW_ID)]))
+
+def test_next_page_cursor():
+    last_row_keys = {'__k0': 1, '__k1': ROW_ID, '__total': 30}
+    assert next_page_cursor(9, last_row_keys, page_size=10, key_count=2) is None
+
+    cursor = next_page_cursor(10, last_row_keys, page_size=10, key_count=2)
+    assert decode_cursor(cursor) == [1, str(ROW_ID)]
+    assert paginated_query_params((int, UUID), 1, 10, decode_cursor(cursor)) == (1, ROW_ID, 10)
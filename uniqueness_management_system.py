@@ -17,20 +17,28 @@
 # String Authority Database Uniqueness Management System
 # JSON Schema + Python Pre-Insert Validation Approach
 
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 import difflib
 from datetime import datetime
 import uuid
 import psycopg2
-from psycopg2.extras import RealDictCursor
-import jsonschema
+from psycopg2.extras import RealDictCursor, execute_values
+import fastjsonschema
 from difflib import SequenceMatcher
+from functools import lru_cache
+import numpy as np
+from rapidfuzz import fuzz, process
 from guitar_registry_shared_models.validation import validate_individual_components
 from pydantic import ValidationError
 import importlib.metadata
+import reprlib
+import csv
+import io
+import heapq
+from collections import Counter
 
 class MatchLevel(Enum):
     EXACT = "exact"
@@ -44,8 +52,9 @@ class ConflictResolution(Enum):
     KEEP_EXISTING = "keep_existing"
     MANUAL_REVIEW = "manual_review"
 
+@lru_cache(maxsize=1)
 def get_created_by_info():
-    """Get the created_by string for records added by the guitar processor."""
+    """Get the created_by string for records added by the guitar processor, looked up once per process."""
     try:
         version = importlib.metadata.version('gtr-reg')
         return f"guitar_processor_cli_v{version}"
@@ -105,6 +114,82 @@ SPECIFICATIONS_SCHEMA = {
     "additionalProperties": False
 }
 
+# Columns of a specifications row, in insert order
+SPECIFICATION_COLUMNS = (
+    'model_id', 'individual_guitar_id', 'body_wood', 'neck_wood', 'fingerboard_wood',
+    'scale_length_inches', 'num_frets', 'nut_width_inches', 'neck_profile', 'bridge_type',
+    'pickup_configuration', 'electronics_description',
+    'hardware_finish', 'body_finish', 'weight_lbs', 'case_included', 'case_type'
+)
+# The SPECIFICATION_COLUMNS taken from the submitted specification
+SPECIFICATION_FIELDS = SPECIFICATION_COLUMNS[2:]
+
+# Specification lists at least this long are loaded with COPY
+SPECIFICATION_COPY_THRESHOLD = 500
+
+# Batches at least this long commit without waiting for the WAL flush
+ASYNC_COMMIT_BATCH_SIZE = 100
+
+# Fields merged into existing rows; a field missing from the submission keeps its value
+MANUFACTURER_UPDATE_FIELDS = ('display_name', 'country', 'founded_year', 'website', 'status', 'notes')
+MODEL_UPDATE_FIELDS = (
+    'production_start_date', 'production_end_date', 'estimated_production_quantity',
+    'msrp_original', 'currency', 'description'
+)
+GUITAR_UPDATE_FIELDS = (
+    'model_id', 'manufacturer_name_fallback', 'model_name_fallback', 'year_estimate', 'description',
+    'nickname', 'production_date', 'production_number', 'significance_notes',
+    'current_estimated_value', 'condition_rating', 'modifications', 'provenance_notes'
+)
+
+def merge_update_query(table: str, fields: Tuple[str, ...]) -> str:
+    """
+    UPDATE of a row by id that only overwrites the fields given a non-null value.
+    
+    The field values are passed twice, before and after the id. The row is
+    left alone, with no new row version written and updated_at unchanged,
+    when none of them differs from what it holds.
+    """
+    assignments = ', '.join(f"{field} = COALESCE(%s, {field})" for field in fields)
+    changes = ' OR '.join(f"COALESCE(%s, {field}) IS DISTINCT FROM {field}" for field in fields)
+    return f"""
+        UPDATE {table}
+        SET {assignments}, updated_at = CURRENT_TIMESTAMP
+        WHERE id = %s AND ({changes})
+    """
+
+# The merge updates have fixed text, so each is prepared once per session
+MANUFACTURER_UPDATE_QUERY = merge_update_query('manufacturers', MANUFACTURER_UPDATE_FIELDS)
+MODEL_UPDATE_QUERY = merge_update_query('models', MODEL_UPDATE_FIELDS)
+GUITAR_UPDATE_QUERY = merge_update_query('individual_guitars', GUITAR_UPDATE_FIELDS)
+
+# Columns of the match candidate rows, which are fetched as tuples
+MANUFACTURER_MATCH_COLUMNS = ('id', 'name', 'country', 'founded_year', 'status')
+MODEL_MATCH_COLUMNS = ('id', 'name', 'year', 'production_type', 'product_line_name', 'manufacturer_name')
+
+# Columns of a guitar matched by serial number and of the other guitar match candidates
+GUITAR_SERIAL_MATCH_COLUMNS = (
+    'id', 'serial_number', 'model_id', 'manufacturer_name_fallback',
+    'model_name_fallback', 'year_estimate', 'significance_level'
+)
+GUITAR_MATCH_COLUMNS = (
+    'id', 'serial_number', 'production_date', 'significance_level',
+    'manufacturer_name_fallback', 'model_name_fallback', 'year_estimate'
+)
+
+# Summary counter of each action a submission result reports
+ACTION_COUNTERS = {
+    "Manufacturer insert": "manufacturers_inserted",
+    "Manufacturer update": "manufacturers_updated",
+    "Model insert": "models_inserted",
+    "Model update": "models_updated",
+    "Guitar insert": "guitars_inserted",
+    "Guitar update": "guitars_updated"
+}
+
+# Previews of failed submissions only format their first few items
+SUBMISSION_PREVIEW = reprlib.Repr(maxlevel=3, maxdict=3, maxlist=3, maxstring=60, maxother=100)
+
 MODEL_SCHEMA = {
     "type": "object", 
     "properties": {
@@ -179,16 +264,255 @@ INDIVIDUAL_GUITAR_SCHEMA = {
     "additionalProperties": False
 }
 
+# Schemas compiled to plain Python functions once per process
+validate_model_schema = fastjsonschema.compile(MODEL_SCHEMA)
+
+# fastjsonschema tries anyOf branches by catching the error of each failing
+# one; the identification alternatives of a guitar only require keys, so
+# they are checked in Python after the rest of the schema
+GUITAR_IDENTIFICATION_FIELDS = tuple(tuple(branch['required']) for branch in INDIVIDUAL_GUITAR_SCHEMA['anyOf'])
+_validate_individual_guitar_fields = fastjsonschema.compile(
+    {key: value for key, value in INDIVIDUAL_GUITAR_SCHEMA.items() if key != 'anyOf'}
+)
 
+def validate_individual_guitar_schema(data: Dict):
+    """Validate data against INDIVIDUAL_GUITAR_SCHEMA, raising fastjsonschema.JsonSchemaException."""
+    _validate_individual_guitar_fields(data)
+    if not any(all(key in data for key in fields) for fields in GUITAR_IDENTIFICATION_FIELDS):
+        raise fastjsonschema.JsonSchemaValueException(
+            "data cannot be validated by any definition",
+            value=data, name="data", definition=INDIVIDUAL_GUITAR_SCHEMA, rule="anyOf"
+        )
+
+
+
+class PreparedStatements:
+    """
+    Server-side prepared statements for a psycopg2 connection.
+    
+    psycopg2 interpolates parameters client-side, so the server would parse and
+    plan every lookup and insert again for each submission of a batch. Named
+    statements are prepared on first use and run with EXECUTE afterwards;
+    prepared statements live for the whole session, across transactions.
+    """
+    
+    def __init__(self):
+        self._prepared = None
+    
+    def execute(self, cursor, name: str, query: str, params: Tuple = ()):
+        """Execute a named statement, preparing it on first use.
+        
+        Args:
+            cursor: Cursor of the connection the statement is prepared on
+            name: Statement name, unique per query text
+            query: Query with psycopg2 %s placeholders and no literal % signs
+            params: Query parameters
+        """
+        if self._prepared is None:
+            # Another processor on this connection may have prepared them already
+            cursor.execute("SELECT name FROM pg_prepared_statements")
+            self._prepared = {row['name'] if isinstance(row, dict) else row[0] for row in cursor.fetchall()}
+        
+        if name not in self._prepared:
+            # Turn the psycopg2 placeholders into positional parameters
+            parts = query.split('%s')
+            positional = parts[0] + ''.join(f"${idx}{part}" for idx, part in enumerate(parts[1:], start=1))
+            cursor.execute(f"PREPARE {name} AS {positional}")
+            self._prepared.add(name)
+        
+        if params:
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
 
+def best_matches(matches: List[Tuple[str, float, Dict]], limit: Optional[int] = None) -> List[Tuple[str, float, Dict]]:
+    """Matches by decreasing confidence, only the first limit of them when given."""
+    if limit is not None:
+        return heapq.nlargest(limit, matches, key=lambda x: x[1])
+    return sorted(matches, key=lambda x: x[1], reverse=True)
 
+@lru_cache(maxsize=4096)
+def normalized_similarity(a: str, b: str) -> float:
+    """SequenceMatcher ratio of two normalized strings, cached for names compared repeatedly."""
+    return SequenceMatcher(None, a, b).ratio()
+
+@dataclass
+class MatchCandidates:
+    """Candidate rows of a match lookup, with their names normalized for scoring."""
+    rows: List[Tuple]
+    names: List[str]
+
+@dataclass
+class BatchLookups:
+    """
+    Manufacturer and model lookups of a batch submission.
+    
+    They are fetched with one query each before the batch is processed;
+    lookups missing here fall back to a query and are kept for the rest of
+    the batch. The processor drops the entries its own writes make stale.
+    Names are matched case-insensitively, so they are keyed lowercased.
+    """
+    active_manufacturers: Optional[MatchCandidates] = None
+    manufacturer_ids: Dict[str, Optional[str]] = field(default_factory=dict)
+    manufacturer_models: Dict[str, MatchCandidates] = field(default_factory=dict)
+    model_ids: Dict[Tuple[str, str, int], Optional[str]] = field(default_factory=dict)
+    
+    def manufacturer_written(self, name: Optional[str] = None, manufacturer_id: Optional[str] = None):
+        """Forget lookups a manufacturer insert or update can change, recording an inserted one."""
+        self.active_manufacturers = None
+        self.manufacturer_ids = {key: known_id for key, known_id in self.manufacturer_ids.items()
+                                 if known_id is not None}
+        if name is not None:
+            self.manufacturer_ids[name.lower()] = manufacturer_id
+    
+    def model_inserted(self, manufacturer_id: str):
+        """Forget lookups a model insert can change."""
+        self.manufacturer_models.pop(manufacturer_id, None)
+        self.model_ids = {ref: model_id for ref, model_id in self.model_ids.items() if model_id is not None}
 
 class GuitarDataValidator:
-    def __init__(self, db_connection):
+    def __init__(self, db_connection, statements: Optional[PreparedStatements] = None):
         self.db = db_connection
         self.cursor = db_connection.cursor(cursor_factory=RealDictCursor)
+        self.statements = statements or PreparedStatements()
+        # Match candidates are scanned as plain tuples, most never become results
+        self.tuple_cursor = db_connection.cursor()
+        # Set by the processor while a batch submission is processed
+        self.prefetched: Optional[BatchLookups] = None
+    
+    def prefetch(self, submissions: List[Dict]) -> BatchLookups:
+        """
+        Fetch the manufacturer and model lookups of a batch submission up front.
         
-    def normalize_string(self, text: str) -> str:
+        Args:
+            submissions: Submissions of the batch, not validated yet
+            
+        Returns:
+            Lookups the validator serves until prefetched is reset
+        """
+        lookups = BatchLookups()
+        manufacturer_names = []
+        model_refs = []
+        for submission in submissions:
+            if not isinstance(submission, dict):
+                continue
+            model = submission.get('model')
+            if isinstance(model, dict) and isinstance(model.get('manufacturer_name'), str):
+                manufacturer_names.append(model['manufacturer_name'])
+            guitar = submission.get('individual_guitar')
+            model_ref = guitar.get('model_reference') if isinstance(guitar, dict) else None
+            if (isinstance(model_ref, dict) and isinstance(model_ref.get('manufacturer_name'), str)
+                    and isinstance(model_ref.get('model_name'), str) and type(model_ref.get('year')) is int):
+                model_refs.append((model_ref['manufacturer_name'], model_ref['model_name'], model_ref['year']))
+        
+        if any(isinstance(submission, dict) and 'manufacturer' in submission for submission in submissions):
+            lookups.active_manufacturers = self._active_manufacturers()
+        
+        manufacturer_names = list(dict.fromkeys(name.lower() for name in manufacturer_names))
+        if manufacturer_names:
+            self.cursor.execute("""
+                SELECT n.name,
+                       (SELECT id FROM manufacturers WHERE LOWER(name) = LOWER(n.name) LIMIT 1) AS id
+                FROM unnest(%s::text[]) AS n(name)
+            """, (manufacturer_names,))
+            lookups.manufacturer_ids = {row['name'].lower(): row['id'] for row in self.cursor.fetchall()}
+        
+        manufacturer_ids = list({manufacturer_id for manufacturer_id in lookups.manufacturer_ids.values()
+                                 if manufacturer_id is not None})
+        if manufacturer_ids:
+            self.tuple_cursor.execute("""
+                SELECT m.manufacturer_id, m.id, m.name, m.year, m.production_type,
+                       pl.name as product_line_name,
+                       mfr.name as manufacturer_name
+                FROM models m
+                JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
+                LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+                WHERE m.manufacturer_id = ANY(%s::uuid[])
+            """, (manufacturer_ids,))
+            models = {manufacturer_id: [] for manufacturer_id in manufacturer_ids}
+            for row in self.tuple_cursor.fetchall():
+                models[row[0]].append(row[1:])
+            lookups.manufacturer_models = {
+                manufacturer_id: self._match_candidates(rows) for manufacturer_id, rows in models.items()
+            }
+        
+        model_refs = list(dict.fromkeys(model_refs))
+        if model_refs:
+            manufacturers, models, years = zip(*model_refs)
+            self.cursor.execute("""
+                SELECT r.manufacturer_name, r.model_name, r.year,
+                       (SELECT m.id
+                        FROM models m
+                        JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
+                        WHERE LOWER(mfr.name) = LOWER(r.manufacturer_name)
+                        AND LOWER(m.name) = LOWER(r.model_name)
+                        AND m.year = r.year
+                        LIMIT 1) AS id
+                FROM unnest(%s::text[], %s::text[], %s::int[]) AS r(manufacturer_name, model_name, year)
+            """, (list(manufacturers), list(models), list(years)))
+            lookups.model_ids = {
+                (row['manufacturer_name'], row['model_name'], row['year']): row['id']
+                for row in self.cursor.fetchall()
+            }
+        
+        return lookups
+    
+    def _active_manufacturers(self) -> MatchCandidates:
+        """Manufacturers that are not defunct, the candidates for manufacturer matches."""
+        if self.prefetched is not None and self.prefetched.active_manufacturers is not None:
+            return self.prefetched.active_manufacturers
+        
+        query = """
+            SELECT id, name, country, founded_year, status
+            FROM manufacturers 
+            WHERE status != 'defunct' OR status IS NULL
+        """
+        self.statements.execute(self.tuple_cursor, 'gdp_active_manufacturers', query)
+        manufacturers = self._match_candidates(self.tuple_cursor.fetchall())
+        if self.prefetched is not None:
+            self.prefetched.active_manufacturers = manufacturers
+        return manufacturers
+    
+    def _manufacturer_id(self, manufacturer_name: str) -> Optional[str]:
+        """ID of the manufacturer with the given name, compared case-insensitively."""
+        key = manufacturer_name.lower()
+        if self.prefetched is not None and key in self.prefetched.manufacturer_ids:
+            return self.prefetched.manufacturer_ids[key]
+        
+        self.statements.execute(
+            self.cursor, 'gdp_manufacturer_by_name',
+            "SELECT id FROM manufacturers WHERE LOWER(name) = LOWER(%s)",
+            (manufacturer_name,)
+        )
+        manufacturer = self.cursor.fetchone()
+        manufacturer_id = manufacturer['id'] if manufacturer else None
+        if self.prefetched is not None:
+            self.prefetched.manufacturer_ids[key] = manufacturer_id
+        return manufacturer_id
+    
+    def _manufacturer_models(self, manufacturer_id: str) -> MatchCandidates:
+        """Models of a manufacturer, the candidates for model matches."""
+        if self.prefetched is not None and manufacturer_id in self.prefetched.manufacturer_models:
+            return self.prefetched.manufacturer_models[manufacturer_id]
+        
+        query = """
+            SELECT m.id, m.name, m.year, m.production_type, 
+                   pl.name as product_line_name,
+                   mfr.name as manufacturer_name
+            FROM models m
+            JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
+            LEFT JOIN product_lines pl ON m.product_line_id = pl.id
+            WHERE m.manufacturer_id = %s
+        """
+        self.statements.execute(self.tuple_cursor, 'gdp_manufacturer_models', query, (manufacturer_id,))
+        models = self._match_candidates(self.tuple_cursor.fetchall())
+        if self.prefetched is not None:
+            self.prefetched.manufacturer_models[manufacturer_id] = models
+        return models
+        
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize_string(text: str) -> str:
         """Normalize strings for comparison - remove extra spaces, lowercase, etc."""
         if not text:
             return ""
@@ -196,142 +520,199 @@ class GuitarDataValidator:
     
     def calculate_similarity(self, str1: str, str2: str) -> float:
         """Calculate string similarity using sequence matcher."""
-        return SequenceMatcher(None, 
-                             self.normalize_string(str1), 
-                             self.normalize_string(str2)).ratio()
+        return normalized_similarity(self.normalize_string(str1), self.normalize_string(str2))
+    
+    def _match_candidates(self, rows: List[Tuple]) -> MatchCandidates:
+        """Pair candidate rows, which have the name as second column, with their normalized names."""
+        return MatchCandidates(rows, [self.normalize_string(row[1]) for row in rows])
+    
+    def similarity_bounds(self, name: str, candidates: MatchCandidates) -> np.ndarray:
+        """
+        Upper bounds of the similarity of each candidate name to a normalized name.
+        
+        rapidfuzz's indel ratio is based on the longest common subsequence,
+        which the matching blocks of ratio() are one of, so it is an upper
+        bound of ratio(). cdist scores all candidate names in a single call
+        in C; only candidates whose bound can reach the threshold are
+        compared with the pure-Python ratio().
+        """
+        scores = process.cdist([name], candidates.names, scorer=fuzz.ratio, dtype=np.float64)
+        return scores[0] / 100
     
-    def find_manufacturer_matches(self, manufacturer_data: Dict) -> List[Tuple[str, float, Dict]]:
+    def find_manufacturer_matches(self, manufacturer_data: Dict, limit: Optional[int] = None) -> List[Tuple[str, float, Dict]]:
         """Find potential manufacturer matches in database."""
         name = manufacturer_data.get('name', '')
         country = manufacturer_data.get('country')
         founded_year = manufacturer_data.get('founded_year')
         
         # Query existing manufacturers
-        query = """
-            SELECT id, name, country, founded_year, status
-            FROM manufacturers 
-            WHERE status != 'defunct' OR status IS NULL
-        """
-        self.cursor.execute(query)
-        existing_manufacturers = self.cursor.fetchall()
+        candidates = self._active_manufacturers()
         
+        name = self.normalize_string(name)
+        bounds = self.similarity_bounds(name, candidates)
         matches = []
-        for existing in existing_manufacturers:
-            # Name similarity
-            name_similarity = self.calculate_similarity(name, existing['name'])
+        # Only names that could reach the threshold with the largest bonus; the
+        # slack absorbs float rounding between the two ratios
+        for index in np.flatnonzero(bounds + 0.2 >= 0.7 - 1e-9):
+            existing = candidates.rows[index]
+            existing_id, existing_name, existing_country, existing_founded_year, _ = existing
             
             # Additional checks
-            country_match = (country == existing['country']) if country and existing['country'] else True
-            year_match = (founded_year == existing['founded_year']) if founded_year and existing['founded_year'] else True
+            country_match = (country == existing_country) if country and existing_country else True
+            year_match = (founded_year == existing_founded_year) if founded_year and existing_founded_year else True
             
-            # Calculate overall confidence
-            confidence = name_similarity
+            bonus = 0.0
             if country_match and country:
-                confidence += 0.1
+                bonus += 0.1
             if year_match and founded_year:
-                confidence += 0.1
+                bonus += 0.1
+            
+            # Name similarity, skipped for names too different to reach the threshold
+            if bounds[index] + bonus < 0.7 - 1e-9:
+                continue
+            name_similarity = normalized_similarity(name, candidates.names[index])
+            
+            # Calculate overall confidence
+            confidence = name_similarity + bonus
                 
             if confidence >= 0.7:  # Threshold for potential match
-                matches.append((existing['id'], confidence, dict(existing)))
+                matches.append((existing_id, confidence, dict(zip(MANUFACTURER_MATCH_COLUMNS, existing))))
         
-        return sorted(matches, key=lambda x: x[1], reverse=True)
+        return best_matches(matches, limit)
     
-    def find_model_matches(self, model_data: Dict, manufacturer_id: str) -> List[Tuple[str, float, Dict]]:
+    def find_model_matches(self, model_data: Dict, manufacturer_id: str,
+                           limit: Optional[int] = None) -> List[Tuple[str, float, Dict]]:
         """Find potential model matches for a given manufacturer."""
         name = model_data.get('name', '')
         year = model_data.get('year')
         
-        query = """
-            SELECT m.id, m.name, m.year, m.production_type, 
-                   pl.name as product_line_name,
-                   mfr.name as manufacturer_name
-            FROM models m
-            JOIN manufacturers mfr ON m.manufacturer_id = mfr.id
-            LEFT JOIN product_lines pl ON m.product_line_id = pl.id
-            WHERE m.manufacturer_id = %s
-        """
-        self.cursor.execute(query, (manufacturer_id,))
-        existing_models = self.cursor.fetchall()
+        candidates = self._manufacturer_models(manufacturer_id)
         
+        name = self.normalize_string(name)
+        bounds = self.similarity_bounds(name, candidates)
         matches = []
-        for existing in existing_models:
+        # Only names that could reach the threshold with the year bonus
+        for index in np.flatnonzero(bounds + 0.3 >= 0.8 - 1e-9):
+            existing = candidates.rows[index]
+            existing_id, existing_name, existing_year = existing[:3]
+            
             # For guitar models, year is critical - skip if years don't match
             # This prevents "Firebird III 1976" from matching "Firebird I 1963"
-            if year and existing['year'] and year != existing['year']:
+            if year and existing_year and year != existing_year:
                 continue
             
-            # Name similarity
-            name_similarity = self.calculate_similarity(name, existing['name'])
-            
             # Year match
-            year_match = (year == existing['year']) if year else False
+            year_match = (year == existing_year) if year else False
+            bonus = 0.3 if year_match else 0.0  # Year is very important for models
+            
+            # Name similarity, skipped for names too different to reach the threshold
+            if bounds[index] + bonus < 0.8 - 1e-9:
+                continue
+            name_similarity = normalized_similarity(name, candidates.names[index])
             
             # Calculate confidence
-            confidence = name_similarity
-            if year_match:
-                confidence += 0.3  # Year is very important for models
+            confidence = name_similarity + bonus
                 
             if confidence >= 0.8:  # Higher threshold for models
-                matches.append((existing['id'], confidence, dict(existing)))
+                matches.append((existing_id, confidence, dict(zip(MODEL_MATCH_COLUMNS, existing))))
+        
+        return best_matches(matches, limit)
+    
+    def _guitar_candidate_filter(self, guitar_data: Dict, model_id: Optional[str]) -> Optional[Tuple[str, str, List]]:
+        """
+        Filter of the guitars a submission can match other than by serial number.
+        
+        Returns:
+            Statement name, WHERE clause and its parameters, or None when no
+            guitar can reach the match threshold
+        """
+        # Different search strategies based on whether we have model_id or fallback data
+        if model_id:
+            # FK-based search: guitars of the same model only reach the match
+            # threshold through the same production date, so only those are fetched
+            production_date = guitar_data.get('production_date')
+            if not production_date:
+                return None
+            
+            return ('gdp_guitars_by_model_date',
+                    "model_id = %s AND to_char(production_date, 'YYYY-MM-DD') = %s",
+                    [model_id, production_date])
+        
+        # Fallback-based search: look for guitars with similar fallback text
+        manufacturer_fallback = guitar_data.get('manufacturer_name_fallback', '')
+        model_fallback = guitar_data.get('model_name_fallback', '')
+        year_estimate = guitar_data.get('year_estimate', '')
+        
+        if not manufacturer_fallback:
+            return None  # Can't match without at least manufacturer
+        
+        where = "manufacturer_name_fallback IS NOT NULL AND LOWER(manufacturer_name_fallback) = LOWER(%s)"
+        params = [manufacturer_fallback]
+        # Each combination of filters is prepared as its own statement
+        name = 'gdp_guitars_by_fallback'
+        
+        if model_fallback:
+            where += " AND LOWER(model_name_fallback) = LOWER(%s)"
+            params.append(model_fallback)
+            name += '_model'
         
-        return sorted(matches, key=lambda x: x[1], reverse=True)
+        if year_estimate:
+            where += " AND year_estimate = %s"
+            params.append(year_estimate)
+            name += '_year'
+        
+        return name, where, params
     
-    def find_individual_guitar_matches(self, guitar_data: Dict, model_id: Optional[str]) -> List[Tuple[str, float, Dict]]:
+    def find_individual_guitar_matches(self, guitar_data: Dict, model_id: Optional[str],
+                                       limit: Optional[int] = None) -> List[Tuple[str, float, Dict]]:
         """Find potential individual guitar matches using both FK and fallback approaches."""
         serial_number = guitar_data.get('serial_number', '')
+        candidate_filter = self._guitar_candidate_filter(guitar_data, model_id)
+        serial_query = f"""
+            SELECT {', '.join(GUITAR_SERIAL_MATCH_COLUMNS)}
+            FROM individual_guitars
+            WHERE serial_number = %s
+        """
         
         # Serial number is the primary unique identifier (works for both FK and fallback)
-        if serial_number:
-            query = """
-                SELECT id, serial_number, model_id, manufacturer_name_fallback, 
-                       model_name_fallback, year_estimate, significance_level
-                FROM individual_guitars
-                WHERE serial_number = %s
-            """
-            self.cursor.execute(query, (serial_number,))
+        if serial_number and candidate_filter is None:
+            self.statements.execute(self.cursor, 'gdp_guitar_by_serial', serial_query, (serial_number,))
             existing = self.cursor.fetchone()
-            
-            if existing:
-                return [(existing['id'], 1.0, dict(existing))]
+            return [(existing['id'], 1.0, dict(existing))] if existing else []
         
-        # Different search strategies based on whether we have model_id or fallback data
-        if model_id:
-            # FK-based search: look for guitars with the same model_id
-            query = """
-                SELECT id, serial_number, production_date, significance_level,
-                       manufacturer_name_fallback, model_name_fallback, year_estimate
+        if candidate_filter is None:
+            return []
+        
+        name, where, params = candidate_filter
+        if serial_number:
+            # The serial lookup and the candidate search share one round trip;
+            # candidates are only returned when the serial number is unknown
+            query = f"""
+                WITH by_serial AS ({serial_query})
+                SELECT true AS serial_match, id, serial_number, model_id, NULL::date AS production_date,
+                       significance_level, manufacturer_name_fallback, model_name_fallback, year_estimate
+                FROM by_serial
+                UNION ALL
+                SELECT false, id, serial_number, model_id, production_date,
+                       significance_level, manufacturer_name_fallback, model_name_fallback, year_estimate
                 FROM individual_guitars
-                WHERE model_id = %s
+                WHERE {where}
+                AND NOT EXISTS (SELECT 1 FROM by_serial)
             """
-            self.cursor.execute(query, (model_id,))
-            existing_guitars = self.cursor.fetchall()
+            self.statements.execute(self.cursor, name.replace('gdp_', 'gdp_guitar_by_serial_or_', 1),
+                                    query, (serial_number, *params))
+            rows = self.cursor.fetchall()
+            if rows and rows[0]['serial_match']:
+                existing = {column: rows[0][column] for column in GUITAR_SERIAL_MATCH_COLUMNS}
+                return [(existing['id'], 1.0, existing)]
+            existing_guitars = [{column: row[column] for column in GUITAR_MATCH_COLUMNS} for row in rows]
         else:
-            # Fallback-based search: look for guitars with similar fallback text
-            manufacturer_fallback = guitar_data.get('manufacturer_name_fallback', '')
-            model_fallback = guitar_data.get('model_name_fallback', '')
-            year_estimate = guitar_data.get('year_estimate', '')
-            
-            if not manufacturer_fallback:
-                return []  # Can't match without at least manufacturer
-            
-            query = """
-                SELECT id, serial_number, production_date, significance_level,
-                       manufacturer_name_fallback, model_name_fallback, year_estimate
+            query = f"""
+                SELECT {', '.join(GUITAR_MATCH_COLUMNS)}
                 FROM individual_guitars
-                WHERE manufacturer_name_fallback IS NOT NULL
-                AND LOWER(manufacturer_name_fallback) = LOWER(%s)
+                WHERE {where}
             """
-            params = [manufacturer_fallback]
-            
-            if model_fallback:
-                query += " AND LOWER(model_name_fallback) = LOWER(%s)"
-                params.append(model_fallback)
-            
-            if year_estimate:
-                query += " AND year_estimate = %s"
-                params.append(year_estimate)
-            
-            self.cursor.execute(query, params)
+            self.statements.execute(self.cursor, name, query, tuple(params))
             existing_guitars = self.cursor.fetchall()
         
         # Calculate similarity scores for potential matches
@@ -363,7 +744,7 @@ class GuitarDataValidator:
             if confidence >= 0.5:
                 matches.append((existing['id'], confidence, dict(existing)))
         
-        return sorted(matches, key=lambda x: x[1], reverse=True)
+        return best_matches(matches, limit)
     
     def validate_manufacturer(self, data: Dict) -> ValidationResult:
         """Validate and check uniqueness for manufacturer data."""
@@ -379,7 +760,7 @@ class GuitarDataValidator:
             print(f"❌ Validation failed: {e}")
             return ValidationResult(False, "invalid_schema", conflicts=[str(e)])
         # Find matches
-        matches = self.find_manufacturer_matches(data)
+        matches = self.find_manufacturer_matches(data, limit=1)
         
         if not matches:
             return ValidationResult(True, "insert", confidence=1.0)
@@ -411,28 +792,22 @@ class GuitarDataValidator:
         """Validate and check uniqueness for model data."""
         # Schema validation
         try:
-            jsonschema.validate(data, MODEL_SCHEMA)
-        except jsonschema.ValidationError as e:
+            validate_model_schema(data)
+        except fastjsonschema.JsonSchemaException as e:
             return ValidationResult(False, "invalid_schema", conflicts=[str(e)])
         
         # Resolve manufacturer
         manufacturer_name = data.get('manufacturer_name')
-        self.cursor.execute(
-            "SELECT id FROM manufacturers WHERE LOWER(name) = LOWER(%s)",
-            (manufacturer_name,)
-        )
-        manufacturer = self.cursor.fetchone()
+        manufacturer_id = self._manufacturer_id(manufacturer_name)
         
-        if not manufacturer:
+        if not manufacturer_id:
             return ValidationResult(
                 False, "missing_dependency",
                 conflicts=[f"Manufacturer '{manufacturer_name}' not found"]
             )
         
-        manufacturer_id = manufacturer['id']
-        
         # Find model matches
-        matches = self.find_model_matches(data, manufacturer_id)
+        matches = self.find_model_matches(data, manufacturer_id, limit=1)
         
         if not matches:
             return ValidationResult(True, "insert", confidence=1.0)
@@ -463,15 +838,15 @@ class GuitarDataValidator:
         """Validate and check uniqueness for individual guitar data."""
         # Schema validation
         try:
-            jsonschema.validate(data, INDIVIDUAL_GUITAR_SCHEMA)
-        except jsonschema.ValidationError as e:
+            validate_individual_guitar_schema(data)
+        except fastjsonschema.JsonSchemaException as e:
             return ValidationResult(False, "invalid_schema", conflicts=[str(e)])
         
         # Try to resolve model_id (hybrid approach)
         model_id = self._resolve_model_reference(data)
         
         # Find guitar matches (works with both FK and fallback data)
-        matches = self.find_individual_guitar_matches(data, model_id)
+        matches = self.find_individual_guitar_matches(data, model_id, limit=1)
         
         if not matches:
             return ValidationResult(True, "insert", confidence=1.0)
@@ -501,6 +876,10 @@ class GuitarDataValidator:
         model_name = model_ref.get('model_name')
         year = model_ref.get('year')
         
+        key = (manufacturer_name, model_name, year)
+        if self.prefetched is not None and key in self.prefetched.model_ids:
+            return self.prefetched.model_ids[key]
+        
         query = """
             SELECT m.id 
             FROM models m 
@@ -509,18 +888,43 @@ class GuitarDataValidator:
             AND LOWER(m.name) = LOWER(%s) 
             AND m.year = %s
         """
-        self.cursor.execute(query, (manufacturer_name, model_name, year))
+        self.statements.execute(self.cursor, 'gdp_model_by_reference', query,
+                                (manufacturer_name, model_name, year))
         model = self.cursor.fetchone()
+        model_id = model['id'] if model else None
+        if self.prefetched is not None:
+            self.prefetched.model_ids[key] = model_id
         
-        return model['id'] if model else None
+        return model_id
+
+@dataclass(frozen=True)
+class EntityStep:
+    """How one entity of a submission is validated and written, in processing order."""
+    key: str  # Submission key, also the ids_created key of an inserted entity
+    label: str  # Name used in actions and conflicts
+    validate: Callable[[Dict], ValidationResult]
+    insert: Callable[[Dict], str]
+    update: Callable[[str, Dict], None]
+    specifications_key: Optional[str] = None  # ids_created key of its specifications
 
 class GuitarDataProcessor:
     """Main class for processing guitar data submissions."""
     
     def __init__(self, db_connection):
-        self.validator = GuitarDataValidator(db_connection)
+        # Validator and processor share the connection's prepared statements
+        self.statements = PreparedStatements()
+        self.validator = GuitarDataValidator(db_connection, self.statements)
         self.db = db_connection
         self.cursor = db_connection.cursor(cursor_factory=RealDictCursor)
+        # Manufacturers first, then the models and guitars that reference them
+        self.entity_steps = (
+            EntityStep('manufacturer', 'Manufacturer', self.validator.validate_manufacturer,
+                       self._insert_manufacturer, self._update_manufacturer),
+            EntityStep('model', 'Model', self.validator.validate_model,
+                       self._insert_model, self._update_model, 'model_specifications'),
+            EntityStep('individual_guitar', 'Guitar', self.validator.validate_individual_guitar,
+                       self._insert_individual_guitar, self._update_individual_guitar, 'guitar_specifications'),
+        )
     
     def process_submission(self, submission_data) -> Dict:
         """
@@ -539,6 +943,12 @@ class GuitarDataProcessor:
             {"manufacturer": {...}, "model": {...}, ...},
             ...
         ]
+        
+        Batches of ASYNC_COMMIT_BATCH_SIZE or more submissions commit with
+        synchronous_commit off. The commit returns before its WAL is flushed
+        to disk. A server crash right after it can lose the batch, but it
+        cannot leave it half applied. The setting is LOCAL to the batch
+        transaction and does not affect other transactions or sessions.
         """
         # Handle both single dict and list of dicts
         if isinstance(submission_data, dict):
@@ -581,29 +991,28 @@ class GuitarDataProcessor:
             # Note: We don't use 'with self.db:' context manager because we need
             # conditional rollback based on failure rate, which conflicts with
             # the context manager's automatic commit-on-exit behavior.
+            if is_batch:
+                if len(submissions) >= ASYNC_COMMIT_BATCH_SIZE:
+                    self.cursor.execute("SET LOCAL synchronous_commit = off")
+                # One query per kind of lookup instead of several per submission
+                self.validator.prefetched = self.validator.prefetch(submissions)
+            
             for idx, single_submission in enumerate(submissions):
+                if is_batch:
+                    # Each submission of a batch runs in its own savepoint, so a
+                    # database error only undoes that submission
+                    self.cursor.execute("RELEASE SAVEPOINT submission; SAVEPOINT submission" if idx
+                                        else "SAVEPOINT submission")
                 try:
                     result = self._process_single_submission(single_submission, idx)
+                    if is_batch and self._undo_failed_submission():
+                        result["ids_created"] = {}
                     batch_results["results"].append(result)
                     batch_results["processed_count"] += 1
                     
                     # Update summary statistics
                     if result["success"]:
                         batch_results["summary"]["successful"] += 1
-                        # Aggregate action counts
-                        for action in result.get("actions_taken", []):
-                            if "Manufacturer insert" in action:
-                                batch_results["summary"]["actions_taken"]["manufacturers_inserted"] += 1
-                            elif "Manufacturer update" in action:
-                                batch_results["summary"]["actions_taken"]["manufacturers_updated"] += 1
-                            elif "Model insert" in action:
-                                batch_results["summary"]["actions_taken"]["models_inserted"] += 1
-                            elif "Model update" in action:
-                                batch_results["summary"]["actions_taken"]["models_updated"] += 1
-                            elif "Guitar insert" in action:
-                                batch_results["summary"]["actions_taken"]["guitars_inserted"] += 1
-                            elif "Guitar update" in action:
-                                batch_results["summary"]["actions_taken"]["guitars_updated"] += 1
                     else:
                         batch_results["summary"]["failed"] += 1
                         batch_results["success"] = False  # Mark entire batch as having failures
@@ -612,16 +1021,27 @@ class GuitarDataProcessor:
                         batch_results["summary"]["manual_review_needed"] += 1
                         
                 except Exception as e:
+                    if is_batch:
+                        self._undo_failed_submission()
                     error_result = {
                         "index": idx,
                         "success": False,
                         "error": f"Processing error: {str(e)}",
-                        "submission_preview": str(single_submission)[:100] + "..." if len(str(single_submission)) > 100 else str(single_submission)
+                        "submission_preview": SUBMISSION_PREVIEW.repr(single_submission)
                     }
                     batch_results["results"].append(error_result)
                     batch_results["summary"]["failed"] += 1
                     batch_results["success"] = False
             
+            # Aggregate action counts of the successful submissions in one pass
+            action_counts = Counter(
+                action
+                for result in batch_results["results"] if result["success"]
+                for action in result.get("actions_taken", [])
+            )
+            for action, counter in ACTION_COUNTERS.items():
+                batch_results["summary"]["actions_taken"][counter] = action_counts[action]
+            
             # Transaction decision logic: commit or rollback based on results
             if not batch_results["success"] and is_batch:
                 failed_count = batch_results["summary"]["failed"]
@@ -648,12 +1068,31 @@ class GuitarDataProcessor:
             batch_results["error"] = f"Batch processing error: {str(e)}"
             batch_results["rolled_back"] = True
         
+        finally:
+            self.validator.prefetched = None
+        
         # Return single result format for single submissions (backward compatibility)
         if not is_batch and len(batch_results["results"]) == 1:
             return batch_results["results"][0]
         
         return batch_results
     
+    def _undo_failed_submission(self) -> bool:
+        """
+        Roll back to the submission savepoint if the submission hit a database error.
+        
+        Returns:
+            True if the submission's writes were rolled back
+        """
+        if self.db.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_INERROR:
+            return False
+        
+        self.cursor.execute("ROLLBACK TO SAVEPOINT submission")
+        if self.validator.prefetched is not None:
+            # Lookups may have cached rows the rollback removed
+            self.validator.prefetched = BatchLookups()
+        return True
+    
     def _process_single_submission(self, submission_data: Dict, index: int = 0) -> Dict:
         """Process a single guitar data submission."""
         results = {
@@ -666,90 +1105,36 @@ class GuitarDataProcessor:
         }
         
         try:
-            # Process manufacturer first
-            if 'manufacturer' in submission_data:
-                mfr_result = self.validator.validate_manufacturer(submission_data['manufacturer'])
-                if not mfr_result.is_valid:
-                    results['conflicts'].extend(mfr_result.conflicts or [])
-                    return results
+            for step in self.entity_steps:
+                if step.key not in submission_data:
+                    continue
+                data = submission_data[step.key]
                 
-                if mfr_result.suggested_resolution == ConflictResolution.MANUAL_REVIEW:
-                    results['manual_review_needed'] = True
-                    results['conflicts'].append(f"Manufacturer conflict: {mfr_result.conflicts}")
+                validation = step.validate(data)
+                if not validation.is_valid:
+                    results['conflicts'].extend(validation.conflicts or [])
                     return results
                 
-                # Execute manufacturer action
-                if mfr_result.action == "insert":
-                    mfr_id = self._insert_manufacturer(submission_data['manufacturer'])
-                    results['ids_created']['manufacturer'] = mfr_id
-                elif mfr_result.action == "update":
-                    mfr_id = mfr_result.target_id
-                    if mfr_id is not None:
-                        self._update_manufacturer(mfr_id, submission_data['manufacturer'])
-                
-                results['actions_taken'].append(f"Manufacturer {mfr_result.action}")
-            
-            # Process model
-            if 'model' in submission_data:
-                model_result = self.validator.validate_model(submission_data['model'])
-                if not model_result.is_valid:
-                    results['conflicts'].extend(model_result.conflicts or [])
-                    return results
-                
-                if model_result.suggested_resolution == ConflictResolution.MANUAL_REVIEW:
+                if validation.suggested_resolution == ConflictResolution.MANUAL_REVIEW:
                     results['manual_review_needed'] = True
-                    results['conflicts'].append(f"Model conflict: {model_result.conflicts}")
+                    results['conflicts'].append(f"{step.label} conflict: {validation.conflicts}")
                     return results
                 
-                # Execute model action
-                if model_result.action == "insert":
-                    model_id = self._insert_model(submission_data['model'])
-                    results['ids_created']['model'] = model_id
+                # Execute the entity action
+                if validation.action == "insert":
+                    entity_id = step.insert(data)
+                    results['ids_created'][step.key] = entity_id
                     
-                    # Process model specifications if present
-                    if submission_data['model'].get('specifications'):
-                        spec_ids = self._insert_specifications(submission_data['model']['specifications'], 'model', model_id)
-                        results['ids_created']['model_specifications'] = spec_ids
-                    
-
-                        
-                elif model_result.action == "update":
-                    model_id = model_result.target_id
-                    if model_id is not None:
-                        self._update_model(model_id, submission_data['model'])
-                
-                results['actions_taken'].append(f"Model {model_result.action}")
-                
-            # Process individual guitar if present
-            if 'individual_guitar' in submission_data:
-                guitar_result = self.validator.validate_individual_guitar(submission_data['individual_guitar'])
-                if not guitar_result.is_valid:
-                    results['conflicts'].extend(guitar_result.conflicts or [])
-                    return results
-                
-                if guitar_result.suggested_resolution == ConflictResolution.MANUAL_REVIEW:
-                    results['manual_review_needed'] = True
-                    results['conflicts'].append(f"Guitar conflict: {guitar_result.conflicts}")
-                    return results
+                    # Process specifications if present
+                    if step.specifications_key and data.get('specifications'):
+                        results['ids_created'][step.specifications_key] = self._insert_specifications(
+                            data['specifications'], step.key, entity_id
+                        )
+                elif validation.action == "update":
+                    if validation.target_id is not None:
+                        step.update(validation.target_id, data)
                 
-                # Execute guitar action
-                if guitar_result.action == "insert":
-                    guitar_id = self._insert_individual_guitar(submission_data['individual_guitar'])
-                    results['ids_created']['individual_guitar'] = guitar_id
-                    
-                    # Process individual guitar specifications if present
-                    if submission_data['individual_guitar'].get('specifications'):
-                        spec_id = self._insert_specifications(submission_data['individual_guitar']['specifications'], 'individual_guitar', guitar_id)
-                        results['ids_created']['guitar_specifications'] = spec_id
-                    
-                elif guitar_result.action == "update":
-                    guitar_id = guitar_result.target_id
-                    if guitar_id is not None:
-                        self._update_individual_guitar(guitar_id, submission_data['individual_guitar'])
-                
-                results['actions_taken'].append(f"Guitar {guitar_result.action}")
-            
-
+                results['actions_taken'].append(f"{step.label} {validation.action}")
             
             results['success'] = True
             return results
@@ -761,47 +1146,42 @@ class GuitarDataProcessor:
     def _insert_model(self, data: Dict) -> str:
         """Insert new model and return ID."""
         # Resolve manufacturer_id from manufacturer_name
-        self.cursor.execute(
-            "SELECT id FROM manufacturers WHERE LOWER(name) = LOWER(%s)",
-            (data.get('manufacturer_name'),)
-        )
-        manufacturer = self.cursor.fetchone()
-        manufacturer_id = manufacturer['id']
-        
-        # Resolve or create product_line_id if specified
-        product_line_id = None
-        if data.get('product_line_name'):
-            self.cursor.execute(
-                "SELECT id FROM product_lines WHERE manufacturer_id = %s AND LOWER(name) = LOWER(%s)",
-                (manufacturer_id, data.get('product_line_name'))
-            )
-            product_line = self.cursor.fetchone()
-            if not product_line:
-                # Create new product line
-                self.cursor.execute(
-                    "INSERT INTO product_lines (manufacturer_id, name) VALUES (%s, %s) RETURNING id",
-                    (manufacturer_id, data.get('product_line_name'))
-                )
-                product_line_id = self.cursor.fetchone()['id']
-            else:
-                product_line_id = product_line['id']
+        manufacturer_id = self.validator._manufacturer_id(data.get('manufacturer_name'))
         
+        # The product line is looked up, or created when missing, by the model insert itself;
+        # a conflict only happens when a concurrent submission created it meanwhile
+        product_line_name = data.get('product_line_name')
         query = """
+            WITH existing_line AS (
+                SELECT id FROM product_lines
+                WHERE manufacturer_id = %s AND LOWER(name) = LOWER(%s)
+            ), created_line AS (
+                INSERT INTO product_lines (manufacturer_id, name)
+                SELECT %s::uuid, %s::text
+                WHERE %s::text <> '' AND NOT EXISTS (SELECT 1 FROM existing_line)
+                ON CONFLICT (manufacturer_id, LOWER(name)) DO UPDATE SET name = product_lines.name
+                RETURNING id
+            )
             INSERT INTO models (manufacturer_id, product_line_id, name, year, production_type, 
                               production_start_date, production_end_date, estimated_production_quantity,
                               msrp_original, currency, description, created_by)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, (SELECT id FROM existing_line UNION ALL SELECT id FROM created_line LIMIT 1),
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id
         """
         values = (
-            manufacturer_id, product_line_id, data.get('name'), data.get('year'),
+            manufacturer_id, product_line_name, manufacturer_id, product_line_name, product_line_name,
+            manufacturer_id, data.get('name'), data.get('year'),
             data.get('production_type', 'mass'), data.get('production_start_date'),
             data.get('production_end_date'), data.get('estimated_production_quantity'),
             data.get('msrp_original'), data.get('currency', 'USD'), data.get('description'),
             get_created_by_info()
         )
-        self.cursor.execute(query, values)
-        return self.cursor.fetchone()['id']
+        self.statements.execute(self.cursor, 'gdp_insert_model', query, values)
+        model_id = self.cursor.fetchone()['id']
+        if self.validator.prefetched is not None:
+            self.validator.prefetched.model_inserted(manufacturer_id)
+        return model_id
     
     def _insert_individual_guitar(self, data: Dict) -> str:
         """Insert new individual guitar and return ID."""
@@ -835,7 +1215,7 @@ class GuitarDataProcessor:
             data.get('provenance_notes'),
             get_created_by_info()
         )
-        self.cursor.execute(query, values)
+        self.statements.execute(self.cursor, 'gdp_insert_guitar', query, values)
         return self.cursor.fetchone()['id']
     
     def _insert_manufacturer(self, data: Dict) -> str:
@@ -850,28 +1230,20 @@ class GuitarDataProcessor:
             data.get('website'), data.get('status', 'active'), data.get('notes'), 
             get_created_by_info()
         )
-        self.cursor.execute(query, values)
-        return self.cursor.fetchone()['id']
+        self.statements.execute(self.cursor, 'gdp_insert_manufacturer', query, values)
+        manufacturer_id = self.cursor.fetchone()['id']
+        if self.validator.prefetched is not None:
+            self.validator.prefetched.manufacturer_written(data.get('name'), manufacturer_id)
+        return manufacturer_id
     
     def _update_manufacturer(self, manufacturer_id: str, data: Dict):
         """Update existing manufacturer with new data."""
         # Implement merge logic - update non-null fields
-        update_fields = []
-        values = []
-        
-        for field in ['display_name', 'country', 'founded_year', 'website', 'status', 'notes']:
-            if data.get(field) is not None:
-                update_fields.append(f"{field} = %s")
-                values.append(data[field])
+        values = tuple(data.get(field) for field in MANUFACTURER_UPDATE_FIELDS)
         
-        if update_fields:
-            values.append(manufacturer_id)
-            query = f"""
-                UPDATE manufacturers 
-                SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """
-            self.cursor.execute(query, values)
+        if self._merge_update('gdp_update_manufacturer', MANUFACTURER_UPDATE_QUERY, values, manufacturer_id):
+            if self.validator.prefetched is not None:
+                self.validator.prefetched.manufacturer_written()
     
     def _insert_specifications(self, data, target_type: str, target_id: str):
         """Insert specifications for either a model or individual guitar.
@@ -890,93 +1262,82 @@ class GuitarDataProcessor:
         
         # Handle both single specification object and array
         if isinstance(data, list):
-            # Multiple specifications (array format)
-            spec_ids = []
-            for spec_data in data:
-                spec_id = self._insert_single_specification(spec_data, model_id, individual_guitar_id)
-                spec_ids.append(spec_id)
-            return spec_ids
+            # Multiple specifications (array format), inserted in one round trip
+            if not data:
+                return []
+            values = [self._specification_values(spec_data, model_id, individual_guitar_id) for spec_data in data]
+            if len(values) >= SPECIFICATION_COPY_THRESHOLD:
+                return self._copy_specifications(values)
+            rows = execute_values(
+                self.cursor,
+                f"INSERT INTO specifications ({', '.join(SPECIFICATION_COLUMNS)}) VALUES %s RETURNING id",
+                values,
+                page_size=len(values),
+                fetch=True
+            )
+            return [row['id'] for row in rows]
         else:
             # Single specification object
             return self._insert_single_specification(data, model_id, individual_guitar_id)
     
+    def _copy_specifications(self, values: List[Tuple]) -> List[str]:
+        """
+        Insert many specification records through COPY and return their IDs.
+        
+        COPY cannot return the generated IDs, so they are generated up front
+        and copied with the rows, which keeps them in input order.
+        """
+        self.cursor.execute("SELECT uuid_generate_v7() AS id FROM generate_series(1, %s)", (len(values),))
+        ids = [row['id'] for row in self.cursor.fetchall()]
+        
+        # Unquoted empty fields are NULL to COPY, quoted ones empty strings
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_NOTNULL).writerows(
+            (spec_id, *row) for spec_id, row in zip(ids, values)
+        )
+        buffer.seek(0)
+        self.cursor.copy_expert(
+            f"COPY specifications (id, {', '.join(SPECIFICATION_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+        return ids
+    
     def _insert_single_specification(self, spec_data: Dict, model_id: str, individual_guitar_id: str) -> str:
         """Insert a single specification record."""
-        query = """
-            INSERT INTO specifications (model_id, individual_guitar_id, body_wood, neck_wood, fingerboard_wood,
-                                     scale_length_inches, num_frets, nut_width_inches, neck_profile, bridge_type,
-                                     pickup_configuration, electronics_description,
-                                     hardware_finish, body_finish, weight_lbs, case_included, case_type)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        query = f"""
+            INSERT INTO specifications ({', '.join(SPECIFICATION_COLUMNS)})
+            VALUES ({', '.join(['%s'] * len(SPECIFICATION_COLUMNS))})
             RETURNING id
         """
-        values = (
-            model_id, individual_guitar_id, spec_data.get('body_wood'), spec_data.get('neck_wood'),
-            spec_data.get('fingerboard_wood'), spec_data.get('scale_length_inches'), spec_data.get('num_frets'),
-            spec_data.get('nut_width_inches'), spec_data.get('neck_profile'), spec_data.get('bridge_type'),
-            spec_data.get('pickup_configuration'),
-            spec_data.get('electronics_description'), spec_data.get('hardware_finish'), spec_data.get('body_finish'),
-            spec_data.get('weight_lbs'), spec_data.get('case_included'), spec_data.get('case_type')
-        )
-        self.cursor.execute(query, values)
+        values = self._specification_values(spec_data, model_id, individual_guitar_id)
+        self.statements.execute(self.cursor, 'gdp_insert_specification', query, values)
         return self.cursor.fetchone()['id']
     
+    def _specification_values(self, spec_data: Dict, model_id: str, individual_guitar_id: str) -> Tuple:
+        """Build the SPECIFICATION_COLUMNS values of a specification record."""
+        return (model_id, individual_guitar_id, *map(spec_data.get, SPECIFICATION_FIELDS))
+    
 
     
     def _update_model(self, model_id: str, data: Dict):
         """Update existing model with new data."""
         # Similar merge logic for models
-        update_fields = []
-        values = []
-        
-        for field in ['production_start_date', 'production_end_date', 'estimated_production_quantity', 
-                     'msrp_original', 'currency', 'description']:
-            if data.get(field) is not None:
-                update_fields.append(f"{field} = %s")
-                values.append(data[field])
-        
-        if update_fields:
-            values.append(model_id)
-            query = f"""
-                UPDATE models 
-                SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """
-            self.cursor.execute(query, values)
+        values = tuple(data.get(field) for field in MODEL_UPDATE_FIELDS)
+        self._merge_update('gdp_update_model', MODEL_UPDATE_QUERY, values, model_id)
     
     def _update_individual_guitar(self, guitar_id: str, data: Dict):
         """Update existing individual guitar with new data."""
-        # Merge logic for individual guitars - include new fallback fields
-        update_fields = []
-        values = []
-        
-        # Handle model_id update if we can resolve it
-        model_id = self.validator._resolve_model_reference(data)
-        if model_id is not None:
-            update_fields.append("model_id = %s")
-            values.append(model_id)
-        
-        # Update fallback fields if provided
-        for field in ['manufacturer_name_fallback', 'model_name_fallback', 'year_estimate', 'description']:
-            if data.get(field) is not None:
-                update_fields.append(f"{field} = %s")
-                values.append(data[field])
-        
-        # Update other guitar fields
-        for field in ['nickname', 'production_date', 'production_number', 'significance_notes', 
-                     'current_estimated_value', 'condition_rating', 'modifications', 'provenance_notes']:
-            if data.get(field) is not None:
-                update_fields.append(f"{field} = %s")
-                values.append(data[field])
-        
-        if update_fields:
-            values.append(guitar_id)
-            query = f"""
-                UPDATE individual_guitars 
-                SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """
-            self.cursor.execute(query, values)
+        # Merge logic for individual guitars - include new fallback fields;
+        # model_id is updated when the model reference resolves
+        fields = dict(data, model_id=self.validator._resolve_model_reference(data))
+        values = tuple(fields.get(field) for field in GUITAR_UPDATE_FIELDS)
+        self._merge_update('gdp_update_guitar', GUITAR_UPDATE_QUERY, values, guitar_id)
+    
+    def _merge_update(self, name: str, query: str, values: Tuple, row_id: str) -> bool:
+        """Run a merge_update_query statement, returning whether the row changed."""
+        if all(value is None for value in values):
+            return False
+        self.statements.execute(self.cursor, name, query, values + (row_id,) + values)
+        return self.cursor.rowcount > 0
 
 
 # Example usage